@@ -1,5 +1,13 @@
+import os
+import time
+import numpy as np
+
+BENCHMARK_SIZE = int(os.environ.get("QUCODE_BENCHMARK_SIZE", 10**5))  # 10**6 for the full benchmarks
+
 class ComplexNumber:
     """Class to represent complex numbers and perform basic operations."""
+    __slots__ = ("real", "imag")  # No per-instance __dict__, cheaper to create millions of them
+
     def __init__(self, real, imag):
         self.real = real
         self.imag = imag
@@ -8,38 +16,206 @@ class ComplexNumber:
         return f"{self.real} + {self.imag}j" if self.imag >= 0 else f"{self.real} - {-self.imag}j"
 
     def add(self, other):
+        if isinstance(other, ComplexVector):
+            return other.add(self)  # Scalar + vector broadcasts over the vector
         return ComplexNumber(self.real + other.real, self.imag + other.imag)
 
     def multiply(self, other):
+        if isinstance(other, ComplexVector):
+            return other.multiply(self)
         real_part = self.real * other.real - self.imag * other.imag
         imag_part = self.real * other.imag + self.imag * other.real
         return ComplexNumber(real_part, imag_part)
 
-# Function to approximate square root using Newton's method
-def sqrt(number, precision=0.00001):
-    if number < 0:
+    def conj(self):
+        return ComplexNumber(self.real, -self.imag)
+
+    def abs2(self):
+        """Squared modulus |z|^2 (no square root needed)."""
+        return self.real * self.real + self.imag * self.imag
+
+class ComplexVector:
+    """Many complex numbers stored as two contiguous float64 buffers (real and imaginary parts)."""
+    __slots__ = ("real", "imag")
+
+    def __init__(self, real, imag):
+        self.real = np.ascontiguousarray(real, dtype=np.float64)
+        self.imag = np.ascontiguousarray(imag, dtype=np.float64)
+        if self.real.shape != self.imag.shape or self.real.ndim != 1:
+            raise ValueError("Real and imaginary parts must be 1D arrays of the same length")
+
+    @classmethod
+    def zeros(cls, size):
+        return cls(np.zeros(size), np.zeros(size))
+
+    @classmethod
+    def from_numbers(cls, numbers):
+        """Build a vector from an iterable of ComplexNumber objects."""
+        numbers = list(numbers)
+        return cls([z.real for z in numbers], [z.imag for z in numbers])
+
+    def __len__(self):
+        return len(self.real)
+
+    def __getitem__(self, index):
+        return ComplexNumber(float(self.real[index]), float(self.imag[index]))
+
+    def __setitem__(self, index, value):
+        self.real[index] = value.real
+        self.imag[index] = value.imag
+
+    def __str__(self):
+        return "[" + ", ".join(str(self[i]) for i in range(len(self))) + "]"
+
+    def add(self, other):
+        """Elementwise sum with another ComplexVector or a ComplexNumber."""
+        return ComplexVector(self.real + other.real, self.imag + other.imag)
+
+    def multiply(self, other):
+        """Elementwise product with another ComplexVector or a ComplexNumber."""
+        real_part = self.real * other.real - self.imag * other.imag
+        imag_part = self.real * other.imag + self.imag * other.real
+        return ComplexVector(real_part, imag_part)
+
+    def conj(self):
+        return ComplexVector(self.real.copy(), -self.imag)
+
+    def abs2(self):
+        """Squared moduli |z|^2 as a float64 array."""
+        return self.real * self.real + self.imag * self.imag
+
+    # In-place variants: reuse the existing buffers instead of allocating a new vector
+    def add_inplace(self, other):
+        self.real += other.real
+        self.imag += other.imag
+        return self
+
+    def multiply_inplace(self, other):
+        cross = self.real * other.imag  # Needs the old real part, so compute it first
+        self.real *= other.real
+        self.real -= self.imag * other.imag
+        self.imag *= other.real
+        self.imag += cross
+        return self
+
+    def conj_inplace(self):
+        np.negative(self.imag, out=self.imag)
+        return self
+
+# Square root via Newton's method on whole arrays with a fixed number of steps
+RSQRT_MAGIC = np.uint64(0x5FE6EB50C7B537A9)  # Bit-level first guess for 1/sqrt(x) on float64
+RSQRT_GUESS_ERROR = 0.0342  # Worst-case relative error of that first guess
+
+def newton_steps(precision):
+    """Number of Newton steps that brings the guess below the requested relative error."""
+    error, steps = RSQRT_GUESS_ERROR, 0
+    while error > precision and steps < 6:  # Doubles run out of digits after ~5 steps
+        error = 1.5 * error * error
+        steps += 1
+    return steps
+
+def _rsqrt_positive(x, steps):
+    """1/sqrt(x) for a float64 array of finite, positive values."""
+    tiny = x < 2.0**-1000  # Rescale subnormals so the bit trick starts from a good guess
+    x = x * np.where(tiny, 2.0**108, 1.0)
+    guess = (RSQRT_MAGIC - (x.view(np.uint64) >> np.uint64(1))).view(np.float64)
+    for _ in range(steps):
+        guess = guess * (1.5 - 0.5 * x * guess * guess)
+    return guess * np.where(tiny, 2.0**54, 1.0)
+
+def _real_sqrt(x, precision):
+    x = np.asarray(x, dtype=np.float64)
+    if np.any(x < 0):
         raise ValueError("Cannot calculate square root of a negative number")
-    
-    guess = number / 2.0  # Initial guess
-    while abs(guess * guess - number) > precision:
-        guess = (guess + number / guess) / 2.0
-    return guess
+    finite = np.isfinite(x) & (x > 0)
+    safe = np.where(finite, x, 1.0)
+    inverse = _rsqrt_positive(safe, newton_steps(precision))
+    root = safe * inverse
+    root = root + 0.5 * inverse * (safe - root * root)  # One Newton step on sqrt itself
+    return np.where(finite, root, x)  # sqrt(0) = 0, sqrt(inf) = inf, nan stays nan
+
+def _complex_sqrt(z, precision):
+    """Principal square root, computed without cancellation for either sign of Re(z)."""
+    a, b = z.real, z.imag
+    scale = np.maximum(np.abs(a), np.abs(b))
+    safe_scale = np.where(scale == 0, 1.0, scale)
+    modulus = scale * _real_sqrt((a / safe_scale) ** 2 + (b / safe_scale) ** 2, precision)
+    t = _real_sqrt((modulus + np.abs(a)) / 2, precision)
+    safe_t = np.where(t == 0, 1.0, t)
+    other = np.abs(b) / (2 * safe_t)
+    real_part = np.where(a >= 0, t, other)
+    imag_part = np.copysign(np.where(a >= 0, other, t), b)
+    return real_part + 1j * imag_part
+
+def sqrt(number, precision=1e-15):
+    """Square root of a scalar or array; `precision` bounds the relative error. Complex input gives the principal root."""
+    values = np.asarray(number)
+    if np.iscomplexobj(values):
+        result = _complex_sqrt(values.astype(np.complex128), precision)
+    else:
+        result = _real_sqrt(values, precision)
+    return result.item() if result.ndim == 0 else result
+
+def rsqrt(number, precision=1e-15):
+    """Reciprocal square root 1/sqrt(x) of a scalar or array of non-negative reals."""
+    values = np.asarray(number, dtype=np.float64)
+    if np.any(values < 0):
+        raise ValueError("Cannot calculate square root of a negative number")
+    finite = np.isfinite(values) & (values > 0)
+    result = _rsqrt_positive(np.where(finite, values, 1.0), newton_steps(precision))
+    result = np.where(values == 0, np.inf, np.where(finite, result, 1 / values))
+    return result.item() if result.ndim == 0 else result
 
 # Function to compute eigenvalues and eigenvectors for a 2x2 matrix
 def eigenvalues_eigenvectors(matrix):
-    a, b = matrix[0]
-    c, d = matrix[1]
-    trace = a + d
+    """Eigenvalues and unit eigenvectors (one per row) of a single 2x2 matrix, via the batched solver."""
+    eigenvalues, eigenvectors = eigenvalues_eigenvectors_batched([matrix])
+    return np.real_if_close(eigenvalues[0]).tolist(), np.real_if_close(eigenvectors[0].T).tolist()
+
+# Batched closed-form eigensolver for a stack of 2x2 (possibly complex) matrices
+def eigenvalues_eigenvectors_batched(matrices):
+    """Eigenvalues (N, 2) and unit eigenvectors (N, 2, 2, one per column) of an (N, 2, 2) array."""
+    matrices = np.asarray(matrices, dtype=np.complex128)
+    if matrices.ndim != 3 or matrices.shape[1:] != (2, 2):
+        raise ValueError("Expected an array of shape (N, 2, 2)")
+    # Work on each matrix divided by its largest entry so trace and det neither underflow nor overflow
+    scale = np.abs(matrices).reshape(len(matrices), -1).max(axis=1)
+    scale = np.where(scale > 0, scale, 1.0)
+    matrices = matrices / scale[:, None, None]
+    a, b = matrices[:, 0, 0], matrices[:, 0, 1]
+    c, d = matrices[:, 1, 0], matrices[:, 1, 1]
+
+    # lambda = half_trace ± sqrt(((a - d) / 2)^2 + b*c), which avoids the trace^2 - 4*det cancellation
+    half_trace = (a + d) / 2
+    root = sqrt(((a - d) / 2) ** 2 + b * c)  # Principal complex square root, vectorized Newton
     determinant = a * d - b * c
-    
-    # Using the manual sqrt function instead of math.sqrt
-    lambda1 = (trace + sqrt(trace**2 - 4 * determinant)) / 2
-    lambda2 = (trace - sqrt(trace**2 - 4 * determinant)) / 2
-    
-    eigenvalues = [lambda1, lambda2]
-    eigenvectors = [[lambda1 - d, b], [lambda2 - d, b]]
-    
-    return eigenvalues, eigenvectors
+
+    # Compute the larger-magnitude root directly and the other one from lambda1 * lambda2 = det
+    plus_is_large = (half_trace.real * root.real + half_trace.imag * root.imag) >= 0
+    large = np.where(plus_is_large, half_trace + root, half_trace - root)
+    safe_large = np.where(large == 0, 1, large)
+    small = np.where(large == 0, 0, determinant / safe_large)
+    eigenvalues = np.stack([np.where(plus_is_large, large, small),
+                            np.where(plus_is_large, small, large)], axis=1)
+
+    # Each eigenvector is (b, lambda - a) or (lambda - d, c); keep whichever is larger
+    eigenvectors = np.empty((len(matrices), 2, 2), dtype=np.complex128)
+    for k in range(2):
+        lam = eigenvalues[:, k]
+        first = np.stack([b, lam - a], axis=1)
+        second = np.stack([lam - d, c], axis=1)
+        first_norm = np.linalg.norm(first, axis=1)
+        second_norm = np.linalg.norm(second, axis=1)
+        vector = np.where((first_norm >= second_norm)[:, None], first, second)
+        norm = np.maximum(first_norm, second_norm)
+
+        # Both candidates vanish only for a multiple of the identity: every vector is an eigenvector
+        degenerate = norm <= 1e-14  # Entries are at most 1 after scaling
+        vector[degenerate] = np.eye(2)[k]
+        norm[degenerate] = 1
+        eigenvectors[:, :, k] = vector / norm[:, None]
+
+    return eigenvalues * scale[:, None], eigenvectors
 
 # Testing ComplexNumber Class
 c1 = ComplexNumber(3, 4)
@@ -50,6 +226,11 @@ print(f"Complex Number 2: {c2}")
 print(f"Sum: {c1.add(c2)}")
 print(f"Product: {c1.multiply(c2)}\n")
 
+# Newton square roots on a whole array at once (fixed step count, no data-dependent loop)
+print(f"sqrt(2) = {sqrt(2)}, sqrt(0) = {sqrt(0)}, rsqrt(4) = {rsqrt(4)}")
+print(f"sqrt of an array: {sqrt(np.array([0.25, 9.0, 1e-300, 1e300]))}")
+print(f"Principal sqrt of -4 + 0j and 3 + 4j: {sqrt(np.array([-4 + 0j, 3 + 4j]))}\n")
+
 # 2x2 matrix example
 matrix_2x2 = [[2, 3], [4, 1]]
 
@@ -60,3 +241,75 @@ print("Eigenvalues for 2x2 matrix:")
 print(eigenvalues)
 print("\nEigenvectors for 2x2 matrix:")
 print(eigenvectors)
+
+
+# ComplexVector: same operations applied to whole arrays of complex numbers at once
+v1 = ComplexVector.from_numbers([c1, c2, ComplexNumber(0, 1)])
+v2 = ComplexVector.from_numbers([c2, c1, ComplexNumber(0, 1)])
+
+print(f"\nVector 1: {v1}")
+print(f"Vector 2: {v2}")
+print(f"Elementwise Sum: {v1.add(v2)}")
+print(f"Elementwise Product: {v1.multiply(v2)}")
+print(f"Vector 1 scaled by Complex Number 1: {c1.multiply(v1)}")
+print(f"Conjugate of Vector 1: {v1.conj()}")
+print(f"|z|^2 of Vector 1: {v1.abs2()}")
+
+# Benchmark: elementwise products, one object per product vs. one vectorized call
+size = BENCHMARK_SIZE
+rng = np.random.default_rng(0)
+re_a, im_a, re_b, im_b = rng.standard_normal((4, size))
+numbers_a = [ComplexNumber(x, y) for x, y in zip(re_a.tolist(), im_a.tolist())]
+numbers_b = [ComplexNumber(x, y) for x, y in zip(re_b.tolist(), im_b.tolist())]
+vector_a = ComplexVector(re_a, im_a)
+vector_b = ComplexVector(re_b, im_b)
+
+start = time.perf_counter()
+products = [a.multiply(b) for a, b in zip(numbers_a, numbers_b)]
+object_time = time.perf_counter() - start
+
+start = time.perf_counter()
+vector_products = vector_a.multiply(vector_b)
+vector_time = time.perf_counter() - start
+
+start = time.perf_counter()
+vector_a.multiply_inplace(vector_b)
+inplace_time = time.perf_counter() - start
+
+print(f"\nBenchmark ({size} elementwise products):")
+print(f"ComplexNumber objects: {object_time:.4f} s")
+print(f"ComplexVector.multiply: {vector_time:.4f} s ({object_time / vector_time:.0f}x faster)")
+print(f"ComplexVector.multiply_inplace: {inplace_time:.4f} s")
+print("Results match:", products[-1].real == vector_products.real[-1] and products[-1].imag == vector_products.imag[-1])
+
+# Batched eigensolver: the same matrix plus complex and degenerate cases
+batch = np.array([
+    matrix_2x2,
+    [[0, -1j], [1j, 0]],  # Pauli-Y: complex Hermitian
+    [[0, -1], [1, 0]],  # Rotation: complex eigenvalues of a real matrix
+    [[2, 0], [0, 2]],  # Multiple of the identity: degenerate
+    [[1, 1], [0, 1]],  # Defective: only one eigenvector
+])
+batch_values, batch_vectors = eigenvalues_eigenvectors_batched(batch)
+print("\nBatched eigenvalues:")
+print(batch_values)
+residual = np.abs(batch @ batch_vectors - batch_vectors * batch_values[:, None, :]).max()
+print(f"Max residual |A v - lambda v|: {residual:.2e}")
+
+# Benchmark: closed form vs. np.linalg.eig on a stack of random complex matrices
+count = BENCHMARK_SIZE
+stack = rng.standard_normal((count, 2, 2)) + 1j * rng.standard_normal((count, 2, 2))
+
+start = time.perf_counter()
+closed_values, closed_vectors = eigenvalues_eigenvectors_batched(stack)
+closed_time = time.perf_counter() - start
+
+start = time.perf_counter()
+numpy_values, numpy_vectors = np.linalg.eig(stack)
+numpy_time = time.perf_counter() - start
+
+residual = np.abs(stack @ closed_vectors - closed_vectors * closed_values[:, None, :]).max()
+print(f"\nBenchmark ({count} complex 2x2 matrices):")
+print(f"Closed form: {closed_time:.3f} s ({count / closed_time:,.0f} matrices/s)")
+print(f"np.linalg.eig: {numpy_time:.3f} s ({count / numpy_time:,.0f} matrices/s)")
+print(f"Max residual |A v - lambda v|: {residual:.2e}")
@@ -1,5 +1,8 @@
 import numpy as np
 import scipy.stats as stats
+import time
+from qucode_stats import RunningStats, parallel_stats, sample_histogram, bayes_posterior, sequential_bayes
+from qucode_render import show_figures
 
 # Basic Probability: Probability of an event occurring
 # Example: Rolling a fair six-sided die and getting a "4"
@@ -12,16 +15,45 @@ mean, std_dev = 50, 10
 data = np.random.normal(mean, std_dev, 1000)  # Simulating 1000 values
 print(f"Sample mean: {np.mean(data):.2f}, Sample std dev: {np.std(data):.2f}")
 
+# Streaming statistics: the same estimates without keeping the samples in memory
+# A one-pass accumulator is filled chunk by chunk, and partial results from worker processes are merged.
+running = RunningStats(higher_moments=True, quantiles=True)
+for chunk in np.array_split(data, 10):
+    running.update(chunk)
+print(f"Streaming mean: {running.mean:.2f}, Streaming std dev: {running.std():.2f}")
+
+def normal_chunks(seed, num_chunks, chunk_size):
+    """Yields chunks of normal samples from a seeded generator (only one chunk exists at a time)."""
+    rng = np.random.default_rng(seed)
+    for _ in range(num_chunks):
+        yield rng.normal(mean, std_dev, chunk_size)
+
+big = parallel_stats(normal_chunks(42, 20, 500_000), higher_moments=True, quantiles=True)
+print(f"Streaming over {big.count} samples -> mean: {big.mean:.4f}, std dev: {big.std():.4f}, "
+      f"skewness: {big.skewness():.4f}, excess kurtosis: {big.kurtosis():.4f}")
+print(f"Median ≈ {big.quantile(0.5):.2f}, 95th percentile ≈ {big.quantile(0.95):.2f} "
+      f"(exact: {stats.norm.ppf(0.95, mean, std_dev):.2f})")
+
 # Plotting the probability density function (requires matplotlib)
 import matplotlib.pyplot as plt
 x = np.linspace(mean - 4*std_dev, mean + 4*std_dev, 100)
 pdf = stats.norm.pdf(x, mean, std_dev)
 
+# Streaming histogram: 10^7 samples generated chunk by chunk in worker processes, only bin counts are kept
+histogram = sample_histogram(mean - 4*std_dev, mean + 4*std_dev, 60, 10_000_000,
+                             params={"loc": mean, "scale": std_dev}, seed=42)
+model_cdf = lambda edges: stats.norm.cdf(edges, mean, std_dev)
+chi2_stat, dof, chi2_p = histogram.chi_square(model_cdf)
+ks_stat, ks_p = histogram.ks_statistic(model_cdf)
+print(f"Chi-square vs. normal PDF: {chi2_stat:.1f} (dof={dof}, p={chi2_p:.3f})")
+print(f"KS distance vs. normal CDF: {ks_stat:.5f} (p={ks_p:.3f})")
+
 plt.plot(x, pdf, label="Normal Distribution")
 plt.hist(data, bins=30, density=True, alpha=0.5, label="Sample Data Histogram")
+plt.stairs(histogram.density(), histogram.edges, label=f"Streaming Histogram ({histogram.total} samples)")
 plt.legend()
 plt.title("Normal Distribution Example")
-plt.show()
+show_figures()
 
 # Bayes' Theorem Example:
 # Suppose a test detects a rare disease with 99% accuracy, but the disease is only present in 1% of the population
@@ -35,3 +67,25 @@ P_Positive = (P_Positive_given_Disease * P_Disease) + (P_Positive_given_No_Disea
 P_Disease_given_Positive = (P_Positive_given_Disease * P_Disease) / P_Positive
 
 print(f"Probability of having the disease given a positive test result: {P_Disease_given_Positive:.3f}")
+
+# Batch Bayes: the same formula over whole grids of priors and test characteristics
+priors = np.array([0.001, 0.01, 0.1])[:, None]  # Axis 0: disease prevalence
+false_positive_rates = np.array([0.01, 0.05, 0.2])[None, :]  # Axis 1: false positive rate
+posterior_grid = bayes_posterior(priors, P_Positive_given_Disease, false_positive_rates)
+print("Posterior grid (rows: prior, columns: false positive rate):")
+print(np.round(posterior_grid, 3))
+
+# Repeated tests: update the log-odds once per result (positive, positive, negative, positive)
+test_results = [True, True, False, True]
+posterior_path = sequential_bayes(P_Disease, P_Positive_given_Disease, P_Positive_given_No_Disease,
+                                  test_results, trajectory=True)
+print(f"Posterior after each test {test_results}: {np.round(posterior_path, 4)}")
+
+# Benchmark: 1000 priors x 1000 sensitivities x 100 false positive rates (float32 output, 10^8 posteriors)
+grid_priors = np.linspace(1e-4, 0.5, 1000, dtype=np.float32)[:, None, None]
+grid_sensitivities = np.linspace(0.5, 0.999, 1000, dtype=np.float32)[None, :, None]
+grid_false_positives = np.linspace(1e-3, 0.3, 100, dtype=np.float32)[None, None, :]
+start = time.perf_counter()
+grid = bayes_posterior(grid_priors, grid_sensitivities, grid_false_positives)
+grid_time = time.perf_counter() - start
+print(f"Bayes grid {grid.shape}: {grid_time:.3f} s ({grid.size / grid_time:,.0f} posteriors/s)")
@@ -6,16 +6,17 @@ print("Probability of rolling a 4:", prob_rolling_4)
 data = [40, 45, 50, 55, 60]  # Example dataset
 size = len(data)
 
-# Calculate mean
-sum_values = 0
-for value in data:
-    sum_values += value
-mean = sum_values / size
-
-# Calculate standard deviation (manual implementation)
+# Calculate mean and standard deviation in a single pass (Welford's method)
+# Each value updates the running mean and the running sum of squared differences,
+# so the data could just as well be streamed instead of kept in a list.
+count = 0
+mean = 0
 sum_squared_differences = 0
 for value in data:
-    sum_squared_differences += (value - mean) ** 2
+    count += 1
+    delta = value - mean
+    mean += delta / count
+    sum_squared_differences += delta * (value - mean)
 
 std_dev = (sum_squared_differences / size) ** 0.5
 
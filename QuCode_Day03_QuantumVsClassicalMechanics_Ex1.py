@@ -1,5 +1,8 @@
 
 # Classical vs Quantum Mechanics Demonstration
+import random
+import numpy as np
+from qucode_stats import sample_bernoulli
 
 # Classical Mechanics: A classical object's state is definite.
 # Example: A coin flip lands in either HEADS or TAILS, but not both at once.
@@ -10,9 +13,17 @@ class ClassicalCoin:
     
     def flip(self):
         # Classical probability: Either Heads or Tails (Never both)
-        import random
         self.state = "Heads" if random.random() < 0.5 else "Tails"
     
+    def flip_many(self, n, seed=None, counts=False, processes=1):
+        """Flips the coin n times at once: uint8 array (0 = Heads, 1 = Tails) or {"Heads": .., "Tails": ..} counts."""
+        outcomes = sample_bernoulli(n, 0.5, seed=seed, counts=counts, processes=processes)
+        if counts:
+            return {"Heads": n - outcomes, "Tails": outcomes}
+        if n:
+            self.state = "Tails" if outcomes[-1] else "Heads"
+        return outcomes
+
     def observe(self):
         return f"Classical Coin is in definite state: {self.state}"
 
@@ -24,19 +35,45 @@ print(coin.observe())
 # Example: A quantum coin that is BOTH Heads & Tails (superposition state).
 
 class QuantumCoin:
-    def __init__(self):
+    def __init__(self, amplitudes=(2**-0.5, 2**-0.5)):
         self.state = ["Heads", "Tails"]  # Both states exist simultaneously
+        self.amplitudes = amplitudes  # α|Heads> + β|Tails>, probabilities are |α|² and |β|²
     
+    def tails_probability(self, weights=None):
+        alpha, beta = self.amplitudes if weights is None else weights
+        return abs(beta)**2 / (abs(alpha)**2 + abs(beta)**2)
+
     def observe(self):
         # Observation collapses superposition into a definite state
-        import random
-        measured_state = random.choice(self.state)
+        measured_state = random.choices(self.state, weights=[1 - self.tails_probability(), self.tails_probability()])[0]
         return f"Quantum Coin collapsed into definite state: {measured_state}"
 
+    def observe_many(self, n, weights=None, seed=None, counts=False, processes=1):
+        """Observes n identically prepared coins at once; `weights` optionally overrides the amplitudes (α, β)."""
+        tails = self.tails_probability(weights)
+        outcomes = sample_bernoulli(n, tails, seed=seed, counts=counts, processes=processes)
+        if counts:
+            return {"Heads": n - outcomes, "Tails": outcomes}
+        return outcomes
+
 qcoin = QuantumCoin()
 print("Before observation: Quantum Coin is in superposition (Heads & Tails)")
 print(qcoin.observe())  # Collapses to a classical state upon measurement
 
+# Many observations at once: one vectorized call instead of one Python call per outcome
+flips = coin.flip_many(10, seed=7)
+print("10 classical flips (0 = Heads, 1 = Tails):", flips)
+print("1,000,000 classical flips:", coin.flip_many(1_000_000, seed=7, counts=True))
+print("1,000,000 fair quantum observations:", qcoin.observe_many(1_000_000, seed=7, counts=True))
+
+# Biased quantum coin: |ψ> = √0.2 |Heads> + i√0.8 |Tails> gives Tails with probability |i√0.8|² = 0.8
+biased = qcoin.observe_many(1_000_000, weights=(0.2**0.5, 1j * 0.8**0.5), seed=7)
+print(f"Biased quantum coin, fraction of Tails: {biased.mean():.4f}")
+
+# Sharding across processes gives exactly the same outcomes for the same seed
+sharded = qcoin.observe_many(1_000_000, weights=(0.2**0.5, 1j * 0.8**0.5), seed=7, processes=2)
+print("Sharded run reproduces the single-process run:", np.array_equal(biased, sharded))
+
 # Wave-Particle Duality Demonstration
 # Example: Light behaves as both a wave (diffraction/interference) and particle (discrete photons)
 
@@ -1,34 +1,45 @@
 # Introduction to Classical Computing & Boolean Algebra
+import time
+import numpy as np
+from qucode_logic import invert, exhaustive_inputs, pack_lanes, unpack_lanes, popcount
+from qucode_logic import Netlist, ripple_carry_adder as ripple_netlist, carry_lookahead_adder
 
 # Bits: The fundamental unit of classical computing (0 or 1)
 class Bit:
-    def __init__(self, value):
+    def __init__(self, value, width=1):
         self.value = value  # 0 or 1
+        # Bit-sliced mode: with width > 1, value packs `width` independent bits ("lanes"),
+        # one per input vector, into an int or a NumPy uint64 array. Every gate then
+        # evaluates all lanes with a single word-wide bitwise operation.
+        self.width = width
 
     def __str__(self):
-        return str(self.value)
+        if self.width == 1:
+            return str(self.value)
+        lanes = "".join(str(b) for b in unpack_lanes(self.value, min(self.width, 64)))
+        return lanes if self.width <= 64 else f"{lanes}... ({self.width} lanes)"
 
 # Logic Gates: Fundamental Boolean operations
 class LogicGate:
     @staticmethod
     def NOT(bit):
         """ NOT gate: Inverts the bit (0 → 1, 1 → 0) """
-        return Bit(1 - bit.value)
+        return Bit(invert(bit.value, bit.width), bit.width)
 
     @staticmethod
     def AND(bit1, bit2):
         """ AND gate: Outputs 1 if both bits are 1, otherwise 0 """
-        return Bit(bit1.value & bit2.value)
+        return Bit(bit1.value & bit2.value, bit1.width)
 
     @staticmethod
     def OR(bit1, bit2):
         """ OR gate: Outputs 1 if at least one bit is 1 """
-        return Bit(bit1.value | bit2.value)
+        return Bit(bit1.value | bit2.value, bit1.width)
 
     @staticmethod
     def XOR(bit1, bit2):
         """ XOR gate: Outputs 1 if bits are different, 0 if they are the same """
-        return Bit(bit1.value ^ bit2.value)
+        return Bit(bit1.value ^ bit2.value, bit1.width)
 
 # Classical Circuits: Combining logic gates to build functions
 class ClassicalCircuit:
@@ -42,6 +53,12 @@ class ClassicalCircuit:
         carry_bit = LogicGate.AND(self.bit1, self.bit2)
         return sum_bit, carry_bit
 
+    def full_adder(self, carry_in):
+        """ Full-Adder Circuit: Two half-adders plus an OR for the carry """
+        partial_sum, carry1 = self.half_adder()
+        sum_bit, carry2 = ClassicalCircuit(partial_sum, carry_in).half_adder()
+        return sum_bit, LogicGate.OR(carry1, carry2)
+
 # Demonstrating bits
 bit_a = Bit(0)
 bit_b = Bit(1)
@@ -57,3 +74,80 @@ print(f"A XOR B: {LogicGate.XOR(bit_a, bit_b)}")
 circuit = ClassicalCircuit(bit_a, bit_b)
 sum_bit, carry_bit = circuit.half_adder()
 print(f"Half-Adder Output -> Sum: {sum_bit}, Carry: {carry_bit}")
+
+# Bit-sliced evaluation: the same gates applied to many input vectors at once
+# Lanes 0..3 hold the four input combinations (A, B) = (0,0), (1,0), (0,1), (1,1)
+lanes_a, lanes_b = [Bit(words, 4) for words in exhaustive_inputs(2)]
+sum_bits, carry_bits = ClassicalCircuit(lanes_a, lanes_b).half_adder()
+print(f"Half-Adder truth table (lanes) -> A: {lanes_a}, B: {lanes_b}, Sum: {sum_bits}, Carry: {carry_bits}")
+
+# Exhaustive truth table of a 24-input circuit: a 12-bit ripple-carry adder, 2^24 input vectors
+def ripple_carry_adder(a_bits, b_bits):
+    """Adds two little-endian lists of Bits, returning the sum bits and the final carry."""
+    sum_bits, carry = [], None
+    for a, b in zip(a_bits, b_bits):
+        if carry is None:
+            s, carry = ClassicalCircuit(a, b).half_adder()
+        else:
+            s, carry = ClassicalCircuit(a, b).full_adder(carry)
+        sum_bits.append(s)
+    return sum_bits, carry
+
+num_bits = 12
+start = time.perf_counter()
+inputs = [Bit(words, 1 << (2 * num_bits)) for words in exhaustive_inputs(2 * num_bits)]
+sum_bits, carry_out = ripple_carry_adder(inputs[:num_bits], inputs[num_bits:])
+elapsed = time.perf_counter() - start
+
+# A carry out happens exactly when a + b >= 2^12; there are 4096 * 4095 / 2 such pairs
+print(f"12-bit adder over all {carry_out.width} inputs: {elapsed:.3f} s, carry out in {popcount(carry_out.value)} cases "
+      f"(expected {4096 * 4095 // 2})")
+
+# Netlists: describe the circuit once as a gate DAG, then compile it to a flat instruction array
+def adder_netlist(num_bits, builder):
+    net = Netlist()
+    a_bits = [net.input(f"a{i}") for i in range(num_bits)]
+    b_bits = [net.input(f"b{i}") for i in range(num_bits)]
+    sum_bits, carry = builder(net, a_bits, b_bits)
+    for i, bit in enumerate(sum_bits):
+        net.output(f"s{i}", bit)
+    net.output("carry", carry)
+    return net
+
+# Common-subexpression elimination and dead-gate removal: a duplicated half-adder adds no gates,
+# and a gate that never reaches an output is not compiled
+net = Netlist()
+a, b = net.input("a"), net.input("b")
+net.output("sum", net.XOR(a, b))
+net.output("carry", net.AND(b, a))
+net.output("sum_again", net.XOR(b, a))  # Same gate as "sum"
+net.OR(a, b)  # Unused
+print(f"\nHalf-adder netlist: {len(net.nodes)} nodes built, {net.gate_count()} live gates, depth {net.depth()}")
+
+for name, builder in (("Ripple-carry", ripple_netlist), ("Carry-lookahead", carry_lookahead_adder)):
+    net = adder_netlist(64, builder)
+    print(f"64-bit {name} adder: {net.gate_count()} gates, critical path depth {net.depth()}, "
+          f"{net.compile().registers} registers")
+
+# Benchmark: 64-bit additions of 10^6 random operand pairs, bit-sliced through the compiled netlists
+pairs = 10**6
+rng = np.random.default_rng(0)
+operand_a = rng.integers(0, 2**64, pairs, dtype=np.uint64)
+operand_b = rng.integers(0, 2**64, pairs, dtype=np.uint64)
+packed = {}
+for i in range(64):
+    packed[f"a{i}"] = pack_lanes((operand_a >> np.uint64(i)) & np.uint64(1))
+    packed[f"b{i}"] = pack_lanes((operand_b >> np.uint64(i)) & np.uint64(1))
+expected = operand_a + operand_b  # Wraps modulo 2^64, like the 64 sum bits
+
+for name, builder in (("Ripple-carry", ripple_netlist), ("Carry-lookahead", carry_lookahead_adder)):
+    net = adder_netlist(64, builder)
+    net.compile()
+    start = time.perf_counter()
+    outputs = net.evaluate(packed, pairs)
+    elapsed = time.perf_counter() - start
+    total = np.zeros(pairs, dtype=np.uint64)
+    for i in range(64):
+        total |= unpack_lanes(outputs[f"s{i}"], pairs).astype(np.uint64) << np.uint64(i)
+    print(f"{name}: {pairs} additions in {elapsed:.3f} s ({pairs / elapsed:,.0f} additions/s), "
+          f"correct: {np.array_equal(total, expected)}")
@@ -1,4 +1,6 @@
+import time
 import numpy as np
+from qucode_linalg import KronOperator
 
 # Tensor Product: Used in quantum mechanics to combine quantum states
 # Example: Combining two quantum states |ψ1> and |ψ2>
@@ -29,3 +31,27 @@ H = (1 / np.sqrt(2)) * np.array([[1, 1], [1, -1]])
 unitary_check = np.dot(H.T.conj(), H)  # Should be identity matrix
 print("Hadamard Matrix:\n", H)
 print("Verification (H†H = I):\n", unitary_check)
+
+# Lazy Kronecker operators: H ⊗ H ⊗ H applied factor by factor instead of building the 8x8 matrix
+H3 = KronOperator(H, H, H)
+zero_state = np.zeros(8)
+zero_state[0] = 1  # |000>
+print("Lazy (H ⊗ H ⊗ H)|000>:", H3 @ zero_state)
+print("Matches np.kron:", np.allclose(H3.to_dense(), np.kron(np.kron(H, H), H)))
+print("Adjoint composition (H⊗H⊗H)†(H⊗H⊗H) is the identity:", np.allclose((H3.H @ H3).to_dense(), np.eye(8)))
+
+# 20 qubits: the dense operator would have 4^20 ≈ 10^12 entries; the lazy one only touches the 2^20-entry state
+num_qubits = 20
+H20 = KronOperator(*[H] * num_qubits)
+state = np.zeros(2**num_qubits)
+state[0] = 1
+start = time.perf_counter()
+uniform = H20 @ state
+print(f"H^⊗{num_qubits}|0...0> in {time.perf_counter() - start:.3f} s, every amplitude = {uniform[0]:.6f} "
+      f"(1/√2^{num_qubits} = {2**(-num_qubits / 2):.6f})")
+
+# Batches: apply X on qubit 0 (identity elsewhere) to 100 random 10-qubit states at once
+X = np.array([[0, 1], [1, 0]])
+X0 = KronOperator(X, *[2] * 9)  # Integers stand for identity factors, which cost nothing to apply
+batch = np.random.default_rng(0).standard_normal((100, 2**10))
+print("Batched X on qubit 0 matches dense:", np.allclose(X0.apply(batch), batch @ X0.to_dense().T))
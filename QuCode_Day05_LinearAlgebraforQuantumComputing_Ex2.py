@@ -1,14 +1,7 @@
 # Matrix Operations for Quantum Computing without external libraries
 
-# Helper function for matrix multiplication
-def matrix_multiply(A, B):
-    """Multiply two matrices A and B manually."""
-    result = [[0] * len(B[0]) for _ in range(len(A))]  # Create empty matrix
-    for i in range(len(A)):
-        for j in range(len(B[0])):
-            for k in range(len(A[0])):
-                result[i][j] += A[i][k] * B[k][j]
-    return result
+# Helper function for matrix multiplication (shared, cache-friendly version; uses NumPy if installed)
+from qucode_linalg import matrix_multiply
 
 # Tensor Product (Kronecker Product)
 def tensor_product(A, B):
@@ -1,4 +1,9 @@
 # Sparse Matrix Representation for Quantum Computing
+import os
+import tempfile
+import time
+import numpy as np
+from qucode_sparse import CSRMatrix, csr_kron, format_rows, save_npz, load_npz
 
 class SparseMatrix:
     """Represents a sparse matrix using a dictionary (only nonzero values stored)."""
@@ -16,34 +21,55 @@ class SparseMatrix:
         """Get value from the matrix, defaulting to 0 if not explicitly stored."""
         return self.data.get((row, col), 0)
 
+    def to_csr(self):
+        """Convert to compressed sparse row storage (fast products)."""
+        return CSRMatrix.from_dict((self.rows, self.cols), self.data)
+
+    @classmethod
+    def from_csr(cls, csr):
+        """Convert compressed sparse row storage back to the dictionary form."""
+        result = cls(*csr.shape)
+        result.data = csr.to_dict()
+        return result
+
     def multiply(self, other):
-        """Multiply two sparse matrices manually."""
+        """Multiply two sparse matrices (row-wise Gustavson product on CSR storage)."""
         if self.cols != other.rows:
             raise ValueError("Matrix dimensions incompatible for multiplication")
+        return SparseMatrix.from_csr(self.to_csr().matmul(other.to_csr()))
+
+    def matvec(self, vector):
+        """Multiply by a dense vector (list or array of length cols)."""
+        return self.to_csr().matvec(np.asarray(vector)).tolist()
+
+    def transpose(self):
+        result = SparseMatrix(self.cols, self.rows)
+        result.data = {(j, i): v for (i, j), v in self.data.items()}
+        return result
 
-        result = SparseMatrix(self.rows, other.cols)
-        for (i, k), v in self.data.items():
-            for j in range(other.cols):
-                if (k, j) in other.data:
-                    result.set(i, j, result.get(i, j) + v * other.data[(k, j)])
+    def conj_transpose(self):
+        """Conjugate transpose (†), needed for the unitarity check U†U = I."""
+        result = SparseMatrix(self.cols, self.rows)
+        result.data = {(j, i): v.conjugate() for (i, j), v in self.data.items()}
         return result
 
-    def display(self):
-        """Print matrix in dense form for easy visualization."""
-        for i in range(self.rows):
-            row = [self.get(i, j) for j in range(self.cols)]
-            print(row)
+    def display(self, max_rows=20):
+        """Print the matrix row by row from its stored entries (summarized when large)."""
+        for line in format_rows(self.to_csr(), max_rows=max_rows):
+            print(line)
+
+    def save(self, path):
+        """Export to a compact binary .npz file (CSR arrays)."""
+        save_npz(path, self.to_csr())
+
+    @classmethod
+    def load(cls, path):
+        return cls.from_csr(load_npz(path, mmap=False))
 
 # Tensor Product (Sparse Kronecker Product)
 def sparse_tensor_product(A, B):
-    """Compute tensor product manually using sparse representation."""
-    result = SparseMatrix(A.rows * B.rows, A.cols * B.cols)
-    
-    for (i, j), v in A.data.items():
-        for (m, n), w in B.data.items():
-            result.set(i * B.rows + m, j * B.cols + n, v * w)
-
-    return result
+    """Compute tensor product using sparse representation (built directly as CSR arrays)."""
+    return SparseMatrix.from_csr(csr_kron(A.to_csr(), B.to_csr()))
 
 # Example Quantum States (Sparse Representation)
 psi1 = SparseMatrix(2, 1)
@@ -84,11 +110,68 @@ print("Hadamard Matrix:")
 H.display()
 
 # Verify Unitarity
-H_T = SparseMatrix(2, 2)
-for i in range(2):
-    for j in range(2):
-        H_T.set(j, i, H.get(i, j))  # Transpose
+H_dagger = H.conj_transpose()
 
-unitary_check = H_T.multiply(H)
+unitary_check = H_dagger.multiply(H)
 print("Verification (H†H = I):")
 unitary_check.display()
+
+# Benchmark: 16-qubit (2^16 x 2^16) gate matrices stored as CSR
+def gate_on_qubit(gate, qubit, num_qubits):
+    """CSR matrix of a 2x2 gate acting on one qubit of a register (identity on the others)."""
+    rows = np.repeat(np.arange(2**num_qubits), 2)
+    bits = (rows >> qubit) & 1
+    targets = np.tile([0, 1], 2**num_qubits)
+    cols = rows - (bits << qubit) + (targets << qubit)
+    return CSRMatrix.from_triplets((2**num_qubits, 2**num_qubits), rows, cols, np.asarray(gate)[bits, targets])
+
+num_qubits = 16
+hadamard = np.array([[1, 1], [1, -1]]) / 2**0.5
+H3 = gate_on_qubit(hadamard, 3, num_qubits)
+H7 = gate_on_qubit(hadamard, 7, num_qubits)
+state = np.random.default_rng(0).standard_normal(2**num_qubits)
+
+start = time.perf_counter()
+H3H7 = H3 @ H7
+product_time = time.perf_counter() - start
+start = time.perf_counter()
+identity = H3.conj_transpose() @ H3
+check_time = time.perf_counter() - start
+start = time.perf_counter()
+result = H3H7 @ state
+matvec_time = time.perf_counter() - start
+
+print(f"\n{num_qubits}-qubit gates ({H3.shape[0]}x{H3.shape[1]}, nnz={H3.nnz}):")
+print(f"H_3 · H_7 (nnz={H3H7.nnz}): {product_time:.4f} s")
+print(f"H_3† · H_3 = I (nnz={identity.nnz}, cancelled entries pruned): {check_time:.4f} s")
+print(f"(H_3 H_7)|ψ> sparse-dense product: {matvec_time:.4f} s")
+
+# Chained Kronecker builds stay in CSR: a 16-qubit X ⊗ Rz(θ) ⊗ ... ⊗ Rz(θ) operator, rebuilt for a sweep of θ
+def rz(theta):
+    return CSRMatrix.from_dense(np.diag([np.exp(-0.5j * theta), np.exp(0.5j * theta)]))
+
+def chained_operator(theta, num_qubits=16):
+    operator = CSRMatrix.from_dense([[0, 1], [1, 0]])  # Pauli-X on the first qubit
+    for _ in range(num_qubits - 1):
+        operator = csr_kron(operator, rz(theta))
+    return operator
+
+start = time.perf_counter()
+first = chained_operator(0.1)  # Symbolic phase runs once per distinct pair of sparsity patterns
+first_time = time.perf_counter() - start
+start = time.perf_counter()
+sweep = [chained_operator(theta) for theta in np.linspace(0.2, 1.0, 9)]  # Patterns cached: only values are refilled
+sweep_time = (time.perf_counter() - start) / len(sweep)
+print(f"\n16-qubit chained Kronecker build (nnz={first.nnz}): first {first_time:.4f} s, "
+      f"each sweep rebuild {sweep_time:.4f} s")
+
+# Inspecting and persisting large operators without densifying them
+print("\nH_3 · H_7 on 16 qubits (summarized, only stored entries are visited):")
+for line in format_rows(H3H7, max_rows=6):
+    print(line)
+
+path = os.path.join(tempfile.mkdtemp(), "H3H7.npz")
+save_npz(path, H3H7)
+mapped = load_npz(path)  # Memory-mapped: pages are read only when touched
+print(f"Saved {os.path.getsize(path) / 2**20:.1f} MiB; memory-mapped reload gives the same product:",
+      np.allclose(mapped @ state, result))
@@ -1,24 +1,47 @@
 # Dirac Notation & Hilbert Spaces Demonstration
+import os
+import time
+import numpy as np
+from qucode_linalg import KronOperator
+from qucode_sparse import CSRMatrix, csr_kron
 
 # Bra-Ket notation: Quantum states are represented as "kets" |ψ> and "bras" <ψ|
 # Example: Basis states |0> and |1> (Computational Basis)
+# States are stored as contiguous complex128 buffers of shape (dim,), or (batch, dim) for many kets at once.
 
 class Ket:
-    """Represents a quantum state in Ket notation |ψ>."""
+    """Represents a quantum state in Ket notation |ψ> (or a batch of them, one per row)."""
     def __init__(self, vector):
-        self.vector = vector  # Column vector representation
+        self.vector = np.ascontiguousarray(vector, dtype=np.complex128)  # Column vector representation
 
     def __str__(self):
         return f"|ψ> = {self.vector}"
 
+    def __len__(self):
+        return self.vector.shape[-1]
+
+    def dagger(self):
+        """Returns the bra <ψ| as a lazy view: it shares this ket's buffer and conjugates only on demand."""
+        return Bra(self.vector, conjugated=True)
+
     def conjugate_transpose(self):
         """Returns the conjugate transpose (bra) <ψ|."""
-        return Bra([x for x in self.vector])  # Assuming real values (no complex conjugate needed)
+        return self.dagger()
 
 class Bra:
     """Represents a quantum state in Bra notation <ψ|."""
-    def __init__(self, vector):
-        self.vector = vector  # Row vector representation
+    def __init__(self, vector, conjugated=False):
+        self.source = np.ascontiguousarray(vector, dtype=np.complex128)
+        self.conjugated = conjugated  # True: the bra's entries are conj(source), not yet computed
+
+    @property
+    def vector(self):
+        """Row vector representation (materializes the conjugate of a lazy view)."""
+        return self.source.conj() if self.conjugated else self.source
+
+    def dagger(self):
+        """Returns the ket |ψ>; for a lazy bra this is the original buffer, no copy."""
+        return Ket(self.source if self.conjugated else self.source.conj())
 
     def __str__(self):
         return f"<ψ| = {self.vector}"
@@ -33,17 +56,19 @@ print(ket_1)
 
 # Inner Product: Measures overlap between quantum states <ψ|ϕ>
 def inner_product(bra, ket):
-    """Computes inner product <ψ|ϕ>."""
-    return sum(b * k for b, k in zip(bra.vector, ket.vector))
+    """Computes inner product <ψ|ϕ> (one value per row for batches)."""
+    if bra.conjugated and bra.source.ndim == ket.vector.ndim == 1:
+        return np.vdot(bra.source, ket.vector)  # vdot conjugates its first argument itself
+    return np.einsum("...i,...i->...", bra.vector, ket.vector)  # One vectorized call for whole batches
 
-bra_0 = ket_0.conjugate_transpose()
-bra_1 = ket_1.conjugate_transpose()
+bra_0 = ket_0.dagger()
+bra_1 = ket_1.dagger()
 print("Inner product <0|1>:", inner_product(bra_0, ket_1))  # Should be 0 (orthogonal states)
 
 # Outer Product: Forms a matrix representing quantum transformations |ψ><ϕ|
 def outer_product(ket, bra):
     """Computes outer product |ψ><ϕ| as a matrix."""
-    return [[k * b for b in bra.vector] for k in ket.vector]
+    return np.outer(ket.vector, bra.vector)
 
 print("Outer product |0><1|:")
 outer_matrix = outer_product(ket_0, bra_1)
@@ -55,11 +80,75 @@ for row in outer_matrix:
 X_operator = [[0, 1], [1, 0]]  # Swaps |0> and |1>
 
 def apply_operator(operator, ket):
-    """Applies an operator matrix to a quantum state."""
-    result_vector = [sum(operator[i][j] * ket.vector[j] for j in range(len(ket.vector))) for i in range(len(operator))]
-    return Ket(result_vector)
+    """Applies an operator to a quantum state, or to every state of a batch at once.
+
+    The operator may be a dense matrix (nested lists or ndarray), a CSRMatrix, or a
+    KronOperator; structured operators never get expanded to a dense matrix.
+    """
+    vectors = ket.vector
+    if isinstance(operator, KronOperator):
+        return Ket(operator.apply(vectors))
+    if isinstance(operator, CSRMatrix):
+        return Ket(operator.matvec(vectors) if vectors.ndim == 1 else operator.apply_to_rows(vectors))
+    operator = np.asarray(operator)
+    return Ket(vectors @ operator.T)  # Row-stacked kets: (A |ψ_k>)^T = <ψ_k^*| A^T
 
 # Applying Pauli-X to |0>, should yield |1>
 new_state = apply_operator(X_operator, ket_0)
 print("Applying Pauli-X to |0>:")
 print(new_state)
+
+# Batched application: one call moves |0> -> |1> and |1> -> |0>
+basis_batch = Ket([[1, 0], [0, 1]])
+print("Applying Pauli-X to the batch [|0>, |1>]:")
+print(apply_operator(X_operator, basis_batch))
+
+# Benchmark: a 16-qubit Pauli string on random kets (QUCODE_PAULI_KETS of them, 10^4 for the full run)
+# The dense 2^16 x 2^16 operator would need 64 GiB, so only the structured forms are compared.
+# 10^4 kets of 2^16 amplitudes are ~10 GB in total, so they are generated and processed in batches.
+PAULI_BENCHMARK_KETS = int(os.environ.get("QUCODE_PAULI_KETS", 200))
+PAULI = {"I": np.eye(2), "X": np.array([[0, 1], [1, 0]]), "Y": np.array([[0, -1j], [1j, 0]]),
+         "Z": np.array([[1, 0], [0, -1]])}
+
+def pauli_kron_operator(label, monomial=True):
+    return KronOperator(*[2 if p == "I" else PAULI[p] for p in label], monomial=monomial)
+
+def pauli_csr(label):
+    operator = CSRMatrix.from_dense(PAULI[label[0]])
+    for p in label[1:]:
+        operator = csr_kron(operator, CSRMatrix.from_dense(PAULI[p]))
+    return operator
+
+def random_kets(rng, count, num_qubits):
+    vectors = rng.standard_normal((count, 2 * 2**num_qubits)).view(np.complex128)  # Gaussian re/im pairs
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return Ket(vectors)
+
+def benchmark_pauli_string(label="XZIYIIZXIIIIYIZI", total=PAULI_BENCHMARK_KETS, batch=100, seed=6):
+    rng = np.random.default_rng(seed)
+    operators = {"KronOperator": pauli_kron_operator(label), "CSRMatrix": pauli_csr(label)}
+    times = dict.fromkeys(operators, 0.0)
+    expectation = np.empty(total)
+    for start in range(0, total, batch):
+        kets = random_kets(rng, min(batch, total - start), len(label))
+        results = {}
+        for name, operator in operators.items():
+            t0 = time.perf_counter()
+            results[name] = apply_operator(operator, kets)
+            times[name] += time.perf_counter() - t0
+        if start == 0:
+            assert np.allclose(results["KronOperator"].vector, results["CSRMatrix"].vector)
+            # Reference: the same KronOperator contracting factor by factor (no cached gather), one batch only
+            t0 = time.perf_counter()
+            apply_operator(pauli_kron_operator(label, monomial=False), kets)
+            per_factor = time.perf_counter() - t0
+        # <ψ|P|ψ> is real for a Hermitian Pauli string
+        expectation[start:start + len(kets.vector)] = inner_product(kets.dagger(), results["CSRMatrix"]).real
+    print(f"Pauli string {label} on {total} random {len(label)}-qubit kets (batches of {batch}):")
+    for name, seconds in times.items():
+        print(f"  {name:>12}: {seconds:7.3f} s  ({total / seconds:,.0f} kets/s)")
+    print(f"  KronOperator without the cached gather: {per_factor:.3f} s for the first {batch} kets "
+          f"({batch / per_factor:,.0f} kets/s)")
+    print(f"  mean <ψ|P|ψ> = {expectation.mean():+.2e} (random states: ~0)")
+
+benchmark_pauli_string()
@@ -1,18 +1,23 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+import os
+import time
+from qucode_evolution import eigen_propagator, KrylovPropagator
+from qucode_linalg import PauliSum
+from qucode_measure import MeasurementSampler, collapse, format_counts
+from qucode_render import show_figures
 
 # Schrödinger's Equation: Time evolution of quantum states
 # Example: Free particle in 1D (Wavefunction evolution)
 
 def schrodinger_evolution(psi, H, dt, steps):
-    """Solves the time-dependent Schrödinger equation numerically."""
-    evolved_states = []
-    for _ in range(steps):
-        # Time evolution using unitary transformation: psi' = exp(-iH dt) * psi
-        psi = np.dot(np.linalg.matrix_power(np.eye(len(H)) - 1j * H * dt, steps), psi)
-        evolved_states.append(psi)
-    return evolved_states
+    """Solves the time-dependent Schrödinger equation exactly: psi(k·dt) = exp(-iH k·dt) psi for k = 1..steps.
+
+    H is diagonalized once (and cached), so the whole trajectory comes out of one vectorized pass;
+    row k-1 of the returned (steps, n) array is the state after k steps.
+    """
+    return eigen_propagator(H).trajectory(psi, dt * np.arange(1, steps + 1))
 
 # Define Hamiltonian (Energy operator) for a simple quantum system
 H = np.array([[0, -1], [-1, 0]])  # Example: Two-state quantum system
@@ -24,21 +29,20 @@ steps = 50
 evolution = schrodinger_evolution(psi_initial, H, dt, steps)
 
 # Plot Evolution of Quantum State
-plt.plot([np.abs(state[0]) for state in evolution], label="Probability of |0>")
-plt.plot([np.abs(state[1]) for state in evolution], label="Probability of |1>")
+plt.plot(np.abs(evolution[:, 0])**2, label="Probability of |0>")
+plt.plot(np.abs(evolution[:, 1])**2, label="Probability of |1>")
 plt.xlabel("Time Steps")
 plt.ylabel("Probability")
 plt.title("Quantum State Evolution (Schrödinger Equation)")
 plt.legend()
-plt.show()
+show_figures()
 
 # Measurement in Quantum Mechanics: Observing collapses quantum states
 def measure(psi):
     """Simulates quantum measurement by collapsing the wavefunction."""
-    probabilities = np.abs(psi)**2  # Probability of each state
-    collapsed_state = np.random.choice(len(psi), p=probabilities)
-    measured_psi = np.zeros_like(psi)
-    measured_psi[collapsed_state] = 1  # Collapses to measured state
+    measured_psi = np.array(psi, dtype=complex)  # Collapsed in place below; psi itself is untouched
+    collapsed_state = int(MeasurementSampler(measured_psi).sample(1)[0])
+    collapse(measured_psi, collapsed_state)  # Collapses to measured state
     return measured_psi, collapsed_state
 
 measured_psi, outcome = measure(psi_initial)
@@ -59,3 +63,48 @@ postulates = [
 ]
 for postulate in postulates:
     print(postulate)
+
+# Large systems: a transverse-field Ising chain, H = -J sum Z_i Z_i+1 - h sum X_i
+# The 2^n x 2^n matrix is never built: H is a matrix-free Pauli sum and the evolution uses
+# Lanczos steps, streaming each requested state instead of storing the trajectory.
+# The chain has 12 qubits by default; QUCODE_CHAIN_QUBITS=20 runs the large (~30 s) version.
+CHAIN_QUBITS = int(os.environ.get("QUCODE_CHAIN_QUBITS", 12))
+def ising_chain(num_qubits, J=1.0, h=0.7):
+    bonds = [(-J, "I" * i + "ZZ" + "I" * (num_qubits - i - 2)) for i in range(num_qubits - 1)]
+    fields = [(-h, "I" * i + "X" + "I" * (num_qubits - i - 1)) for i in range(num_qubits)]
+    return PauliSum(bonds + fields)
+
+def magnetization(psi, qubit=0):
+    """<Z> of one qubit (qubit 0 is the most significant index)."""
+    probabilities = (np.abs(psi)**2).reshape(2**qubit, 2, -1).sum(axis=(0, 2))
+    return probabilities[0] - probabilities[1]
+
+# Cross-check against the exact eigh propagator where a dense H is still affordable
+small = ising_chain(10)
+psi_small = np.zeros(2**10, dtype=complex)
+psi_small[0] = 1
+krylov = KrylovPropagator(small, tol=1e-10)
+for t, state in krylov.stream(psi_small, [1.0, 5.0]):
+    error = np.linalg.norm(state - eigen_propagator(small.to_dense()).evolve(psi_small, t))
+    print(f"10 qubits, t={t}: |Krylov - exact| = {error:.1e} (estimate {krylov.error_estimate:.1e})")
+
+chain = ising_chain(CHAIN_QUBITS)
+psi_chain = np.zeros(2**CHAIN_QUBITS, dtype=complex)
+psi_chain[0] = 1  # All spins up
+krylov = KrylovPropagator(chain, krylov_dim=30, tol=1e-8)
+start = time.perf_counter()
+print(f"{CHAIN_QUBITS}-qubit Ising quench, <Z_0>(t):")
+for t, state in krylov.stream(psi_chain, [0.25, 0.5, 0.75, 1.0]):
+    print(f"  t={t:4.2f}  <Z_0>={magnetization(state):+.6f}  norm={np.linalg.norm(state):.12f}")
+print(f"  {krylov.matvecs} H·v products in {krylov.steps} steps ({krylov.rejected} rejected), "
+      f"error estimate {krylov.error_estimate:.1e}, {time.perf_counter() - start:.1f} s")
+
+# Many shots at once: 10^6 measurements of the final 2^n-amplitude state from one cumulative table
+start = time.perf_counter()
+sampler = MeasurementSampler(state)
+counts = sampler.counts(10**6, seed=7)  # Integer histogram over all 2^n outcomes
+print(f"10^6 shots on 2^{CHAIN_QUBITS} amplitudes in {time.perf_counter() - start:.2f} s; "
+      f"{np.count_nonzero(counts)} distinct outcomes, most frequent |{int(counts.argmax()):0{CHAIN_QUBITS}b}>")
+# Marginal of the chain's first spin (most significant index = qubit n-1), from the same probabilities
+first_spin = sampler.marginal([CHAIN_QUBITS - 1]).counts(10**6, seed=8)
+print(f"First spin: {format_counts(first_spin)}, <Z_0> from shots {(first_spin[0] - first_spin[1]) / 10**6:+.4f}")
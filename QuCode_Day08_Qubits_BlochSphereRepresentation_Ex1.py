@@ -1,17 +1,16 @@
 from qiskit import QuantumCircuit
-from qiskit.visualization import plot_bloch_vector
+from qiskit.quantum_info import Statevector
 import numpy as np
+import time
+from qucode_bloch import bloch_vectors, reduced_bloch_vectors
+from qucode_render import render_bloch_vector, render_circuit
 
 # Single Qubit State Representation
 # |ψ> = α|0> + β|1> (where α and β are complex numbers satisfying |α|² + |β|² = 1)
 
 def get_bloch_vector(state):
-    """Converts a quantum state into Bloch sphere coordinates (θ, φ)."""
-    alpha, beta = state
-    theta = 2 * np.arccos(abs(alpha))
-    phi = np.angle(beta) - np.angle(alpha)
-    
-    return [np.sin(theta) * np.cos(phi), np.sin(theta) * np.sin(phi), np.cos(theta)]
+    """Converts a quantum state into Bloch sphere coordinates (x, y, z)."""
+    return bloch_vectors(state).tolist()
 
 # Example Quantum State: Superposition (|ψ> = 1/√2 |0> + 1/√2 |1>)
 alpha = 1 / np.sqrt(2)
@@ -21,9 +20,47 @@ bloch_vector = get_bloch_vector([alpha, beta])
 print("Bloch Sphere Coordinates:", bloch_vector)
 
 # Visualizing on the Bloch Sphere
-plot_bloch_vector(bloch_vector, title="Quantum State on Bloch Sphere")
+render_bloch_vector(bloch_vector, title="Quantum State on Bloch Sphere")
 
 # Qiskit Quantum Circuit Representation
 qc = QuantumCircuit(1)
 qc.h(0)  # Apply Hadamard gate to create superposition (|+> state)
-qc.draw(output='mpl')  # Visualize circuit
+render_circuit(qc)  # Visualize circuit
+
+# Per-qubit Bloch vectors of a register: one pass over the statevector instead of one
+# plot_bloch_multivector call (and one partial trace) per qubit
+qc3 = QuantumCircuit(3)
+qc3.h(0)
+qc3.cx(0, 1)
+qc3.ry(np.pi / 3, 2)
+for qubit, vector in enumerate(reduced_bloch_vectors(Statevector(qc3).data)):
+    print(f"Qubit {qubit}: {np.round(vector, 6).tolist()}")  # Entangled qubits 0 and 1 sit at the centre
+
+# Benchmark: Bloch vectors of 10^6 random single-qubit states, and of every qubit of a 20-qubit state
+rng = np.random.default_rng(8)
+states = rng.standard_normal((10**6, 2)) + 1j * rng.standard_normal((10**6, 2))
+states /= np.linalg.norm(states, axis=1, keepdims=True)
+start = time.perf_counter()
+batched = bloch_vectors(states)
+batched_time = time.perf_counter() - start
+
+def get_bloch_vector_trig(state):
+    # The previous angle-based version, kept as the benchmark baseline
+    alpha, beta = state
+    theta = 2 * np.arccos(abs(alpha))
+    phi = np.angle(beta) - np.angle(alpha)
+    return [np.sin(theta) * np.cos(phi), np.sin(theta) * np.sin(phi), np.cos(theta)]
+
+sample = 10**4
+start = time.perf_counter()
+looped = [get_bloch_vector_trig(state) for state in states[:sample]]
+looped_time = (time.perf_counter() - start) * len(states) / sample
+assert np.allclose(looped, batched[:sample])
+print(f"10^6 states: batched {batched_time:.3f} s, per-state trig loop ~{looped_time:.1f} s (extrapolated)")
+
+register = rng.standard_normal(2**20) + 1j * rng.standard_normal(2**20)
+register /= np.linalg.norm(register)
+start = time.perf_counter()
+register_vectors = reduced_bloch_vectors(register)
+print(f"20-qubit register: all {len(register_vectors)} Bloch vectors in {time.perf_counter() - start:.3f} s, "
+      f"max length {np.linalg.norm(register_vectors, axis=1).max():.4f} (random states are nearly maximally mixed)")
@@ -1,5 +1,6 @@
-from qiskit import QuantumCircuit, Aer, transpile, assemble, execute
-from qiskit.visualization import plot_bloch_multivector
+from qiskit import QuantumCircuit
+from qucode_statevector import unitary
+from qucode_render import render_bloch_multivector
 import numpy as np
 
 # Quantum Circuit with common gates
@@ -23,22 +24,11 @@ qc.cx(0, 1)
 print("Quantum Circuit:")
 print(qc.draw())
 
-# Simulate the circuit's statevector
-simulator = Aer.get_backend('statevector_simulator')
-compiled_circuit = transpile(qc, simulator)
-qobj = assemble(compiled_circuit)
-result = simulator.run(qobj).result()
-statevector = result.get_statevector()
+# One pass over the circuit gives both its unitary and its statevector (the unitary's first column)
+unitary_matrix, statevector = unitary(qc)
 
 # Visualize quantum state on Bloch sphere
-plot_bloch_multivector(statevector)
-
-# Unitary Transformation: Extract the matrix representation of the circuit
-unitary_simulator = Aer.get_backend('unitary_simulator')
-compiled_circuit_unitary = transpile(qc, unitary_simulator)
-qobj_unitary = assemble(compiled_circuit_unitary)
-unitary_result = unitary_simulator.run(qobj_unitary).result()
-unitary_matrix = unitary_result.get_unitary()
+render_bloch_multivector(statevector)
 
 print("Unitary Matrix of the Quantum Circuit:")
 print(unitary_matrix)
@@ -1,5 +1,6 @@
-from qiskit import QuantumCircuit, Aer, transpile, assemble, execute
-from qiskit.visualization import plot_bloch_multivector
+from qiskit import QuantumCircuit
+from qucode_statevector import simulate
+from qucode_render import render_bloch_multivector
 
 # Quantum Superposition & Interference Demonstration
 
@@ -26,12 +27,11 @@ qc.measure_all()
 print("Quantum Circuit:")
 print(qc.draw())
 
-# Simulating the circuit using Qiskit's Aer simulator
-simulator = Aer.get_backend('statevector_simulator')
-compiled_circuit = transpile(qc, simulator)
-qobj = assemble(compiled_circuit)
-result = simulator.run(qobj).result()
+# Simulating the circuit with the NumPy statevector simulator: the measurements are terminal, so one
+# run gives the state just before measurement and the counts sampled from it
+result = simulate(qc, shots=1024)
 statevector = result.get_statevector()
+print("Measurement results:", result.get_counts())
 
 # Visualizing the quantum state on Bloch sphere
-plot_bloch_multivector(statevector)
+render_bloch_multivector(statevector)
@@ -1,6 +1,7 @@
 
-from qiskit import QuantumCircuit, Aer, transpile, assemble, execute
-from qiskit.visualization import plot_bloch_multivector
+from qiskit import QuantumCircuit
+from qucode_statevector import simulate
+from qucode_render import render_bloch_multivector
 
 # Quantum Entanglement Demonstration
 
@@ -17,24 +18,15 @@ qc.cx(0, 1)
 print("Quantum Circuit to create a Bell State:")
 print(qc.draw())
 
-# Simulating the entangled state using Qiskit's Aer simulator
-simulator = Aer.get_backend('statevector_simulator')
-compiled_circuit = transpile(qc, simulator)
-qobj = assemble(compiled_circuit)
-result = simulator.run(qobj).result()
-statevector = result.get_statevector()
-
-# Visualizing the quantum state on Bloch sphere
-plot_bloch_multivector(statevector)
-
 # Step 4: Measure the entangled qubits
 qc.measure_all()
 
-# Run the measurement simulation
-simulator_measurement = Aer.get_backend('qasm_simulator')
-compiled_circuit_measurement = transpile(qc, simulator_measurement)
-qobj_measurement = assemble(compiled_circuit_measurement)
-result_measurement = simulator_measurement.run(qobj_measurement).result()
-counts = result_measurement.get_counts()
+# One simulation gives both the entangled state before measurement and the measurement counts
+result = simulate(qc, shots=1024)
+statevector = result.get_statevector()
+counts = result.get_counts()
+
+# Visualizing the quantum state on Bloch sphere
+render_bloch_multivector(statevector)
 
 print("Measurement results of the entangled qubits:", counts)
@@ -1,5 +1,5 @@
-from qiskit import QuantumCircuit, Aer, transpile, assemble, execute
-from qiskit.visualization import plot_bloch_multivector
+from qiskit import QuantumCircuit
+from qucode_statevector import simulate
 
 # Quantum Measurement & No-Cloning Theorem Demonstration
 
@@ -16,22 +16,16 @@ qc.measure_all()
 print("Quantum Circuit Demonstrating Measurement Collapse:")
 print(qc.draw())
 
-# Simulate the circuit using Qiskit's Aer simulator
-simulator = Aer.get_backend('statevector_simulator')
-compiled_circuit = transpile(qc, simulator)
-qobj = assemble(compiled_circuit)
-result = simulator.run(qobj).result()
+# Simulate the circuit with the NumPy statevector simulator; the measurement is terminal, so the
+# same run keeps the state before measurement and samples the shots from it
+result = simulate(qc, shots=1024)
 statevector_before = result.get_statevector()
 
 print("\nQuantum State Before Measurement:")
 print(statevector_before)
 
 # Step 4: Run the measurement process (causes state collapse)
-simulator_measurement = Aer.get_backend('qasm_simulator')
-compiled_circuit_measurement = transpile(qc, simulator_measurement)
-qobj_measurement = assemble(compiled_circuit_measurement)
-result_measurement = simulator_measurement.run(qobj_measurement).result()
-counts = result_measurement.get_counts()
+counts = result.get_counts()
 
 print("\nMeasurement Results (Collapsed State):", counts)
 
@@ -45,10 +39,7 @@ print("\nQuantum Circuit Attempting Cloning (Fails due to No-Cloning Theorem):")
 print(qc_clone.draw())
 
 # Simulating incorrect cloning attempt
-compiled_circuit_clone = transpile(qc_clone, simulator)
-qobj_clone = assemble(compiled_circuit_clone)
-result_clone = simulator.run(qobj_clone).result()
-statevector_clone = result_clone.get_statevector()
+statevector_clone = simulate(qc_clone).get_statevector()
 
 print("\nStatevector After Incorrect Cloning Attempt:")
 print(statevector_clone)
@@ -1,6 +1,7 @@
 # Import Qiskit core packages
-from qiskit import QuantumCircuit, Aer, transpile, execute
-from qiskit.visualization import plot_histogram
+from qiskit import QuantumCircuit
+from qucode_statevector import simulate
+from qucode_render import render_circuit
 
 # 1️⃣ Quantum Circuit Model: Standard approach using gates
 def circuit_model_demo():
@@ -20,15 +21,13 @@ def circuit_model_demo():
     circuit.measure([0, 1], [0, 1])
 
     # Execute the circuit on a simulator
-    simulator = Aer.get_backend('qasm_simulator')
-    compiled_circuit = transpile(circuit, simulator)
-    result = execute(compiled_circuit, simulator).result()
+    result = simulate(circuit, shots=1024)
     
     print("Circuit Model Results:")
     print(result.get_counts())
     
     # Visualize results
-    circuit.draw('mpl')
+    render_circuit(circuit)
 
 # 2️⃣ Adiabatic Quantum Computing (QC) Simulation without Qiskit Algorithms
 def adiabatic_qc_demo():
@@ -70,15 +69,13 @@ def measurement_based_qc_demo():
     # Measure each qubit to drive the computation
     circuit.measure([0, 1, 2], [0, 1, 2])
 
-    simulator = Aer.get_backend('qasm_simulator')
-    compiled_circuit = transpile(circuit, simulator)
-    result = execute(compiled_circuit, simulator).result()
+    result = simulate(circuit, shots=1024)
     
     print("Measurement-Based QC Results:")
     print(result.get_counts())
     
     # Visualize results
-    circuit.draw('mpl')
+    render_circuit(circuit)
 
 # Run demonstrations
 circuit_model_demo()
@@ -1,7 +1,8 @@
 
 # Importing Qiskit components
-from qiskit import QuantumCircuit, Aer, transpile, execute
-from qiskit.visualization import plot_histogram
+from qiskit import QuantumCircuit
+from qucode_statevector import simulate
+from qucode_render import render_circuit, render_histogram
 
 # 1️⃣ Introduction to Qiskit
 print("Welcome to Quantum Programming with Qiskit!")
@@ -27,17 +28,15 @@ def first_quantum_circuit():
     circuit.measure(0, 0)  # Measure quantum state and store in classical bit
 
     # Step 4: Run the circuit on a simulator
-    simulator = Aer.get_backend('qasm_simulator')
-    compiled_circuit = transpile(circuit, simulator)
-    result = execute(compiled_circuit, simulator, shots=1024).result()
+    result = simulate(circuit, shots=1024)
 
     # Step 5: Show measurement results
     counts = result.get_counts()
     print("Measurement Results:", counts)
 
     # Step 6: Visualize results
-    circuit.draw('mpl')  # Draw the circuit
-    plot_histogram(counts)  # Histogram of results
+    render_circuit(circuit)  # Draw the circuit
+    render_histogram(counts)  # Histogram of results
 
 # Execute the function
 first_quantum_circuit()
@@ -1,6 +1,7 @@
 # Import necessary Qiskit modules
-from qiskit import QuantumCircuit, Aer, transpile, execute
-from qiskit.visualization import plot_histogram
+from qiskit import QuantumCircuit
+from qucode_statevector import simulate
+from qucode_render import render_circuit, render_histogram
 from qiskit.extensions import UnitaryGate
 import numpy as np
 
@@ -46,17 +47,15 @@ def quantum_phase_estimation():
     qc.measure(range(num_qubits), range(num_qubits))
 
     # Simulate execution
-    simulator = Aer.get_backend('qasm_simulator')
-    compiled_circuit = transpile(qc, simulator)
-    result = execute(compiled_circuit, simulator, shots=1024).result()
+    result = simulate(qc, shots=1024)
     
     # Display results
     print("Quantum Phase Estimation Results:")
     print(result.get_counts())
 
     # Draw circuit
-    qc.draw('mpl')
-    plot_histogram(result.get_counts())
+    render_circuit(qc)
+    render_histogram(result.get_counts())
 
 # 2️⃣ Function to implement Inverse Quantum Fourier Transform (QFT)
 def qft_inverse(num_qubits):
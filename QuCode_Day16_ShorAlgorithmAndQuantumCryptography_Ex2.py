@@ -1,5 +1,6 @@
 
-from qiskit import QuantumCircuit, Aer, transpile, execute
+from qiskit import QuantumCircuit
+from qucode_statevector import simulate
 import numpy as np
 from math import gcd
 
@@ -63,9 +64,7 @@ def shors_algorithm(N):
     qc.measure(range(num_qubits), range(num_qubits))
 
     # Simulate execution
-    simulator = Aer.get_backend('qasm_simulator')
-    compiled_circuit = transpile(qc, simulator)
-    result = execute(compiled_circuit, simulator, shots=1024).result()
+    result = simulate(qc, shots=1024)
 
     # Get measurement outcomes
     counts = result.get_counts()
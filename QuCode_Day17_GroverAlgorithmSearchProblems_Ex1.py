@@ -1,6 +1,10 @@
 # Import necessary Qiskit modules
-from qiskit import QuantumCircuit, Aer, transpile, execute
-from qiskit.visualization import plot_histogram
+from qiskit import QuantumCircuit
+from qucode_statevector import simulate
+from qucode_render import render_circuit, render_histogram
+import numpy as np
+from qucode_logic import Netlist, exhaustive_inputs, popcount
+from qucode_oracles import compile_phase_oracle
 
 # 1️⃣ Function to create an Oracle (marks the desired state)
 def grover_oracle(num_qubits, target_state):
@@ -70,17 +74,57 @@ def grovers_algorithm(num_qubits, target_state):
     qc.measure(range(num_qubits), range(num_qubits))
 
     # Step 5: Execute on a quantum simulator
-    simulator = Aer.get_backend('qasm_simulator')
-    compiled_circuit = transpile(qc, simulator)
-    result = execute(compiled_circuit, simulator, shots=1024).result()
+    result = simulate(qc, shots=1024)
 
     # Step 6: Display results
     print("Grover's Algorithm Search Results:")
     print(result.get_counts())
 
     # Visualize results
-    qc.draw('mpl')
-    plot_histogram(result.get_counts())
+    render_circuit(qc)
+    render_histogram(result.get_counts())
 
 # Execute Grover’s Algorithm for a 3-qubit system, searching for "101"
 grovers_algorithm(3, "101")
+
+
+# 4️⃣ Grover search over an arbitrary Boolean predicate (Day04 netlist -> reversible phase oracle)
+def grovers_predicate_search(net, shots=1024):
+    """
+    Searches for inputs that satisfy the predicate described by a single-output Netlist.
+    The oracle is compiled once (Toffoli/CNOT compute, phase, uncompute) and cached, so every
+    Grover iteration appends the same gate. Ancilla qubits return to |0> after each oracle call.
+    """
+    num_qubits = len(net.inputs)
+    oracle = compile_phase_oracle(net)
+    print(oracle)
+
+    # Count the solutions classically with a bit-sliced truth table to pick the iteration count
+    truth_table = net.evaluate(dict(zip(net.inputs, exhaustive_inputs(num_qubits))), 2**num_qubits)
+    num_solutions = popcount(next(iter(truth_table.values())))
+    if num_solutions == 0:
+        print("Predicate search: no input satisfies the predicate, nothing to search for")
+        return
+    # Each iteration rotates by 2θ with sin θ = sqrt(M / N); stop just before passing the solutions
+    # (0 iterations when every input is a solution)
+    theta = np.arcsin(np.sqrt(num_solutions / 2**num_qubits))
+    num_iterations = int(np.floor(np.pi / (4 * theta)))
+
+    qc = QuantumCircuit(oracle.num_qubits, num_qubits)
+    qc.h(range(num_qubits))
+    for _ in range(num_iterations):
+        qc.append(compile_phase_oracle(net).gate, range(oracle.num_qubits))  # Cache hit
+        qc.append(grover_diffusion(num_qubits), range(num_qubits))
+    qc.measure(range(num_qubits), range(num_qubits))
+
+    result = simulate(qc, shots=shots)
+
+    print(f"Predicate search ({num_solutions} solutions, {num_iterations} iterations):")
+    print(result.get_counts())
+    render_histogram(result.get_counts())
+
+# Example predicate on 4 inputs: (x0 XOR x1) AND (x2 OR NOT x3)
+predicate = Netlist()
+x = [predicate.input(f"x{i}") for i in range(4)]
+predicate.output("f", predicate.AND(predicate.XOR(x[0], x[1]), predicate.OR(x[2], predicate.NOT(x[3]))))
+grovers_predicate_search(predicate)
@@ -1,5 +1,6 @@
 # Import necessary Qiskit modules
-from qiskit import QuantumCircuit, Aer, execute
+from qiskit import QuantumCircuit
+from qucode_statevector import simulate
 from qiskit.circuit import Parameter
 import numpy as np
 from scipy.optimize import minimize
@@ -24,9 +25,7 @@ def expectation_value(theta):
     This is the key step in VQE to estimate the ground-state energy.
     """
     qc = variational_circuit(theta)
-    simulator = Aer.get_backend("statevector_simulator")
-    result = execute(qc, simulator).result()
-    statevector = result.get_statevector()
+    statevector = simulate(qc).get_statevector()
 
     # Compute expectation value ⟨ψ|H|ψ⟩
     exp_val = np.real(statevector.conj().T @ hamiltonian_matrix @ statevector)
@@ -1,6 +1,7 @@
 
 # Import necessary Qiskit modules
-from qiskit import QuantumCircuit, Aer, execute
+from qiskit import QuantumCircuit
+from qucode_statevector import simulate
 import random
 
 # 1️⃣ Define the Hamiltonian Matrix (Z Pauli Operator)
@@ -31,17 +32,14 @@ def gradient_descent(expectation_func, initial_theta, learning_rate=0.1, max_ite
     for _ in range(max_iter):
         # Compute expectation value
         qc = variational_circuit(theta)
-        simulator = Aer.get_backend("statevector_simulator")
-        result = execute(qc, simulator).result()
-        statevector = result.get_statevector()
+        statevector = simulate(qc).get_statevector()
 
         expectation = expectation_func(statevector)
 
         # Compute finite difference approximation of gradient
         delta = 0.01
         qc_plus = variational_circuit(theta + delta)
-        result_plus = execute(qc_plus, simulator).result()
-        statevector_plus = result_plus.get_statevector()
+        statevector_plus = simulate(qc_plus).get_statevector()
         expectation_plus = expectation_func(statevector_plus)
 
         gradient = (expectation_plus - expectation) / delta
@@ -1,7 +1,9 @@
 
 # Import necessary Qiskit modules
-from qiskit import QuantumCircuit, Aer, transpile, execute
+from qiskit import QuantumCircuit
+from qucode_statevector import simulate
 from qiskit.circuit import ParameterVector
+from qucode_render import render_circuit
 import random
 
 # 1️⃣ Quantum Data Encoding
@@ -21,7 +23,7 @@ def quantum_data_encoding(data):
 # Example classical data encoding
 sample_data = [random.uniform(0, 3.14) for _ in range(3)]  # Three classical features
 qc_data = quantum_data_encoding(sample_data)
-qc_data.draw('mpl')  # Visualize encoding circuit
+render_circuit(qc_data)  # Visualize encoding circuit
 
 # 2️⃣ Quantum Neural Network (QNN) Ansatz
 def quantum_neural_network(num_qubits, params):
@@ -45,18 +47,14 @@ def quantum_neural_network(num_qubits, params):
 num_qubits = 3
 parameters = ParameterVector("theta", num_qubits)  # Trainable parameters
 qc_qnn = quantum_neural_network(num_qubits, parameters)
-qc_qnn.draw('mpl')  # Visualize Quantum Neural Network Ansatz
+render_circuit(qc_qnn)  # Visualize Quantum Neural Network Ansatz
 
 # 3️⃣ Simulate Quantum Circuits
 def simulate_qc(qc):
     """
     Simulates the quantum circuit and returns measurement results.
     """
-    simulator = Aer.get_backend("qasm_simulator")
-    compiled_circuit = transpile(qc, simulator)
-    result = execute(compiled_circuit, simulator, shots=1024).result()
-
-    return result.get_counts()
+    return simulate(qc, shots=1024).get_counts()
 
 # Simulate encoded data circuit
 data_results = simulate_qc(qc_data)
@@ -2,7 +2,7 @@
 # Import necessary Qiskit modules
 from qiskit import QuantumCircuit, Aer, transpile, execute
 from qiskit.providers.aer.noise import NoiseModel, depolarizing_error
-from qiskit.visualization import plot_histogram
+from qucode_render import render_circuit, render_histogram
 
 # 1️⃣ Quantum Error Correction: 3-Qubit Bit Flip Code
 def quantum_error_correction():
@@ -50,8 +50,8 @@ def simulate_quantum_noise(qc):
     print(result.get_counts())
 
     # Visualize results
-    qc.draw('mpl')
-    plot_histogram(result.get_counts())
+    render_circuit(qc)
+    render_histogram(result.get_counts())
 
 # Execute Quantum Error Correction & Noise Simulation
 qc_error_correction = quantum_error_correction()
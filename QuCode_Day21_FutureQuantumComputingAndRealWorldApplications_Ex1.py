@@ -1,6 +1,7 @@
 
 # Import necessary Qiskit modules
-from qiskit import QuantumCircuit, Aer, transpile, execute
+from qiskit import QuantumCircuit
+from qucode_statevector import simulate
 from qiskit.circuit.library import RealAmplitudes
 
 # 1️⃣ Finance: Quantum Portfolio Optimization (Variational Ansatz)
@@ -15,8 +16,7 @@ def quantum_portfolio_optimization():
     qc = RealAmplitudes(num_qubits)
     
     # Simulate execution
-    simulator = Aer.get_backend("statevector_simulator")
-    result = execute(qc, simulator).result()
+    result = simulate(qc)
     
     print("Quantum Portfolio Optimization - Statevector:")
     print(result.get_statevector())
@@ -34,8 +34,7 @@ def quantum_chemistry_simulation():
     qc.cx(0, 1)
 
     # Simulate execution
-    simulator = Aer.get_backend("statevector_simulator")
-    result = execute(qc, simulator).result()
+    result = simulate(qc)
     
     print("Quantum Chemistry Simulation - Statevector:")
     print(result.get_statevector())
@@ -57,8 +56,7 @@ def quantum_ai_neural_network():
     for qubit in range(num_qubits - 1):
         qc.cx(qubit, qubit + 1)
 
-    simulator = Aer.get_backend("statevector_simulator")
-    result = execute(qc, simulator).result()
+    result = simulate(qc)
     
     print("Quantum Neural Network - Statevector:")
     print(result.get_statevector())
@@ -77,8 +75,7 @@ def quantum_optimization():
     # Apply Hadamard gates for superposition
     qc.h(range(num_qubits))
 
-    simulator = Aer.get_backend("statevector_simulator")
-    result = execute(qc, simulator).result()
+    result = simulate(qc)
     
     print("Quantum Optimization - Statevector:")
     print(result.get_statevector())
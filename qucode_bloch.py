@@ -0,0 +1,41 @@
+# Bloch-sphere coordinates without trigonometry (Day08), shared with the rendering layer
+# A single-qubit state alpha|0> + beta|1> sits at (2Re(ᾱβ), 2Im(ᾱβ), |α|² - |β|²); qubits of a
+# register get the same coordinates from their reduced (partial-trace) states.
+
+import numpy as np
+
+def bloch_vectors(states):
+    """Bloch coordinates of many single-qubit states at once: (..., 2) amplitudes -> (..., 3) vectors.
+
+    With alpha = <0|ψ> and beta = <1|ψ>: x = 2Re(ᾱβ), y = 2Im(ᾱβ), z = |α|² - |β|², so no angles
+    (and no trigonometry) are needed.
+    """
+    states = np.asarray(states, dtype=complex)
+    alpha, beta = states[..., 0], states[..., 1]
+    coherence = 2 * alpha.conj() * beta
+    return np.stack([coherence.real, coherence.imag, np.abs(alpha)**2 - np.abs(beta)**2], axis=-1)
+
+def reduced_bloch_vectors(psi):
+    """Bloch vector of every qubit of an n-qubit statevector (or a batch of them, shape (..., 2^n)).
+
+    Qubit q is bit q of the basis index (Qiskit's order); row q of the (..., n, 3) result is that
+    qubit's vector. The z components come from folding the probabilities one bit at a time, O(2^n)
+    in total. Each qubit's coherence pairs the amplitudes that differ in bit q, read through a
+    (high, 2, low) view without copying, so x and y cost O(n * 2^n) for the whole register.
+    """
+    psi = np.asarray(psi, dtype=complex)
+    batch_shape, dim = psi.shape[:-1], psi.shape[-1]
+    if dim < 1 or dim & (dim - 1):
+        raise ValueError(f"Statevector length must be a power of two, got {dim}")
+    num_qubits = dim.bit_length() - 1
+    vectors = np.empty(batch_shape + (num_qubits, 3))
+    probabilities = np.abs(psi)**2
+    for q in range(num_qubits):
+        pairs = psi.reshape(batch_shape + (-1, 2, 2**q))
+        coherence = 2 * np.einsum("...ij,...ij->...", pairs[..., 0, :].conj(), pairs[..., 1, :])
+        vectors[..., q, 0], vectors[..., q, 1] = coherence.real, coherence.imag
+        # Lowest remaining bit is qubit q: its z is the signed sum, then sum it out for the next qubit
+        halves = probabilities.reshape(batch_shape + (-1, 2))
+        vectors[..., q, 2] = halves[..., 0].sum(axis=-1) - halves[..., 1].sum(axis=-1)
+        probabilities = halves[..., 0] + halves[..., 1]
+    return vectors
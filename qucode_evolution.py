@@ -0,0 +1,159 @@
+# Time evolution under the Schrödinger equation (Day07): psi(t) = exp(-iHt) psi(0), with hbar = 1
+# EigenPropagator diagonalizes a small dense Hermitian H once and reuses the eigenbasis for any
+# set of times, so every evolved state is exact and exactly unitary.
+
+import numpy as np
+
+class EigenPropagator:
+    """exp(-iHt) for a dense Hermitian H through its cached eigendecomposition H = V diag(E) V^H.
+
+    Setup is one O(n^3) eigh; after that a trajectory over k times is one phase multiply
+    (O(k·n)) plus a single batched change of basis back to the computational basis.
+    """
+    def __init__(self, H, atol=1e-10):
+        H = np.asarray(H, dtype=complex)
+        if H.ndim != 2 or H.shape[0] != H.shape[1]:
+            raise ValueError(f"Hamiltonian must be a square matrix, got shape {H.shape}")
+        if not np.allclose(H, H.conj().T, atol=atol):
+            raise ValueError("Hamiltonian must be Hermitian")
+        self.energies, self.basis = np.linalg.eigh(H)
+
+    @property
+    def dim(self):
+        return len(self.energies)
+
+    def coefficients(self, psi):
+        """Amplitudes of psi (or of each column of a (dim, m) array) in the eigenbasis."""
+        return self.basis.conj().T @ np.asarray(psi, dtype=complex)
+
+    def evolve(self, psi, t):
+        """The single state psi(t)."""
+        return self.basis @ (np.exp(-1j * self.energies * t) * self.coefficients(psi))
+
+    def trajectory(self, psi, times):
+        """States psi(t_k) for every requested time, as a (len(times), dim) array (row k is psi(t_k))."""
+        phases = np.exp(-1j * np.outer(np.asarray(times, dtype=float), self.energies))
+        return (phases * self.coefficients(psi)) @ self.basis.T
+
+    def operator(self, t):
+        """The dense unitary exp(-iHt) itself."""
+        return (self.basis * np.exp(-1j * self.energies * t)) @ self.basis.conj().T
+
+_propagator_cache = {}  # (shape, dtype, bytes of H) -> EigenPropagator
+PROPAGATOR_CACHE_SIZE = 16
+
+def eigen_propagator(H):
+    """Cached EigenPropagator: evolving under the same Hamiltonian again skips the eigh."""
+    H = np.ascontiguousarray(H)
+    key = (H.shape, H.dtype.str, H.tobytes())
+    if key not in _propagator_cache:
+        if len(_propagator_cache) >= PROPAGATOR_CACHE_SIZE:
+            _propagator_cache.pop(next(iter(_propagator_cache)))  # Drop the oldest entry
+        _propagator_cache[key] = EigenPropagator(H)
+    return _propagator_cache[key]
+
+# Krylov (Lanczos) propagation for Hamiltonians too large for a dense matrix or an eigh
+# Only products H @ v are needed, so H can be a CSRMatrix, the Day05 SparseMatrix, a PauliSum,
+# a KronOperator, a dense array or any callable v -> H v.
+
+def linear_operator(H):
+    """Normalize the supported Hamiltonian types to a function v -> H v."""
+    if isinstance(H, np.ndarray):
+        return H.__matmul__
+    if hasattr(H, "to_csr"):  # Dict-of-keys SparseMatrix: convert once, then use CSR products
+        H = H.to_csr()
+    if hasattr(H, "apply"):  # KronOperator, ComposedOperator, PauliSum
+        return H.apply
+    if hasattr(H, "matvec"):  # CSRMatrix, CSCMatrix
+        return H.matvec
+    if callable(H):
+        return H
+    raise TypeError(f"Unsupported Hamiltonian type: {type(H).__name__}")
+
+class KrylovPropagator:
+    """exp(-iHt)|psi> for a large sparse or matrix-free Hermitian H via the Lanczos method.
+
+    Each step builds an m-dimensional Krylov basis of the current state with m products H @ v and
+    exponentiates the small tridiagonal projection of H exactly. The step length adapts so the
+    a-posteriori error estimate beta * h_{m+1,m} * |e_m^T exp(-i tau T_m) e_1| stays below `tol`;
+    a rejected step only shrinks tau against the same basis, costing no extra products.
+    `error_estimate` accumulates the local estimates (an estimate of the total error, since the
+    propagation is unitary), and `matvecs`, `steps`, `rejected` record the work done.
+    """
+    def __init__(self, H, krylov_dim=30, tol=1e-10, max_steps=100000):
+        self.apply = linear_operator(H)
+        self.krylov_dim = krylov_dim
+        self.tol = tol
+        self.max_steps = max_steps
+        self.matvecs = self.steps = self.rejected = 0
+        self.error_estimate = 0.0
+        self._tau = None  # Last accepted step length, the first guess for the next step
+
+    def _lanczos(self, psi):
+        """Orthonormal Krylov basis (rows), tridiagonal coefficients, and the residual norm h_{m+1,m}."""
+        m = min(self.krylov_dim, len(psi))
+        beta = np.linalg.norm(psi)
+        basis = np.empty((m, len(psi)), dtype=complex)
+        basis[0] = psi / beta
+        alpha, offdiagonal = [], []
+        residual = 0.0
+        for j in range(m):
+            w = np.asarray(self.apply(basis[j]), dtype=complex)
+            self.matvecs += 1
+            alpha.append(np.vdot(basis[j], w).real)
+            w -= alpha[j] * basis[j]
+            if j:
+                w -= offdiagonal[j - 1] * basis[j - 1]
+            # Re-orthogonalize against rounding drift; <b_k|w> = conj(b_k . conj(w)) avoids copying the basis
+            w -= (basis[:j + 1] @ w.conj()).conj() @ basis[:j + 1]
+            residual = np.linalg.norm(w)
+            if residual <= 1e-12 * beta or j == m - 1:
+                return beta, basis[:j + 1], np.array(alpha), np.array(offdiagonal), residual
+            offdiagonal.append(residual)
+            basis[j + 1] = w / residual
+
+    def _advance(self, psi, span):
+        """Move psi forward by exactly `span` time units with as many adaptive steps as needed."""
+        elapsed = 0.0
+        while elapsed < span:
+            if self.steps >= self.max_steps:
+                raise RuntimeError(f"KrylovPropagator exceeded {self.max_steps} steps")
+            beta, basis, alpha, offdiagonal, residual = self._lanczos(psi)
+            T = np.diag(alpha) + np.diag(offdiagonal, 1) + np.diag(offdiagonal, -1)
+            theta, Q = np.linalg.eigh(T)
+            remaining = span - elapsed
+            invariant = residual <= 1e-12 * beta  # Lucky breakdown: the subspace is exact for any tau
+            tau = remaining if invariant or self._tau is None else min(self._tau, remaining)
+            while True:
+                small = Q @ (np.exp(-1j * theta * tau) * Q[0])  # exp(-i tau T) e_1
+                error = 0.0 if invariant else beta * residual * abs(small[-1])
+                if error <= self.tol:
+                    break
+                self.rejected += 1
+                tau *= min(0.9, max(0.1, 0.9 * (self.tol / error) ** (1 / len(alpha))))
+            psi = beta * (small @ basis)
+            elapsed = span if tau == remaining else elapsed + tau
+            self.steps += 1
+            self.error_estimate += error
+            if not invariant:
+                growth = 2.0 if error == 0 else min(2.0, 0.9 * (self.tol / error) ** (1 / len(alpha)))
+                self._tau = tau * max(growth, 1.0)
+        return psi
+
+    def stream(self, psi, times):
+        """Yield (t, psi(t)) for increasing times t >= 0, holding only the current state in memory."""
+        psi, now = np.asarray(psi, dtype=complex), 0.0
+        for t in times:
+            if t < now:
+                raise ValueError("Times must be non-decreasing and start at t >= 0")
+            psi, now = self._advance(psi, t - now), t
+            yield t, psi
+
+    def evolve(self, psi, t):
+        """The single state psi(t)."""
+        for _, state in self.stream(psi, [t]):
+            return state
+
+def expm_multiply(H, psi, t, **options):
+    """exp(-iHt) psi for a sparse or matrix-free Hermitian H (see KrylovPropagator for the options)."""
+    return KrylovPropagator(H, **options).evolve(psi, t)
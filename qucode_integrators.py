@@ -0,0 +1,123 @@
+# Fixed-step integrators for the Schrödinger equation d psi/dt = -iH psi (Day07), hbar = 1
+# For a time-independent H every scheme is one fixed matrix per step, so the step operator is built
+# once and each step is a single matrix-vector product. States are plain lists (flat or the
+# [[a], [b], ...] column form) in pure Python; NumPy is used automatically for larger systems.
+
+from operator import mul
+
+from qucode_linalg import HAVE_NUMPY, matrix_multiply, np
+
+NUMPY_MIN_DIM = 16  # From this dimension on, NumPy matrix-vector products beat the pure-Python loop
+METHODS = ("euler", "rk4", "crank-nicolson")
+
+def _identity(n):
+    return [[1 if i == j else 0 for j in range(n)] for i in range(n)]
+
+def _combine(A, B, a=1, b=1):
+    return [[a * x + b * y for x, y in zip(row_a, row_b)] for row_a, row_b in zip(A, B)]
+
+def _solve(A, B):
+    """X with A X = B by Gauss-Jordan elimination with partial pivoting (pure Python)."""
+    n = len(A)
+    rows = [list(row_a) + list(row_b) for row_a, row_b in zip(A, B)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(rows[r][col]))
+        if rows[pivot][col] == 0:
+            raise ValueError("Singular matrix")
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        scale = rows[col][col]
+        rows[col] = [x / scale for x in rows[col]]
+        for r in range(n):
+            if r != col and rows[r][col] != 0:
+                factor = rows[r][col]
+                rows[r] = [x - factor * y for x, y in zip(rows[r], rows[col])]
+    return [row[n:] for row in rows]
+
+def step_operator(H, dt, method="crank-nicolson", use_numpy=None):
+    """The matrix S with psi(t + dt) ≈ S psi(t) for the chosen scheme.
+
+    euler: I - iH dt (first order, the norm grows every step)
+    rk4: the classical Runge-Kutta step, which for a linear ODE is I + A + A^2/2 + A^3/6 + A^4/24, A = -iH dt
+    crank-nicolson: (I + iH dt/2)^-1 (I - iH dt/2), second order and exactly unitary for Hermitian H
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r}; choose one of {METHODS}")
+    n = len(H)
+    if use_numpy is None:
+        use_numpy = HAVE_NUMPY and n >= NUMPY_MIN_DIM
+    if use_numpy:
+        A = -1j * dt * np.asarray(H, dtype=complex)
+        identity = np.eye(n)
+        if method == "euler":
+            return identity + A
+        if method == "crank-nicolson":
+            return np.linalg.solve(identity - A / 2, identity + A / 2)
+        S, term = identity.astype(complex), identity
+        for k in range(1, 5):
+            term = term @ A / k
+            S = S + term
+        return S
+    A = [[-1j * dt * x for x in row] for row in H]
+    identity = _identity(n)
+    if method == "euler":
+        return _combine(identity, A)
+    if method == "crank-nicolson":
+        return _solve(_combine(identity, A, 1, -0.5), _combine(identity, A, 1, 0.5))
+    S, term = identity, identity
+    for k in range(1, 5):
+        term = [[x / k for x in row] for row in matrix_multiply(term, A, use_numpy=False)]
+        S = _combine(S, term)
+    return S
+
+class Integrator:
+    """Steps a state under a fixed H and dt with a precomputed step operator.
+
+    `run` is a generator, so long trajectories are never held in memory; it also tracks the
+    largest norm and energy drift seen at the yielded samples of the latest run (norm_drift, energy_drift).
+    """
+    def __init__(self, H, dt, method="crank-nicolson", use_numpy=None):
+        if use_numpy is None:
+            use_numpy = HAVE_NUMPY and len(H) >= NUMPY_MIN_DIM
+        self.use_numpy = use_numpy
+        self.dt = dt
+        self.method = method
+        self.H = np.asarray(H, dtype=complex) if use_numpy else H
+        self.S = step_operator(H, dt, method, use_numpy)
+        self.norm_drift = self.energy_drift = 0.0
+
+    def _apply(self, M, psi):
+        if self.use_numpy:
+            return M @ psi
+        return [sum(map(mul, row, psi)) for row in M]
+
+    def _norm2(self, psi):
+        return float(np.vdot(psi, psi).real) if self.use_numpy else sum(abs(x)**2 for x in psi)
+
+    def energy(self, psi):
+        """<psi|H|psi> / <psi|psi>."""
+        H_psi = self._apply(self.H, psi)
+        overlap = np.vdot(psi, H_psi) if self.use_numpy else sum(x.conjugate() * y for x, y in zip(psi, H_psi))
+        return overlap.real / self._norm2(psi)
+
+    def step(self, psi):
+        return self._apply(self.S, psi)
+
+    def run(self, psi, steps, stride=1):
+        """Yield (t, psi(t)) after every `stride` steps (and after the last step), in psi's own format."""
+        if stride < 1:  # Checked here, not in the generator, so the error is raised at the call
+            raise ValueError(f"stride must be at least 1, got {stride}")
+        return self._run(psi, steps, stride)
+
+    def _run(self, psi, steps, stride):
+        column = isinstance(psi[0], list)
+        flat = [row[0] for row in psi] if column else list(psi)
+        state = np.asarray(flat, dtype=complex) if self.use_numpy else [complex(x) for x in flat]
+        norm0, energy0 = self._norm2(state), self.energy(state)
+        self.norm_drift = self.energy_drift = 0.0  # Drift is measured per run, against this run's start
+        for k in range(1, steps + 1):
+            state = self._apply(self.S, state)
+            if k % stride == 0 or k == steps:
+                self.norm_drift = max(self.norm_drift, abs(self._norm2(state) / norm0 - 1))
+                self.energy_drift = max(self.energy_drift, abs(self.energy(state) - energy0))
+                values = state.tolist() if self.use_numpy else list(state)
+                yield k * self.dt, [[x] for x in values] if column else values
@@ -0,0 +1,273 @@
+# Shared linear-algebra helpers (Day05, Day07): list-of-lists matrix products, lazy Kronecker operators
+# and matrix-free Pauli sums. matrix_multiply works on plain nested lists, using NumPy for speed when
+# it is installed and pure Python otherwise; KronOperator and PauliSum need NumPy.
+
+from array import array
+from operator import mul
+
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:  # Pure-Python fallback keeps the scripts dependency free
+    np = None
+    HAVE_NUMPY = False
+
+NUMPY_MIN_WORK = 4096  # Below this many multiply-adds, converting to NumPy costs more than it saves
+BLOCK_COLUMNS = 64  # Columns of B^T kept hot while every row of A streams past them
+MONOMIAL_MAX_DIM = 2**20  # Largest KronOperator whose signed-permutation form is cached (<= 24 MB of index + phase)
+
+def _all_of(types, M):
+    return all(isinstance(x, types) for row in M for x in row)
+
+def _multiply_python(A, B):
+    # Dot products against the transposed B: each column is built once and reused for every row,
+    # and sum(map(mul, ...)) runs the inner k loop in C instead of Python bytecode.
+    # Float data is stored in flat array('d') buffers; integer (exact) and complex data stay in lists.
+    if _all_of((int, float), A) and _all_of((int, float), B) and not (_all_of(int, A) and _all_of(int, B)):
+        rows = [array('d', row) for row in A]
+        columns = [array('d', column) for column in zip(*B)]
+    else:
+        rows = A
+        columns = [list(column) for column in zip(*B)]
+    result = [[0] * len(columns) for _ in range(len(A))]
+    for start in range(0, len(columns), BLOCK_COLUMNS):
+        block = columns[start:start + BLOCK_COLUMNS]
+        stop = start + len(block)
+        for row, out in zip(rows, result):
+            out[start:stop] = [sum(map(mul, row, column)) for column in block]
+    return result
+
+def _fits_int64(A, B):
+    """True if every integer dot product of A and B is exactly representable in int64."""
+    largest_a = max((abs(x) for row in A for x in row), default=0)
+    largest_b = max((abs(x) for row in B for x in row), default=0)
+    return largest_a * largest_b * len(B) < 2**63
+
+def matrix_multiply(A, B, use_numpy=None):
+    """Multiply two matrices A and B given as lists of lists (real or complex entries).
+
+    Integer matrices stay exact: they only go through NumPy when no product can overflow int64.
+    """
+    if len(A[0]) != len(B):
+        raise ValueError("Matrix dimensions incompatible for multiplication")
+    if use_numpy is None:
+        use_numpy = HAVE_NUMPY and len(A) * len(B) * len(B[0]) >= NUMPY_MIN_WORK
+    if use_numpy and _all_of(int, A) and _all_of(int, B) and not _fits_int64(A, B):
+        use_numpy = False  # Python ints never overflow
+    if use_numpy:
+        return (np.asarray(A) @ np.asarray(B)).tolist()  # BLAS-backed for float/complex data
+    return _multiply_python(A, B)
+
+# Lazy Kronecker products: A ⊗ B ⊗ ... applied factor by factor, never built as one matrix
+class KronOperator:
+    """Operator A ⊗ B ⊗ ... kept as its factors (NumPy matrices, or an int n for an n x n identity).
+
+    Applying it reshapes the vector into one axis per factor and contracts each factor with its
+    axis, so n single-qubit factors cost O(n * 2^n) work and O(2^n) memory instead of O(4^n).
+    The first factor acts on the most significant index, exactly like np.kron.
+    When every factor has one nonzero per row (Pauli strings, phase gates...) and the operator has
+    at most MONOMIAL_MAX_DIM rows, apply() uses a cached gather instead, about 10x faster on a
+    16-qubit Pauli string; monomial=False turns that cache off.
+    """
+    def __init__(self, *factors, monomial=True):
+        if not HAVE_NUMPY:
+            raise ImportError("KronOperator requires NumPy")
+        self.factors = [factor if isinstance(factor, int) else np.asarray(factor) for factor in factors]
+        self.out_dims = [f if isinstance(f, int) else f.shape[0] for f in self.factors]
+        self.in_dims = [f if isinstance(f, int) else f.shape[1] for f in self.factors]
+        # Cached (source index, phase or None) when every factor is a signed permutation; False when not
+        self._monomial = None if monomial else False
+
+    def _monomial_form(self):
+        """For factors with one nonzero per row (Paulis, X, phase gates...), the whole operator is
+        out[i] = phase[i] * in[source[i]]; build those two arrays once (phase in the factors' dtype,
+        None for a plain permutation), or return False."""
+        if self._monomial is None:
+            self._monomial = False
+            if self.shape[0] == self.shape[1] and self.shape[0] <= MONOMIAL_MAX_DIM:
+                dtype = np.result_type(*[f for f in self.factors if not isinstance(f, int)], np.int8)
+                source, phase = np.zeros(1, dtype=np.int64), np.ones(1, dtype=dtype)
+                for factor in self.factors:
+                    if isinstance(factor, int):
+                        columns, values = np.arange(factor), np.ones(factor, dtype=dtype)
+                    else:
+                        if factor.shape[0] != factor.shape[1] or np.any(np.count_nonzero(factor, axis=1) != 1):
+                            return False
+                        columns = np.argmax(factor != 0, axis=1)
+                        values = factor[np.arange(len(columns)), columns]
+                    size = len(columns)
+                    source = (source[:, None] * size + columns).ravel()
+                    phase = (phase[:, None] * values).ravel()
+                self._monomial = source, None if np.all(phase == 1) else phase
+        return self._monomial
+
+    @property
+    def shape(self):
+        return int(np.prod(self.out_dims)), int(np.prod(self.in_dims))
+
+    def apply(self, vectors):
+        """Apply to one vector (shape (dim,)) or a batch of vectors stacked along the first axes (shape (..., dim))."""
+        vectors = np.asarray(vectors)
+        batch_shape = vectors.shape[:-1]
+        if vectors.shape[-1] != self.shape[1]:
+            raise ValueError(f"Expected vectors of length {self.shape[1]}, got {vectors.shape[-1]}")
+        monomial = self._monomial_form()
+        if monomial:  # One gather plus one multiply instead of a contraction per factor
+            source, phase = monomial
+            return vectors[..., source] if phase is None else vectors[..., source] * phase
+        batch = len(batch_shape)
+        tensor = vectors.reshape(batch_shape + tuple(self.in_dims))
+        for axis, factor in enumerate(self.factors):
+            if isinstance(factor, int):
+                continue  # Identity factor: nothing to do
+            tensor = np.moveaxis(np.tensordot(factor, tensor, axes=([1], [batch + axis])), 0, batch + axis)
+        return tensor.reshape(batch_shape + (self.shape[0],))
+
+    def __matmul__(self, other):
+        if isinstance(other, KronOperator):
+            return self.compose(other)
+        if isinstance(other, ComposedOperator):
+            return ComposedOperator(self, *other.operators)
+        return self.apply(np.asarray(other).T).T if np.ndim(other) == 2 else self.apply(other)
+
+    def compose(self, other):
+        """self · other; factorwise (A ⊗ B)(C ⊗ D) = AC ⊗ BD when the factor shapes line up."""
+        if self.in_dims != other.out_dims:
+            return ComposedOperator(self, other)
+        factors = []
+        for mine, theirs in zip(self.factors, other.factors):
+            if isinstance(mine, int):
+                factors.append(theirs)
+            elif isinstance(theirs, int):
+                factors.append(mine)
+            else:
+                factors.append(mine @ theirs)
+        return KronOperator(*factors)
+
+    def adjoint(self):
+        return KronOperator(*[f if isinstance(f, int) else f.conj().T for f in self.factors])
+
+    @property
+    def H(self):
+        return self.adjoint()
+
+    def to_dense(self, max_elements=2**24):
+        """Materialize the full matrix (only sensible for small operators)."""
+        rows, cols = self.shape
+        if rows * cols > max_elements:
+            raise MemoryError(f"Refusing to materialize a {rows}x{cols} operator")
+        dense = np.ones((1, 1))
+        for factor in self.factors:
+            dense = np.kron(dense, np.eye(factor) if isinstance(factor, int) else factor)
+        return dense
+
+class ComposedOperator:
+    """Product of operators applied right to left, for factor layouts that cannot be merged."""
+    def __init__(self, *operators):
+        for left, right in zip(operators, operators[1:]):
+            if left.shape[1] != right.shape[0]:
+                raise ValueError(f"Cannot compose {left.shape} with {right.shape}")
+        self.operators = list(operators)
+
+    @property
+    def shape(self):
+        return self.operators[0].shape[0], self.operators[-1].shape[1]
+
+    def apply(self, vectors):
+        for operator in reversed(self.operators):
+            vectors = operator.apply(vectors)
+        return vectors
+
+    def __matmul__(self, other):
+        if isinstance(other, (KronOperator, ComposedOperator)):
+            tail = other.operators if isinstance(other, ComposedOperator) else [other]
+            return ComposedOperator(*self.operators, *tail)
+        return self.apply(np.asarray(other).T).T if np.ndim(other) == 2 else self.apply(other)
+
+    def adjoint(self):
+        return ComposedOperator(*[operator.adjoint() for operator in reversed(self.operators)])
+
+    @property
+    def H(self):
+        return self.adjoint()
+
+    def to_dense(self, max_elements=2**24):
+        dense = self.operators[-1].to_dense(max_elements)
+        for operator in reversed(self.operators[:-1]):
+            dense = operator.to_dense(max_elements) @ dense
+        return dense
+
+# Matrix-free Pauli-sum Hamiltonians: H = sum_k c_k P_k with P_k a tensor product of I, X, Y, Z
+class PauliSum:
+    """Operator sum_k c_k P_k from [(coefficient, "XZIY..."), ...] or {label: coefficient}, never built as a matrix.
+
+    A Pauli string maps |j> to i^(#Y) (-1)^popcount(j & zmask) |j ^ xmask>, so all terms sharing an
+    X/Y pattern collapse into one diagonal followed by one bit flip of the index. Flipping bits
+    is done by reversing axes of a (2, 2, ..., 2) view, with no index arrays. Character 0 of a
+    label acts on the most significant index, like KronOperator and np.kron.
+    """
+    def __init__(self, terms):
+        if not HAVE_NUMPY:
+            raise ImportError("PauliSum requires NumPy")
+        if isinstance(terms, dict):  # {label: coefficient}
+            terms = [(coefficient, label) for label, coefficient in terms.items()]
+        terms = list(terms)
+        self.num_qubits = len(terms[0][1])
+        self.terms = []
+        groups = {}  # x mask -> [(coefficient * i^#Y, z mask)]
+        for coefficient, label in terms:
+            if len(label) != self.num_qubits or set(label) - set("IXYZ"):
+                raise ValueError(f"Bad Pauli label {label!r} for {self.num_qubits} qubits")
+            self.terms.append((coefficient, label))
+            bits = [1 << (self.num_qubits - 1 - q) for q in range(self.num_qubits)]
+            xmask = sum(bit for bit, p in zip(bits, label) if p in "XY")
+            zmask = sum(bit for bit, p in zip(bits, label) if p in "YZ")
+            groups.setdefault(xmask, []).append((coefficient * 1j ** label.count("Y"), zmask))
+        self._groups = groups
+        self._diagonals = {}  # x mask -> scalar or length-2^n diagonal, built on first use
+
+    @property
+    def shape(self):
+        return 2**self.num_qubits, 2**self.num_qubits
+
+    def _diagonal(self, xmask):
+        if xmask not in self._diagonals:
+            terms = self._groups[xmask]
+            if all(zmask == 0 for _, zmask in terms):
+                diagonal = sum(coefficient for coefficient, _ in terms)
+            else:
+                index = np.arange(self.shape[0])
+                diagonal = np.zeros(self.shape[0], dtype=complex)
+                for coefficient, zmask in terms:
+                    parity = np.zeros(self.shape[0], dtype=np.int64)
+                    for bit in range(self.num_qubits):
+                        if zmask >> bit & 1:
+                            parity ^= index >> bit & 1
+                    diagonal += coefficient * (1 - 2 * parity)
+                if not diagonal.imag.any():
+                    diagonal = diagonal.real
+            self._diagonals[xmask] = diagonal
+        return self._diagonals[xmask]
+
+    def apply(self, vectors):
+        """Apply to one vector (shape (dim,)) or a batch (shape (..., dim))."""
+        vectors = np.asarray(vectors)
+        if vectors.shape[-1] != self.shape[0]:
+            raise ValueError(f"Expected vectors of length {self.shape[0]}, got {vectors.shape[-1]}")
+        batch_shape, n = vectors.shape[:-1], self.num_qubits
+        result = np.zeros(vectors.shape, dtype=np.result_type(vectors, complex))
+        view = result.reshape(batch_shape + (2,) * n)
+        for xmask in self._groups:
+            term = (self._diagonal(xmask) * vectors).reshape(batch_shape + (2,) * n)
+            axes = [len(batch_shape) + q for q in range(n) if xmask >> (n - 1 - q) & 1]
+            view += np.flip(term, axes) if axes else term
+        return result
+
+    def __matmul__(self, other):
+        return self.apply(np.asarray(other).T).T if np.ndim(other) == 2 else self.apply(other)
+
+    def to_dense(self, max_elements=2**24):
+        rows, cols = self.shape
+        if rows * cols > max_elements:
+            raise MemoryError(f"Refusing to materialize a {rows}x{cols} operator")
+        return self.apply(np.eye(rows)).T  # Row k of apply(I) is H applied to basis vector k
@@ -0,0 +1,296 @@
+# Bit-sliced Boolean evaluation helpers (Day04)
+# Many input vectors ("lanes") are packed into the bits of machine words, lane j in bit j % 64 of
+# word j // 64, so one bitwise operation evaluates a gate for every lane at once.
+# A packed signal is either a Python int (any width) or a NumPy uint64 array.
+
+import numpy as np
+
+WORD_BITS = 64
+ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+def words_for(width):
+    return max(1, -(-width // WORD_BITS))
+
+def invert(words, width):
+    """Bitwise NOT restricted to the `width` valid lanes (padding bits stay 0)."""
+    if isinstance(words, int):
+        return ~words & ((1 << width) - 1)
+    inverted = ~words
+    if width % WORD_BITS:
+        inverted[-1] &= np.uint64((1 << (width % WORD_BITS)) - 1)
+    return inverted
+
+def constant(value, width):
+    """A signal that is `value` (0 or 1) in every lane."""
+    words = np.zeros(words_for(width), dtype=np.uint64)
+    return invert(words, width) if value else words
+
+def exhaustive_inputs(num_inputs):
+    """Packed inputs covering all 2**num_inputs assignments: input i in lane j is bit i of j."""
+    width = 1 << num_inputs
+    lanes = np.arange(words_for(width), dtype=np.uint64)
+    inputs = []
+    for i in range(num_inputs):
+        if i < 6:  # The pattern repeats inside every word
+            pattern = sum(1 << b for b in range(WORD_BITS) if (b >> i) & 1)
+            words = np.full(len(lanes), pattern, dtype=np.uint64)
+        else:  # Whole words alternate between all-zeros and all-ones
+            words = ((lanes >> np.uint64(i - 6)) & np.uint64(1)) * ALL_ONES
+        if width < WORD_BITS:
+            words &= np.uint64((1 << width) - 1)
+        inputs.append(words)
+    return inputs
+
+def pack_lanes(bits):
+    """Pack a sequence of 0/1 values (one per lane) into uint64 words."""
+    bits = np.asarray(bits, dtype=np.uint8)
+    padded = np.zeros(words_for(len(bits)) * WORD_BITS, dtype=np.uint8)
+    padded[:len(bits)] = bits
+    return np.packbits(padded, bitorder="little").view("<u8").astype(np.uint64)
+
+def unpack_lanes(words, width):
+    """Inverse of pack_lanes: one uint8 0/1 per lane."""
+    if isinstance(words, int):
+        words = np.array([(words >> shift) & int(ALL_ONES) for shift in range(0, max(width, 1), WORD_BITS)],
+                         dtype=np.uint64)
+    raw = np.ascontiguousarray(words, dtype="<u8").view(np.uint8)
+    return np.unpackbits(raw, bitorder="little")[:width]
+
+def popcount(words):
+    """Number of lanes set to 1."""
+    if isinstance(words, int):
+        return words.bit_count()
+    if hasattr(np, "bitwise_count"):
+        return int(np.bitwise_count(words).sum())
+    return int(np.unpackbits(np.ascontiguousarray(words).view(np.uint8)).sum())
+
+# Netlists: Boolean circuits as a DAG of LogicGate-style operations
+# Nodes are appended after their operands, so node order is already a valid topological order.
+GATE_OPS = ("NOT", "AND", "OR", "XOR")
+OPCODES = {"INPUT": 0, "CONST": 1, "NOT": 2, "AND": 3, "OR": 4, "XOR": 5}
+
+class Netlist:
+    """Boolean circuit built gate by gate with the LogicGate vocabulary (NOT/AND/OR/XOR).
+
+    Identical gates are shared (common-subexpression elimination) and gates with constant or
+    repeated operands are folded away as they are added.
+    """
+    def __init__(self):
+        self.nodes = []  # (op, a, b): op name plus operand node ids (or input name / constant value)
+        self.lookup = {}  # (op, a, b) -> node id, for hash-consing
+        self.inputs = []  # Input names in declaration order
+        self.outputs = []  # (name, node id) in declaration order
+        self._compiled = None
+
+    def _node(self, op, a=None, b=None):
+        if op in ("AND", "OR", "XOR") and a > b:
+            a, b = b, a  # Commutative: canonical operand order
+        key = (op, a, b)
+        if key not in self.lookup:
+            self.lookup[key] = len(self.nodes)
+            self.nodes.append(key)
+            self._compiled = None
+        return self.lookup[key]
+
+    def _constant_value(self, node):
+        op, value, _ = self.nodes[node]
+        return value if op == "CONST" else None
+
+    def input(self, name):
+        if name in self.inputs:
+            raise ValueError(f"Duplicate input name: {name}")
+        self.inputs.append(name)
+        return self._node("INPUT", name)
+
+    def const(self, value):
+        return self._node("CONST", int(bool(value)))
+
+    def output(self, name, node):
+        self.outputs.append((name, node))
+        self._compiled = None
+        return node
+
+    def _complementary(self, a, b):
+        return self.nodes[a] == ("NOT", b, None) or self.nodes[b] == ("NOT", a, None)
+
+    def NOT(self, a):
+        if self._constant_value(a) is not None:
+            return self.const(1 - self._constant_value(a))
+        op, inner, _ = self.nodes[a]
+        return inner if op == "NOT" else self._node("NOT", a)
+
+    def AND(self, a, b):
+        ca, cb = self._constant_value(a), self._constant_value(b)
+        if ca == 0 or cb == 0 or self._complementary(a, b):
+            return self.const(0)
+        if ca == 1 or a == b:
+            return b
+        return a if cb == 1 else self._node("AND", a, b)
+
+    def OR(self, a, b):
+        ca, cb = self._constant_value(a), self._constant_value(b)
+        if ca == 1 or cb == 1 or self._complementary(a, b):
+            return self.const(1)
+        if ca == 0 or a == b:
+            return b
+        return a if cb == 0 else self._node("OR", a, b)
+
+    def XOR(self, a, b):
+        ca, cb = self._constant_value(a), self._constant_value(b)
+        if a == b:
+            return self.const(0)
+        if self._complementary(a, b):
+            return self.const(1)
+        if ca is not None and cb is not None:
+            return self.const(ca ^ cb)
+        if ca is not None:
+            return self.NOT(b) if ca else b
+        if cb is not None:
+            return self.NOT(a) if cb else a
+        return self._node("XOR", a, b)
+
+    def live_nodes(self, outputs=None):
+        """Node ids reachable from the outputs (or the named ones), in topological order (dead gates are left out)."""
+        live = set()
+        stack = [node for name, node in self.outputs if outputs is None or name in outputs]
+        while stack:
+            node = stack.pop()
+            if node in live:
+                continue
+            live.add(node)
+            op, a, b = self.nodes[node]
+            if op in GATE_OPS:
+                stack.extend(x for x in (a, b) if x is not None)
+        return sorted(live)
+
+    def gate_count(self):
+        return sum(1 for node in self.live_nodes() if self.nodes[node][0] in GATE_OPS)
+
+    def depth(self):
+        """Critical path length in gates from any input to any output."""
+        level = {}
+        for node in self.live_nodes():
+            op, a, b = self.nodes[node]
+            if op in GATE_OPS:
+                level[node] = 1 + max(level[x] for x in (a, b) if x is not None)
+            else:
+                level[node] = 0
+        return max((level[node] for _, node in self.outputs), default=0)
+
+    def compile(self):
+        """Flatten the live gates into an instruction array (opcode, dest, src1, src2) over a register file.
+
+        Registers are recycled once a value has had its last use, so wide circuits over many lanes
+        only keep the signals that are still needed in memory.
+        """
+        if self._compiled is not None:
+            return self._compiled
+        order = self.live_nodes()
+        last_use = {}
+        for position, node in enumerate(order):
+            op, a, b = self.nodes[node]
+            if op in GATE_OPS:
+                for x in (a, b):
+                    if x is not None:
+                        last_use[x] = position
+        for _, node in self.outputs:
+            last_use[node] = len(order)  # Outputs stay alive until the end
+
+        register_of, free, instructions, registers = {}, [], [], 0
+        for position, node in enumerate(order):
+            op, a, b = self.nodes[node]
+            if free:
+                register = free.pop()
+            else:
+                register, registers = registers, registers + 1
+            if op == "INPUT":
+                src1, src2 = self.inputs.index(a), -1
+            elif op == "CONST":
+                src1, src2 = a, -1
+            else:
+                src1 = register_of[a]
+                src2 = register_of[b] if b is not None else -1
+            instructions.append((OPCODES[op], register, src1, src2))
+            register_of[node] = register
+            if op in GATE_OPS:  # Operands whose last use was this gate free their registers
+                for x in {a, b} - {None}:
+                    if last_use.get(x) == position:
+                        free.append(register_of[x])
+            if node not in last_use:  # Never read again (e.g. an unused input)
+                free.append(register)
+
+        self._compiled = CompiledNetlist(np.array(instructions, dtype=np.int32).reshape(-1, 4),
+                                         registers, list(self.inputs),
+                                         [(name, register_of[node]) for name, node in self.outputs])
+        return self._compiled
+
+    def evaluate(self, inputs, width=1):
+        """Evaluate for packed input signals {name: int or uint64 words}; returns {output name: words}."""
+        return self.compile().run(inputs, width)
+
+class CompiledNetlist:
+    """Flat instruction array produced by Netlist.compile()."""
+    def __init__(self, instructions, registers, input_names, output_registers):
+        self.instructions = instructions
+        self.registers = registers
+        self.input_names = input_names
+        self.output_registers = output_registers
+
+    def run(self, inputs, width=1):
+        values = [None] * self.registers
+        for opcode, dest, src1, src2 in self.instructions.tolist():
+            if opcode == 3:
+                values[dest] = values[src1] & values[src2]
+            elif opcode == 5:
+                values[dest] = values[src1] ^ values[src2]
+            elif opcode == 4:
+                values[dest] = values[src1] | values[src2]
+            elif opcode == 2:
+                values[dest] = invert(values[src1], width)
+            elif opcode == 0:
+                values[dest] = inputs[self.input_names[src1]]
+            else:
+                values[dest] = constant(src1, width) if width > 1 else src1
+        return {name: values[register] for name, register in self.output_registers}
+
+# Adder builders (little-endian bit lists of node ids)
+def half_adder(net, a, b):
+    return net.XOR(a, b), net.AND(a, b)
+
+def full_adder(net, a, b, carry_in):
+    partial_sum, carry1 = half_adder(net, a, b)
+    sum_bit, carry2 = half_adder(net, partial_sum, carry_in)
+    return sum_bit, net.OR(carry1, carry2)
+
+def ripple_carry_adder(net, a_bits, b_bits, carry_in=None):
+    """n-bit adder from chained half/full adders: n-1 carry steps on the critical path."""
+    sum_bits, carry = [], carry_in
+    for a, b in zip(a_bits, b_bits):
+        if carry is None:
+            s, carry = half_adder(net, a, b)
+        else:
+            s, carry = full_adder(net, a, b, carry)
+        sum_bits.append(s)
+    return sum_bits, carry
+
+def carry_lookahead_adder(net, a_bits, b_bits, carry_in=None):
+    """n-bit adder whose carries come from a parallel-prefix (Kogge-Stone) lookahead network.
+
+    Half adders give each bit's generate (a AND b) and propagate (a XOR b) signals; prefix
+    combination makes every carry available after O(log n) gate levels instead of O(n).
+    """
+    propagate, generate = zip(*(half_adder(net, a, b) for a, b in zip(a_bits, b_bits)))
+    group_generate, group_propagate = list(generate), list(propagate)
+    if carry_in is not None:
+        group_generate[0] = net.OR(generate[0], net.AND(propagate[0], carry_in))
+    distance = 1
+    while distance < len(a_bits):
+        next_generate, next_propagate = list(group_generate), list(group_propagate)
+        for i in range(distance, len(a_bits)):
+            next_generate[i] = net.OR(group_generate[i], net.AND(group_propagate[i], group_generate[i - distance]))
+            next_propagate[i] = net.AND(group_propagate[i], group_propagate[i - distance])
+        group_generate, group_propagate = next_generate, next_propagate
+        distance *= 2
+    carries = [carry_in] + group_generate[:-1]  # Carry into bit i is the group generate of bits 0..i-1
+    sum_bits = [p if c is None else net.XOR(p, c) for p, c in zip(propagate, carries)]
+    return sum_bits, group_generate[-1]
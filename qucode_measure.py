@@ -0,0 +1,75 @@
+# Shot-batched computational-basis measurement (Day07 onwards)
+# Qubit q is bit q of the basis index (Qiskit's little-endian order). Probabilities are computed
+# once per state, every shot is drawn from one cumulative table, and counts come back as an
+# integer histogram indexed by outcome instead of a dict of bitstrings.
+
+import numpy as np
+
+def marginal_probabilities(probabilities, num_qubits, qubits):
+    """Distribution of the listed qubits: outcome bit j is the value of qubits[j]."""
+    tensor = np.asarray(probabilities).reshape((2,) * num_qubits)  # Axis a holds qubit num_qubits-1-a
+    axes = [num_qubits - 1 - q for q in qubits]
+    traced = tuple(a for a in range(num_qubits) if a not in axes)
+    marginal = tensor.sum(axis=traced) if traced else tensor
+    kept = sorted(axes)  # Axes that survive the sum, in their original order
+    return np.transpose(marginal, [kept.index(a) for a in reversed(axes)]).ravel()
+
+class MeasurementSampler:
+    """Samples measurement outcomes of a fixed state (optionally of a subset of its qubits).
+
+    The probability vector and its cumulative table are built once; each batch of shots is then
+    one vectorized searchsorted over uniform draws.
+    """
+    def __init__(self, psi=None, qubits=None, probabilities=None):
+        if probabilities is None:
+            probabilities = np.abs(np.asarray(psi).ravel())**2
+        self.probabilities = np.asarray(probabilities, dtype=float)
+        self.num_qubits = int(np.log2(len(self.probabilities)))
+        if 2**self.num_qubits != len(self.probabilities):
+            raise ValueError(f"State length {len(self.probabilities)} is not a power of two")
+        if qubits is not None:
+            self.probabilities = marginal_probabilities(self.probabilities, self.num_qubits, qubits)
+            self.num_qubits = len(qubits)
+        self.cumulative = np.cumsum(self.probabilities)
+        self.cumulative /= self.cumulative[-1]  # Absorb rounding so the table ends exactly at 1
+
+    def marginal(self, qubits):
+        """Sampler for a subset of this sampler's qubits, reusing the probabilities already computed."""
+        return MeasurementSampler(probabilities=self.probabilities, qubits=qubits)
+
+    def sample(self, shots, seed=None, ordered=True):
+        """Outcome index of every shot, as an int64 array (in shot order unless ordered=False)."""
+        uniforms = np.random.default_rng(seed).random(shots)
+        if not ordered:
+            uniforms.sort()  # Sorted lookups walk the table monotonically and stay in cache
+        return np.minimum(np.searchsorted(self.cumulative, uniforms, side="right"), len(self.cumulative) - 1)
+
+    def counts(self, shots, seed=None):
+        """Histogram of `shots` outcomes: counts[k] is how often outcome k was seen."""
+        return np.bincount(self.sample(shots, seed, ordered=False), minlength=len(self.cumulative))
+
+def format_counts(counts, num_bits=None):
+    """Qiskit-style {bitstring: count} view of the nonzero entries of a count histogram."""
+    num_bits = num_bits or max(1, int(np.log2(len(counts))))
+    return {format(int(k), f"0{num_bits}b"): int(counts[k]) for k in np.flatnonzero(counts)}
+
+def collapse(psi, outcome, qubits=None):
+    """Project psi in place onto the measured outcome (of all qubits, or of `qubits`) and renormalize."""
+    num_qubits = int(np.log2(len(psi)))
+    if qubits is None:
+        psi[:outcome] = 0
+        psi[outcome + 1:] = 0
+    else:
+        tensor = psi.reshape((2,) * num_qubits)
+        for j, q in enumerate(qubits):
+            index = [slice(None)] * num_qubits
+            index[num_qubits - 1 - q] = 1 - (outcome >> j & 1)  # The branch that was not observed
+            tensor[tuple(index)] = 0
+    psi /= np.linalg.norm(psi)
+    return psi
+
+def measure(psi, qubits=None, seed=None):
+    """One projective measurement: returns the outcome and collapses psi (a complex array) in place."""
+    outcome = int(MeasurementSampler(psi, qubits).sample(1, seed)[0])
+    collapse(psi, outcome, qubits)
+    return outcome
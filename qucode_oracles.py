@@ -0,0 +1,172 @@
+# Boolean netlist -> reversible phase oracle compiler (links the Day04 logic to Day17 Grover search)
+# Input i of the netlist lives on qubit i; intermediate AND/OR results get ancilla qubits that are
+# uncomputed back to |0> as soon as they are dead (and reused) or at the end, so the oracle is
+# exactly |x>|0> -> (-1)^f(x) |x>|0>.
+
+import numpy as np
+from qiskit import QuantumCircuit
+
+from qucode_logic import GATE_OPS
+
+class CompiledOracle:
+    """A phase oracle gate plus the resources it needs."""
+    def __init__(self, gate, num_inputs, num_ancillas, toffoli_count, cnot_count):
+        self.gate = gate
+        self.num_inputs = num_inputs
+        self.num_ancillas = num_ancillas
+        self.toffoli_count = toffoli_count
+        self.cnot_count = cnot_count
+
+    @property
+    def num_qubits(self):
+        return self.num_inputs + self.num_ancillas
+
+    def __str__(self):
+        return (f"Oracle: {self.num_inputs} inputs, {self.num_ancillas} ancillas, "
+                f"{self.toffoli_count} Toffoli, {self.cnot_count} CNOT")
+
+_oracle_cache = {}  # (predicate signature, label) -> CompiledOracle
+
+def predicate_signature(net, output):
+    """Structural key of the live part of a netlist, used to cache compiled oracles."""
+    live = net.live_nodes([output])
+    return tuple(net.inputs), tuple(net.nodes[node] for node in live), tuple(live), output
+
+def compile_phase_oracle(net, output=None, label="Oracle"):
+    """Compile the single-output predicate `output` of a Netlist into a phase oracle.
+
+    Resource savings: NOT gates are free (each signal carries a polarity flag instead), XOR is
+    computed in place with CNOTs on an operand that is not read again, intermediate results are
+    uncomputed as soon as they are dead so later gates reuse their ancillas (num_ancillas is the
+    peak width), and the final gate is applied directly as a phase (CZ / Z) instead of being
+    computed into an ancilla.
+    Compiled oracles are cached by the predicate's structure and the label, so repeated Grover
+    iterations and repeated searches reuse the same gate.
+    """
+    if output is None:
+        if len(net.outputs) != 1:
+            raise ValueError("Netlist has several outputs; choose one with output=...")
+        output = net.outputs[0][0]
+    output_node = dict(net.outputs)[output]
+    key = predicate_signature(net, output), label
+    if key in _oracle_cache:
+        return _oracle_cache[key]
+
+    def root(node):
+        """Strip NOT gates: (underlying node, negated?)."""
+        negated = False
+        while net.nodes[node][0] == "NOT":
+            node, negated = net.nodes[node][1], not negated
+        return node, negated
+
+    output_root, output_negated = root(output_node)
+    order = [node for node in net.live_nodes([output]) if net.nodes[node][0] != "NOT"]
+    # Remaining reads of each (NOT-stripped) signal; the output gate's reads never happen during
+    # the compute phase, so its operands stay live until the phase is applied
+    uses = {}
+    for node in order:
+        op, a, b = net.nodes[node]
+        if op in GATE_OPS:
+            for operand in (a, b):
+                uses[root(operand)[0]] = uses.get(root(operand)[0], 0) + 1
+
+    num_inputs = len(net.inputs)
+    qubit_of, polarity = {}, {}
+    compute = []  # (gate name, qubits) sequence, replayed onto a circuit once the width is known
+    free, width = [], num_inputs  # Released ancilla qubits, and the qubits used so far
+    present = set()  # Nodes whose value currently sits on their qubit
+    sources = {}  # Node computed into its own ancilla -> (its compute gates, its operands)
+
+    def allocate():
+        nonlocal width
+        if free:
+            return free.pop()
+        width += 1
+        return width - 1
+
+    def cleanup(node):
+        """Bennett-style: a dead intermediate whose operands still hold their values is uncomputed
+        at once by replaying its (self-inverse) gates, and its ancilla goes back to the free list.
+        Anything else stays until the final reversal, which recomputes what was cleaned up."""
+        if uses.get(node) == 0 and node in sources and node in present and present.issuperset(sources[node][1]):
+            gates, _ = sources.pop(node)
+            compute.extend(gates)
+            present.discard(node)
+            free.append(qubit_of[node])
+
+    def signal(node):
+        base, negated = root(node)
+        return qubit_of[base], polarity[base] ^ negated
+
+    def controlled(name, controls, target):
+        # Negated controls are wrapped in X gates (the X pairs cancel in transpilation)
+        flips = [qubit for qubit, negated in controls if negated]
+        gates = [("x", (qubit,)) for qubit in flips]
+        gates.append((name, tuple(qubit for qubit, _ in controls) + target))
+        gates.extend(("x", (qubit,)) for qubit in flips)
+        return gates
+
+    for node in order:
+        op, a, b = net.nodes[node]
+        if op == "INPUT":
+            qubit_of[node], polarity[node] = net.inputs.index(a), False
+            present.add(node)
+            continue
+        if op == "CONST" and node != output_root:
+            raise ValueError("Constant inside a folded netlist")  # Netlist folding never leaves these
+        if node == output_root or op == "CONST":
+            continue
+        (qa, na), (qb, nb) = signal(a), signal(b)
+        ra, rb = root(a)[0], root(b)[0]
+        if op == "XOR" and ra != rb and (uses[ra] == 1 or uses[rb] == 1):
+            # Overwrite an operand that is not read again in place: a ^= b
+            (qa, ra), (qb, rb) = ((qa, ra), (qb, rb)) if uses[ra] == 1 else ((qb, rb), (qa, ra))
+            compute.append(("cx", (qb, qa)))
+            present.discard(ra)
+            qubit_of[node], polarity[node] = qa, na ^ nb
+        else:
+            qubit_of[node] = allocate()
+            if op == "XOR":
+                polarity[node] = na ^ nb
+                gates = [("cx", (qa, qubit_of[node])), ("cx", (qb, qubit_of[node]))]
+            else:  # AND, or OR via De Morgan: a OR b = NOT(NOT a AND NOT b)
+                is_or = op == "OR"
+                polarity[node] = is_or
+                gates = controlled("ccx", [(qa, na ^ is_or), (qb, nb ^ is_or)], (qubit_of[node],))
+            compute.extend(gates)
+            sources[node] = (gates, (ra, rb))
+        present.add(node)
+        uses[ra] -= 1
+        uses[rb] -= 1
+        for operand in sorted({ra, rb}, reverse=True):  # Later nodes first: they may read the earlier one
+            cleanup(operand)
+
+    # Phase kickback of the output: (-1)^f(x), with a global phase of pi whenever f = NOT(...)
+    phase = []
+    out_op, a, b = net.nodes[output_root]
+    global_flip = output_negated
+    if out_op == "CONST":
+        global_flip ^= bool(a)
+    elif out_op == "INPUT":
+        phase.append(("z", (qubit_of[output_root],)))
+    elif out_op == "XOR":
+        (qa, na), (qb, nb) = signal(a), signal(b)
+        phase.extend((("z", (qa,)), ("z", (qb,))))
+        global_flip ^= na ^ nb
+    else:
+        (qa, na), (qb, nb) = signal(a), signal(b)
+        is_or = out_op == "OR"
+        phase.extend(controlled("cz", [(qa, na ^ is_or), (qb, nb ^ is_or)], ()))
+        global_flip ^= is_or
+
+    # Reversing the whole compute sequence (mid-way cleanups included) restores every ancilla
+    oracle = QuantumCircuit(width)
+    for name, qubits in compute + phase + compute[::-1]:  # Every compute gate is self-inverse
+        getattr(oracle, name)(*qubits)
+    if global_flip:
+        oracle.global_phase += np.pi
+    names = [name for name, _ in compute]
+    compiled = CompiledOracle(oracle.to_gate(label=label), num_inputs, width - num_inputs,
+                              2 * names.count("ccx"), 2 * names.count("cx"))
+    _oracle_cache[key] = compiled
+    return compiled
@@ -0,0 +1,16 @@
+# Worker pools shared by the helper modules (qucode_stats, qucode_render)
+# The day scripts run their demos at top level with no __main__ guard, which decides how workers start.
+
+import multiprocessing
+import multiprocessing.dummy
+
+def process_pool(processes=None):
+    """Forked process pool, so the (unguarded) day scripts are not re-run in each worker.
+
+    Spawned workers would re-import the calling script and repeat its top-level work, so where
+    fork is unavailable (Windows, macOS defaults) the tasks run serially in a one-thread pool
+    with the same interface.
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.dummy.Pool(1)
+    return multiprocessing.get_context("fork").Pool(processes)
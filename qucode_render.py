@@ -0,0 +1,213 @@
+# Figure output for the day scripts: Bloch spheres, circuits, histograms and plain matplotlib figures
+# QUCODE_RENDER picks the mode:
+#   inline (default)  draw with Qiskit/matplotlib exactly as the scripts always did
+#   queue             headless: each request is queued to a worker pool that writes a PNG/SVG file,
+#                     so the script keeps simulating while figures are produced in the background
+#   off               every render call returns immediately, nothing is drawn
+# QUCODE_RENDER_DIR (default "figures") and QUCODE_RENDER_FORMAT (png or svg) set where and how
+# queued figures are written; configure() changes any of these from code.
+
+import atexit
+import itertools
+import os
+import sys
+
+import numpy as np
+
+from qucode_bloch import reduced_bloch_vectors
+from qucode_parallel import process_pool
+
+MODES = ("inline", "queue", "off")
+
+settings = {
+    "mode": os.environ.get("QUCODE_RENDER", "inline"),
+    "directory": os.environ.get("QUCODE_RENDER_DIR", "figures"),
+    "format": os.environ.get("QUCODE_RENDER_FORMAT", "png"),
+    "processes": None,  # Worker count (None: one per CPU)
+}
+
+def configure(mode=None, directory=None, format=None, processes=None):
+    """Change the rendering settings; pending queued figures are finished first."""
+    flush()
+    for key, value in (("mode", mode), ("directory", directory), ("format", format), ("processes", processes)):
+        if value is not None:
+            settings[key] = value
+    if settings["mode"] not in MODES:
+        raise ValueError(f"Unknown render mode {settings['mode']!r}; choose one of {MODES}")
+    if settings["mode"] != "inline" and "matplotlib.pyplot" not in sys.modules:
+        import matplotlib
+        matplotlib.use("Agg")  # Never open a GUI backend in headless or skipped runs
+
+_pool = None
+_pending = []  # AsyncResults of queued figures
+_counter = itertools.count(1)
+
+def _output_path(kind, name):
+    script = os.path.splitext(os.path.basename(sys.argv[0] or "interactive"))[0] or "interactive"
+    stem = name or f"{script}_{next(_counter):03d}_{kind}"
+    return os.path.join(settings["directory"], f"{stem}.{settings['format']}")
+
+def _submit(kind, payload, options, name):
+    """Route one figure request according to the current mode."""
+    mode = settings["mode"]
+    if mode == "off":
+        return None
+    if mode == "inline":
+        return _INLINE[kind](payload, **options)
+    global _pool
+    if _pool is None:
+        os.makedirs(settings["directory"], exist_ok=True)
+        _pool = process_pool(settings["processes"])
+        atexit.register(_shutdown)
+    path = _output_path(kind, name)
+    _pending.append(_pool.apply_async(_render_task, (kind, payload, options, path)))
+    return path
+
+def render_bloch_vector(vector, title="", name=None):
+    """A single Bloch vector (x, y, z); returns the figure (inline) or the output path (queue)."""
+    return _submit("bloch", np.asarray(vector, dtype=float), {"title": title}, name)
+
+def render_bloch_multivector(state, title="", name=None):
+    """One Bloch sphere per qubit of a statevector (array or qiskit Statevector)."""
+    return _submit("bloch_multivector", np.asarray(state, dtype=complex), {"title": title}, name)
+
+def render_circuit(circuit, name=None):
+    """A QuantumCircuit drawn with the matplotlib drawer (text drawing if that is unavailable)."""
+    return _submit("circuit", circuit, {}, name)
+
+def render_histogram(counts, title=None, name=None):
+    """Measurement counts: a {bitstring: count} dict or an integer histogram indexed by outcome."""
+    if not isinstance(counts, dict):
+        from qucode_measure import format_counts
+        counts = format_counts(np.asarray(counts))
+    return _submit("histogram", counts, {"title": title}, name)
+
+def show_figures():
+    """Replacement for plt.show(): shows (inline), saves and closes (queue) or discards (off) open figures."""
+    plt = sys.modules.get("matplotlib.pyplot")
+    if plt is None:
+        return []
+    mode = settings["mode"]
+    if mode == "inline":
+        plt.show()
+        return []
+    paths = []
+    for number in plt.get_fignums():
+        if mode == "queue":  # Live figures cannot be shipped to a worker; they are cheap to save here
+            paths.append(_output_path("figure", None))
+            os.makedirs(settings["directory"], exist_ok=True)
+            plt.figure(number).savefig(paths[-1])
+        plt.close(number)
+    return paths
+
+def flush():
+    """Wait for every queued figure; returns the written paths and reports failures on stderr.
+
+    Queued requests return their planned path; a circuit that falls back to a text drawing is
+    written next to it as .txt, and that is the path reported here.
+    """
+    written = []
+    while _pending:
+        path, error = _pending.pop(0).get()
+        if error:
+            print(f"render: {path} failed ({error})", file=sys.stderr)
+        else:
+            written.append(path)
+    return written
+
+def _shutdown():
+    global _pool
+    flush()
+    if _pool is not None:
+        _pool.close()
+        _pool.join()
+        _pool = None
+
+# Inline drawing: the original Qiskit calls
+def _inline_bloch(vector, title):
+    from qiskit.visualization import plot_bloch_vector
+    return plot_bloch_vector(vector, title=title)
+
+def _inline_bloch_multivector(state, title):
+    from qiskit.visualization import plot_bloch_multivector
+    return plot_bloch_multivector(state, title=title)
+
+def _inline_circuit(circuit):
+    return circuit.draw("mpl")
+
+def _inline_histogram(counts, title):
+    from qiskit.visualization import plot_histogram
+    return plot_histogram(counts, title=title)
+
+_INLINE = {"bloch": _inline_bloch, "bloch_multivector": _inline_bloch_multivector,
+           "circuit": _inline_circuit, "histogram": _inline_histogram}
+
+# Worker side: one figure/axes template per plot type (and layout), cleared and redrawn per request
+_templates = {}
+
+def _template(key, make):
+    if key not in _templates:
+        _templates[key] = make()
+    figure, axes = _templates[key]
+    for ax in axes:
+        ax.clear()
+    return figure, axes
+
+def _single_axes(figsize):
+    import matplotlib.pyplot as plt
+    figure = plt.figure(figsize=figsize)
+    return figure, [figure.add_subplot()]
+
+def _bloch_axes(count):
+    import matplotlib.pyplot as plt
+    figure = plt.figure(figsize=(5 * count, 5))
+    return figure, [figure.add_subplot(1, count, i + 1, projection="3d") for i in range(count)]
+
+def _render_bloch(vector, path, title):
+    from qiskit.visualization import plot_bloch_vector
+    figure, (ax,) = _template(("bloch", 1), lambda: _bloch_axes(1))
+    plot_bloch_vector(vector, title=title, ax=ax)
+    figure.savefig(path)
+    return path
+
+def _render_bloch_multivector(state, path, title):
+    from qiskit.visualization import plot_bloch_vector
+    vectors = reduced_bloch_vectors(state)
+    figure, axes = _template(("bloch", len(vectors)), lambda: _bloch_axes(len(vectors)))
+    for qubit, (ax, vector) in enumerate(zip(axes, vectors)):
+        plot_bloch_vector(vector, title=f"qubit {qubit}", ax=ax)
+    figure.suptitle(title)
+    figure.savefig(path)
+    return path
+
+def _render_circuit(circuit, path):
+    figure, (ax,) = _template(("circuit",), lambda: _single_axes((8, 4)))
+    try:
+        circuit.draw("mpl", ax=ax)
+    except ImportError:  # e.g. pylatexenc missing: keep a text drawing instead of failing the run
+        path = os.path.splitext(path)[0] + ".txt"
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(str(circuit.draw("text")))
+        return path
+    figure.savefig(path)
+    return path
+
+def _render_histogram(counts, path, title):
+    from qiskit.visualization import plot_histogram
+    figure, (ax,) = _template(("histogram",), lambda: _single_axes((7, 5)))
+    plot_histogram(counts, title=title, ax=ax)
+    figure.savefig(path)
+    return path
+
+_RENDERERS = {"bloch": _render_bloch, "bloch_multivector": _render_bloch_multivector,
+              "circuit": _render_circuit, "histogram": _render_histogram}
+
+def _render_task(kind, payload, options, path):
+    import matplotlib
+    matplotlib.use("Agg", force=True)  # Workers only ever write files
+    try:
+        return _RENDERERS[kind](payload, path, **options), None
+    except Exception as error:  # Report instead of killing the worker and the rest of the queue
+        return path, f"{type(error).__name__}: {error}"
+
+configure()
@@ -0,0 +1,339 @@
+# Compressed sparse storage for quantum operators (Day05 SparseMatrix and later days)
+# CSR keeps, for every row, a slice of column indices and values: indptr[i]:indptr[i + 1].
+# CSC is the same layout with rows and columns swapped.
+
+import zipfile
+
+import numpy as np
+
+MATMUL_BLOCK_PRODUCTS = 2**20  # Scalar products CSRMatrix.matmul expands at once (~40 MB of temporaries)
+
+def _counting_sort(keys, size):
+    """Stable order of `keys` (ints in [0, size)) plus the matching indptr array."""
+    order = np.argsort(keys, kind="stable")
+    indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=size), out=indptr[1:])
+    return order, indptr
+
+class CSRMatrix:
+    """Compressed sparse row matrix backed by three NumPy arrays."""
+    def __init__(self, shape, indptr, indices, data):
+        self.shape = (int(shape[0]), int(shape[1]))
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    @classmethod
+    def from_triplets(cls, shape, rows, cols, values, prune=True):
+        """Build from (row, col, value) triplets; duplicate entries are summed."""
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.asarray(values)
+        keys = rows * shape[1] + cols
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        if len(unique_keys) == len(keys):
+            summed = np.empty_like(values)
+            summed[inverse] = values
+        else:
+            summed = np.zeros(len(unique_keys), dtype=values.dtype)
+            np.add.at(summed, inverse, values)
+        if prune:  # Like SparseMatrix.set, exact zeros are not stored
+            keep = summed != 0
+            unique_keys, summed = unique_keys[keep], summed[keep]
+        row_of = unique_keys // shape[1]
+        indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(row_of, minlength=shape[0]), out=indptr[1:])
+        return cls(shape, indptr, unique_keys % shape[1], summed)
+
+    @classmethod
+    def from_dict(cls, shape, entries):
+        """Convert a dictionary-of-keys {(row, col): value} (the SparseMatrix layout)."""
+        if not entries:
+            return cls(shape, np.zeros(shape[0] + 1), [], np.zeros(0))
+        (rows, cols), values = zip(*entries.keys()), list(entries.values())
+        return cls.from_triplets(shape, rows, cols, values)
+
+    @classmethod
+    def from_dense(cls, matrix):
+        matrix = np.asarray(matrix)
+        rows, cols = np.nonzero(matrix)
+        return cls.from_triplets(matrix.shape, rows, cols, matrix[rows, cols])
+
+    def row_ids(self):
+        """Row index of every stored entry."""
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    def triplets(self):
+        return self.row_ids(), self.indices, self.data
+
+    def iter_rows(self, rows=None):
+        """Yield (row, column indices, values) for each row, touching only the stored entries."""
+        for i in range(self.shape[0]) if rows is None else rows:
+            span = slice(self.indptr[i], self.indptr[i + 1])
+            yield i, self.indices[span], self.data[span]
+
+    def to_dict(self):
+        rows, cols, values = self.triplets()
+        return dict(zip(zip(rows.tolist(), cols.tolist()), values.tolist()))
+
+    def toarray(self):
+        dense = np.zeros(self.shape, dtype=self.data.dtype)
+        dense[self.row_ids(), self.indices] = self.data
+        return dense
+
+    def transpose(self):
+        """Explicit transpose: a counting sort of the entries by column."""
+        order, indptr = _counting_sort(self.indices, self.shape[1])
+        return CSRMatrix((self.shape[1], self.shape[0]), indptr, self.row_ids()[order], self.data[order])
+
+    def conj_transpose(self):
+        transposed = self.transpose()
+        transposed.data = transposed.data.conj()
+        return transposed
+
+    def to_csc(self):
+        transposed = self.transpose()  # The CSR arrays of A^T are exactly the CSC arrays of A
+        return CSCMatrix(self.shape, transposed.indptr, transposed.indices, transposed.data)
+
+    def matvec(self, x):
+        """Sparse-dense product with a vector (dim,) or a dense matrix (dim, k)."""
+        x = np.asarray(x)
+        if x.shape[0] != self.shape[1]:
+            raise ValueError("Matrix dimensions incompatible for multiplication")
+        products = (self.data[:, None] * x[self.indices]) if x.ndim == 2 else self.data * x[self.indices]
+        result = np.zeros((self.shape[0],) + x.shape[1:], dtype=np.result_type(self.data, x))
+        nonempty = np.flatnonzero(np.diff(self.indptr))
+        if len(nonempty):
+            result[nonempty] = np.add.reduceat(products, self.indptr[nonempty], axis=0)
+        return result
+
+    def apply_to_rows(self, vectors):
+        """Apply the matrix to every row of a (batch, dim) array, i.e. vectors @ A^T without transposing."""
+        vectors = np.asarray(vectors)
+        products = vectors[:, self.indices] * self.data
+        if self.nnz == self.shape[0] and np.all(np.diff(self.indptr) == 1):
+            return products  # One entry per row (permutation-like matrices): nothing to sum
+        result = np.zeros((vectors.shape[0], self.shape[0]), dtype=np.result_type(self.data, vectors))
+        nonempty = np.flatnonzero(np.diff(self.indptr))
+        if len(nonempty):
+            result[:, nonempty] = np.add.reduceat(products, self.indptr[nonempty], axis=1)
+        return result
+
+    def matmul(self, other, prune=True):
+        """Sparse-sparse product, row by row (Gustavson): row i of A·B = sum_k A[i, k] * row k of B.
+
+        Rows of A are taken in blocks of at most MATMUL_BLOCK_PRODUCTS scalar products (a row is
+        never split). Each block expands its A[i, k] against row k of B and merges the products
+        by (row, column), so peak memory is one block of products plus the output nonzeros. The
+        cost is proportional to the number of scalar products, independent of the columns of B.
+        """
+        if self.shape[1] != other.shape[0]:
+            raise ValueError("Matrix dimensions incompatible for multiplication")
+        num_rows, num_cols = self.shape[0], other.shape[1]
+        row_lengths = np.diff(other.indptr)[self.indices]  # Length of B's row k for every A[i, k]
+        # Products made by rows [0, i): where each block of rows starts and stops
+        products_before = np.concatenate(([0], np.cumsum(row_lengths)))[self.indptr]
+        dtype = np.result_type(self.data, other.data)
+        indptr = np.zeros(num_rows + 1, dtype=np.int64)
+        indices, data = [], []
+        first = 0
+        while first < num_rows:
+            last = np.searchsorted(products_before, products_before[first] + MATMUL_BLOCK_PRODUCTS, side="right") - 1
+            last = min(max(last, first + 1), num_rows)
+            lo, hi = self.indptr[first], self.indptr[last]
+            lengths = row_lengths[lo:hi]
+            rows = np.repeat(np.repeat(np.arange(last - first), np.diff(self.indptr[first:last + 1])), lengths)
+            # Position of each product inside its B row: a running counter that restarts per A entry
+            starts = np.repeat(other.indptr[self.indices[lo:hi]] - np.cumsum(lengths) + lengths, lengths)
+            positions = starts + np.arange(len(rows))
+            values = np.repeat(self.data[lo:hi], lengths) * other.data[positions]
+            keys, inverse = np.unique(rows * num_cols + other.indices[positions], return_inverse=True)
+            summed = np.zeros(len(keys), dtype=dtype)
+            np.add.at(summed, inverse, values)
+            if prune:  # Like SparseMatrix.set, exact zeros are not stored
+                keys, summed = keys[summed != 0], summed[summed != 0]
+            indptr[first + 1:last + 1] = np.bincount(keys // num_cols, minlength=last - first)
+            indices.append(keys % num_cols)
+            data.append(summed)
+            first = last
+        np.cumsum(indptr, out=indptr)
+        return CSRMatrix((num_rows, num_cols), indptr,
+                         np.concatenate(indices) if indices else np.zeros(0, dtype=np.int64),
+                         np.concatenate(data) if data else np.zeros(0, dtype=dtype))
+
+    def __matmul__(self, other):
+        if isinstance(other, CSCMatrix):
+            other = other.to_csr()
+        return self.matmul(other) if isinstance(other, CSRMatrix) else self.matvec(other)
+
+    def __str__(self):
+        return f"CSRMatrix({self.shape[0]}x{self.shape[1]}, nnz={self.nnz})"
+
+class CSCMatrix:
+    """Compressed sparse column matrix: indptr runs over columns, indices are row numbers."""
+    def __init__(self, shape, indptr, indices, data):
+        self.shape = (int(shape[0]), int(shape[1]))
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def column(self, j):
+        """Row indices and values stored in column j."""
+        span = slice(self.indptr[j], self.indptr[j + 1])
+        return self.indices[span], self.data[span]
+
+    def to_csr(self):
+        as_transpose = CSRMatrix((self.shape[1], self.shape[0]), self.indptr, self.indices, self.data)
+        return as_transpose.transpose()
+
+    def matvec(self, x):
+        return self.to_csr().matvec(x)
+
+    def __str__(self):
+        return f"CSCMatrix({self.shape[0]}x{self.shape[1]}, nnz={self.nnz})"
+
+# Kronecker products straight into CSR arrays
+class KronPattern:
+    """Symbolic phase of A ⊗ B: the output sparsity pattern plus, per output entry, which A and B
+    entries are multiplied. Refilling with new values (same patterns) is one vectorized product.
+    """
+    def __init__(self, A, B):
+        self.shape = (A.shape[0] * B.shape[0], A.shape[1] * B.shape[1])
+        a_rows, b_rows = A.row_ids(), B.row_ids()
+        a_entry = np.repeat(np.arange(A.nnz), B.nnz)  # Every pair (A entry, B entry), A-major
+        b_entry = np.tile(np.arange(B.nnz), A.nnz)
+        # Output row of each pair; a stable sort by row keeps columns ascending within every row
+        order = np.argsort(a_rows[a_entry] * B.shape[0] + b_rows[b_entry], kind="stable")
+        self.a_entry, self.b_entry = a_entry[order], b_entry[order]
+        self.indices = A.indices[self.a_entry] * B.shape[1] + B.indices[self.b_entry]
+        row_lengths = np.multiply.outer(np.diff(A.indptr), np.diff(B.indptr)).ravel()
+        self.indptr = np.zeros(self.shape[0] + 1, dtype=np.int64)
+        np.cumsum(row_lengths, out=self.indptr[1:])
+        for array in (self.a_entry, self.b_entry, self.indices, self.indptr):
+            array.flags.writeable = False  # Shared by every product filled from this pattern
+
+    def fill(self, a_data, b_data):
+        """Numeric phase: the CSR matrix A ⊗ B for new values on the cached patterns.
+
+        The result shares the pattern's read-only indptr and indices; only `data` is its own.
+        """
+        return CSRMatrix(self.shape, self.indptr, self.indices,
+                         np.asarray(a_data)[self.a_entry] * np.asarray(b_data)[self.b_entry])
+
+_kron_patterns = {}  # Structure key of (A, B) -> KronPattern
+KRON_PATTERN_CACHE_SIZE = 32
+
+def _structure_key(M):
+    return M.shape, M.indptr.tobytes(), M.indices.tobytes()
+
+def kron_pattern(A, B):
+    """Cached symbolic phase for A ⊗ B (matrices with the same sparsity patterns share it)."""
+    key = (_structure_key(A), _structure_key(B))
+    pattern = _kron_patterns.get(key)
+    if pattern is None:
+        if len(_kron_patterns) >= KRON_PATTERN_CACHE_SIZE:
+            _kron_patterns.pop(next(iter(_kron_patterns)))  # Drop the oldest pattern
+        pattern = _kron_patterns[key] = KronPattern(A, B)
+    return pattern
+
+def csr_kron(A, B):
+    """Kronecker product A ⊗ B of two CSR matrices, written directly as CSR arrays."""
+    return kron_pattern(A, B).fill(A.data, B.data)
+
+# Inspecting and persisting large operators without densifying them
+def format_rows(matrix, max_rows=20, dense_columns=16):
+    """Yield one printable line per row, streaming over the stored entries only.
+
+    Narrow matrices print as dense rows like SparseMatrix.display always did; wider ones list
+    only the stored (column: value) pairs. Beyond `max_rows` rows the middle is elided.
+    """
+    rows = matrix.shape[0]
+    if rows > max_rows:
+        head = range(max_rows // 2)
+        tail = range(rows - (max_rows - max_rows // 2), rows)
+        yield f"{rows}x{matrix.shape[1]} sparse matrix, {matrix.nnz} stored entries"
+    else:
+        head, tail = range(rows), range(0)
+    for part, span in enumerate((head, tail)):
+        if part == 1 and len(span):
+            yield f"... ({rows - len(head) - len(span)} rows omitted)"
+        for i, cols, values in matrix.iter_rows(span):
+            if matrix.shape[1] <= dense_columns:
+                row = [0] * matrix.shape[1]
+                for j, value in zip(cols.tolist(), values.tolist()):
+                    row[j] = value
+                yield str(row)
+            else:
+                entries = ", ".join(f"{j}: {value:.6g}" for j, value in zip(cols.tolist(), values.tolist()))
+                yield f"row {i}: {{{entries}}}"
+
+def save_npz(path, matrix):
+    """Store a CSR matrix as an uncompressed .npz of its arrays (loadable with memory mapping)."""
+    np.savez(path, shape=np.array(matrix.shape, dtype=np.int64), indptr=matrix.indptr,
+             indices=matrix.indices, data=matrix.data)
+
+def load_npz(path, mmap=True):
+    """Load a matrix written by save_npz; with mmap=True the arrays are memory-mapped, not read."""
+    if not mmap:
+        with np.load(path) as archive:
+            return CSRMatrix(archive["shape"], archive["indptr"], archive["indices"], archive["data"])
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as handle:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError("Compressed archives cannot be memory-mapped; use mmap=False")
+            # Skip the zip local file header (30 bytes + name + extra field) and the .npy header
+            handle.seek(info.header_offset + 26)
+            name_length, extra_length = np.frombuffer(handle.read(4), dtype="<u2")
+            handle.seek(info.header_offset + 30 + int(name_length) + int(extra_length))
+            version = np.lib.format.read_magic(handle)
+            read_header = (np.lib.format.read_array_header_1_0 if version == (1, 0)
+                           else np.lib.format.read_array_header_2_0)
+            shape, fortran_order, dtype = read_header(handle)
+            arrays[info.filename[:-4]] = np.memmap(path, dtype=dtype, mode="r", offset=handle.tell(),
+                                                   shape=shape, order="F" if fortran_order else "C")
+    return CSRMatrix(tuple(arrays["shape"]), arrays["indptr"], arrays["indices"], arrays["data"])
+
+def write_matrix_market(path, matrix, chunk_rows=65536):
+    """Write Matrix Market coordinate format (1-based), a block of rows at a time."""
+    if np.iscomplexobj(matrix.data):
+        field = "complex"
+    else:
+        field = "integer" if np.issubdtype(matrix.data.dtype, np.integer) else "real"
+    value_format = "%d" if field == "integer" else "%.17g"
+    with open(path, "w") as handle:
+        handle.write(f"%%MatrixMarket matrix coordinate {field} general\n")
+        handle.write(f"{matrix.shape[0]} {matrix.shape[1]} {matrix.nnz}\n")
+        for start in range(0, matrix.shape[0], chunk_rows):
+            stop = min(start + chunk_rows, matrix.shape[0])
+            span = slice(matrix.indptr[start], matrix.indptr[stop])
+            rows = np.repeat(np.arange(start, stop), np.diff(matrix.indptr[start:stop + 1])) + 1
+            cols = matrix.indices[span] + 1
+            values = matrix.data[span]
+            columns = [rows, cols] + ([values.real, values.imag] if field == "complex" else [values])
+            np.savetxt(handle, np.column_stack(columns), fmt=["%d", "%d"] + [value_format] * (len(columns) - 2))
+
+def read_matrix_market(path):
+    """Read a coordinate file written by write_matrix_market (real, integer or complex field)."""
+    with open(path) as handle:
+        field = handle.readline().split()[3].lower()
+        line = handle.readline()
+        while line.startswith("%"):
+            line = handle.readline()
+        rows, cols, nnz = map(int, line.split())
+        dtype = np.int64 if field == "integer" else np.float64
+        if nnz == 0:  # loadtxt on an empty body gives the wrong shape, so skip it
+            return CSRMatrix((rows, cols), np.zeros(rows + 1, dtype=np.int64), [],
+                             np.zeros(0, dtype=np.complex128 if field == "complex" else dtype))
+        table = np.loadtxt(handle, ndmin=2, dtype=dtype)
+    values = table[:, 2] + 1j * table[:, 3] if field == "complex" else table[:, 2]
+    return CSRMatrix.from_triplets((rows, cols), table[:, 0].astype(np.int64) - 1,
+                                   table[:, 1].astype(np.int64) - 1, values, prune=False)
@@ -0,0 +1,603 @@
+# Native NumPy statevector simulator for the small circuits of Days 09-21 (no qiskit-aer needed)
+# The state is a complex128 array viewed as a tensor with one length-2 axis per qubit, plus a
+# leading batch axis that holds independent shot trajectories; gates update slices of that
+# tensor in place. Qubit q is bit q of the basis index, as in Qiskit, so statevectors and
+# counts line up with Aer's.
+
+from functools import lru_cache
+
+import numpy as np
+
+from qucode_measure import MeasurementSampler
+
+SQRT1_2 = 1 / np.sqrt(2)
+MAX_BATCH_AMPLITUDES = 2**22  # Shot trajectories simulated together: batch * 2^n stays below this
+
+def _rotation(axis):
+    def matrix(theta):
+        c, s = np.cos(theta / 2), np.sin(theta / 2)
+        if axis == "x":
+            return np.array([[c, -1j * s], [-1j * s, c]])
+        if axis == "y":
+            return np.array([[c, -s], [s, c]])
+        return np.array([[np.exp(-0.5j * theta), 0], [0, np.exp(0.5j * theta)]])
+    return matrix
+
+def _u(theta, phi, lam):
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return np.array([[c, -np.exp(1j * lam) * s], [np.exp(1j * phi) * s, np.exp(1j * (phi + lam)) * c]])
+
+GATES = {  # Single-qubit gate name -> function(*params) returning its 2x2 matrix
+    "x": lambda: np.array([[0, 1], [1, 0]]),
+    "y": lambda: np.array([[0, -1j], [1j, 0]]),
+    "z": lambda: np.array([[1, 0], [0, -1]]),
+    "h": lambda: np.array([[SQRT1_2, SQRT1_2], [SQRT1_2, -SQRT1_2]]),
+    "s": lambda: np.array([[1, 0], [0, 1j]]),
+    "sdg": lambda: np.array([[1, 0], [0, -1j]]),
+    "t": lambda: np.array([[1, 0], [0, np.exp(0.25j * np.pi)]]),
+    "tdg": lambda: np.array([[1, 0], [0, np.exp(-0.25j * np.pi)]]),
+    "sx": lambda: np.array([[1 + 1j, 1 - 1j], [1 - 1j, 1 + 1j]]) / 2,
+    "sxdg": lambda: np.array([[1 - 1j, 1 + 1j], [1 + 1j, 1 - 1j]]) / 2,
+    "p": lambda lam: np.array([[1, 0], [0, np.exp(1j * lam)]]),
+    "u1": lambda lam: np.array([[1, 0], [0, np.exp(1j * lam)]]),
+    "rx": _rotation("x"),
+    "ry": _rotation("y"),
+    "rz": _rotation("z"),
+    "u": _u,
+    "u3": _u,
+}
+CONTROLLED = {  # Controlled gate name -> single-qubit base gate (all but the last qubit are controls)
+    "cx": "x", "ccx": "x", "mcx": "x", "cy": "y", "cz": "z", "ccz": "z", "ch": "h",
+    "cs": "s", "csdg": "sdg", "csx": "sx", "cp": "p", "cu1": "p", "mcp": "p",
+    "crx": "rx", "cry": "ry", "crz": "rz",
+}
+SKIPPED = ("barrier", "delay", "id")
+
+@lru_cache(maxsize=1024)
+def gate_matrix(name, params=()):
+    """Read-only complex 2x2 matrix of a named single-qubit gate, cached per (name, params)."""
+    matrix = np.asarray(GATES[name](*params), dtype=complex)
+    matrix.setflags(write=False)
+    return matrix
+
+def _float_params(operation):
+    try:
+        return tuple(float(p) for p in operation.params)
+    except TypeError:
+        raise ValueError(f"Gate {operation.name} has unbound parameters; bind them before simulating") from None
+
+def _all_ones(operation):
+    return getattr(operation, "ctrl_state", None) in (None, 2**getattr(operation, "num_ctrl_qubits", 0) - 1)
+
+def compile_circuit(circuit, qubit_map=None, clbit_map=None):
+    """Flatten a QuantumCircuit into simulator instructions, expanding custom gates via their definitions.
+
+    Instructions are ("gate", target, controls, 2x2 matrix), ("swap", (q1, q2), controls),
+    ("unitary", qubits, matrix), ("measure", qubit, clbit), ("reset", qubit) and ("phase", factor).
+    """
+    program = []
+    if circuit.global_phase:  # Kept so statevectors match Qiskit's exactly, not just up to phase
+        try:
+            program.append(("phase", np.exp(1j * float(circuit.global_phase))))
+        except TypeError:
+            raise ValueError("Circuit has an unbound global phase; bind its parameters before simulating") from None
+    for instruction in circuit.data:
+        operation = instruction.operation
+        qubits = [circuit.find_bit(q).index for q in instruction.qubits]
+        clbits = [circuit.find_bit(c).index for c in instruction.clbits]
+        if qubit_map is not None:
+            qubits = [qubit_map[q] for q in qubits]
+        if clbit_map is not None:
+            clbits = [clbit_map[c] for c in clbits]
+        name = operation.name
+        if name in SKIPPED:
+            continue
+        if name == "measure":
+            program.append(("measure", qubits[0], clbits[0]))
+        elif name == "reset":
+            program.append(("reset", qubits[0]))
+        elif name in GATES:
+            program.append(("gate", qubits[0], (), gate_matrix(name, _float_params(operation))))
+        elif name in CONTROLLED and _all_ones(operation):
+            program.append(("gate", qubits[-1], tuple(qubits[:-1]),
+                            gate_matrix(CONTROLLED[name], _float_params(operation))))
+        elif name == "cu" and _all_ones(operation):  # Its 4th parameter is a phase on the controlled subspace
+            theta, phi, lam, gamma = _float_params(operation)
+            program.append(("gate", qubits[-1], tuple(qubits[:-1]),
+                            np.exp(1j * gamma) * gate_matrix("u", (theta, phi, lam))))
+        elif name in ("swap", "cswap"):
+            program.append(("swap", tuple(qubits[-2:]), tuple(qubits[:-2])))
+        elif hasattr(operation, "base_gate") and operation.base_gate.num_qubits == 1 and _all_ones(operation):
+            base = operation.base_gate
+            matrix = (gate_matrix(base.name, _float_params(base)) if base.name in GATES
+                      else np.asarray(base.to_matrix(), dtype=complex))
+            program.append(("gate", qubits[-1], tuple(qubits[:-1]), matrix))
+        elif name == "unitary" or getattr(operation, "definition", None) is None:
+            try:
+                matrix = np.asarray(operation.to_matrix(), dtype=complex)
+            except Exception as error:
+                raise NotImplementedError(f"Unsupported instruction {name!r}") from error
+            program.append(("gate", qubits[0], (), matrix) if len(qubits) == 1 else ("unitary", tuple(qubits), matrix))
+        else:  # Composite gate (oracle, diffusion, QFT...): simulate its definition on the mapped qubits
+            program.extend(compile_circuit(operation.definition, qubits, clbits))
+    return program
+
+# In-place tensor updates; axis 0 is the batch, axis 1 + (n - 1 - q) holds qubit q
+def _index(num_qubits, fixed):
+    index = [slice(None)] * (num_qubits + 1)
+    for qubit, value in fixed.items():
+        index[num_qubits - qubit] = value
+    return tuple(index)
+
+def apply_gate(tensor, num_qubits, target, controls, matrix):
+    """Apply a (multi-)controlled single-qubit gate by updating the two target slices in place."""
+    fixed = dict.fromkeys(controls, 1)
+    a = tensor[_index(num_qubits, {**fixed, target: 0})]
+    b = tensor[_index(num_qubits, {**fixed, target: 1})]
+    (m00, m01), (m10, m11) = matrix
+    if m01 == 0 and m10 == 0:  # Diagonal (Z, S, T, P, RZ): only touch what changes
+        if m00 != 1:
+            a *= m00
+        if m11 != 1:
+            b *= m11
+    elif m00 == 0 and m11 == 0:  # Anti-diagonal (X, Y): swap the halves
+        saved = a.copy()
+        a[...] = b
+        b[...] = saved
+        if m01 != 1:
+            a *= m01
+        if m10 != 1:
+            b *= m10
+    else:
+        saved = a.copy()
+        a *= m00
+        a += m01 * b
+        b *= m11
+        b += m10 * saved
+
+def apply_swap(tensor, num_qubits, qubits, controls=()):
+    fixed = dict.fromkeys(controls, 1)
+    first, second = qubits
+    upper = _index(num_qubits, {**fixed, first: 0, second: 1})
+    lower = _index(num_qubits, {**fixed, first: 1, second: 0})
+    saved = tensor[upper].copy()
+    tensor[upper] = tensor[lower]
+    tensor[lower] = saved
+
+def apply_unitary(tensor, num_qubits, qubits, matrix):
+    """Dense k-qubit unitary (Qiskit order: bit j of the matrix index is qubits[j])."""
+    k = len(qubits)
+    axes = [num_qubits - q for q in reversed(qubits)]  # Most significant matrix bit first
+    result = np.tensordot(np.asarray(matrix).reshape((2,) * (2 * k)), tensor, axes=(list(range(k, 2 * k)), axes))
+    tensor[...] = np.moveaxis(result, list(range(k)), axes)
+
+def _project(tensor, num_qubits, qubit, rng):
+    """Measure one qubit in every trajectory, collapse in place, and return the outcomes."""
+    zero, one = _index(num_qubits, {qubit: 0}), _index(num_qubits, {qubit: 1})
+    batch = tensor.shape[0]
+    p1 = (np.abs(tensor[one])**2).reshape(batch, -1).sum(axis=1)
+    outcomes = rng.random(batch) < p1
+    shape = (batch,) + (1,) * (num_qubits - 1)
+    kept = np.where(outcomes, p1, 1 - p1)
+    scale = np.divide(1, np.sqrt(kept), out=np.zeros(batch), where=kept > 0)
+    tensor[zero] *= np.where(outcomes, 0, scale).reshape(shape)
+    tensor[one] *= np.where(outcomes, scale, 0).reshape(shape)
+    return outcomes
+
+def run_program(program, tensor, num_qubits, clbits, rng):
+    """Execute compiled instructions on a (batch, 2, ..., 2) tensor; measurements fill clbits (batch, num_clbits)."""
+    for instruction in program:
+        kind = instruction[0]
+        if kind == "gate":
+            apply_gate(tensor, num_qubits, *instruction[1:])
+        elif kind == "swap":
+            apply_swap(tensor, num_qubits, *instruction[1:])
+        elif kind == "unitary":
+            apply_unitary(tensor, num_qubits, *instruction[1:])
+        elif kind == "phase":
+            tensor *= instruction[1]
+        elif kind == "measure":
+            clbits[:, instruction[2]] = _project(tensor, num_qubits, instruction[1], rng)
+        else:  # reset: measure, then flip the trajectories that found |1>
+            ones = _project(tensor, num_qubits, instruction[1], rng)
+            zero, one = _index(num_qubits, {instruction[1]: 0}), _index(num_qubits, {instruction[1]: 1})
+            flipped = tensor[zero][ones].copy()
+            tensor[zero][ones] = tensor[one][ones]
+            tensor[one][ones] = flipped
+    return tensor
+
+class SimulationResult:
+    """Statevector and measurement counts of one simulate() call.
+
+    For circuits whose measurements are all terminal the statevector is the state just before
+    measurement and `sampler` holds its measurement distribution, so sample_counts() can draw
+    more shots without simulating again. Otherwise it is the final state of the first trajectory.
+    """
+    def __init__(self, statevector, outcomes, frequencies, num_clbits, registers, sampler=None, clbit_qubits=None):
+        self.statevector = statevector
+        self.outcomes = outcomes  # Distinct classical outcomes (clbit c = bit c), ascending
+        self.frequencies = frequencies  # How often each outcome occurred
+        self.num_clbits = num_clbits
+        self.registers = registers  # Clbit indices per classical register, in declaration order
+        self.sampler = sampler  # MeasurementSampler over the measured qubits (terminal measurements only)
+        self.clbit_qubits = clbit_qubits  # {clbit: position of its qubit in the sampler's outcome}
+
+    def get_statevector(self):
+        return self.statevector
+
+    @property
+    def histogram(self):
+        """Integer histogram over all 2^num_clbits outcomes."""
+        histogram = np.zeros(2**self.num_clbits, dtype=np.int64)
+        histogram[self.outcomes] = self.frequencies
+        return histogram
+
+    def _label(self, value):
+        registers = self.registers or [list(range(self.num_clbits))]
+        return " ".join("".join(str(value >> bit & 1) for bit in reversed(bits)) for bits in reversed(registers))
+
+    def get_counts(self):
+        """Qiskit-style {bitstring: count}, registers separated by spaces (last register first)."""
+        return {self._label(int(value)): int(count) for value, count in zip(self.outcomes, self.frequencies)}
+
+    def _tally(self, histogram):
+        """(outcomes, frequencies) in clbit values (clbit c = bit c) of a sampler count histogram."""
+        observed = np.flatnonzero(histogram)
+        values = np.zeros(len(observed), dtype=np.int64)
+        for clbit, position in self.clbit_qubits.items():
+            values |= (observed >> position & 1) << clbit
+        outcomes, inverse = np.unique(values, return_inverse=True)  # Overwritten clbits can merge outcomes
+        return outcomes, np.bincount(inverse, weights=histogram[observed]).astype(np.int64)
+
+    def sample_counts(self, shots, seed=None):
+        """Fresh Qiskit-style counts of `shots` shots drawn from the cached final probabilities."""
+        if self.sampler is None:
+            raise ValueError("Only circuits whose measurements are all terminal can be resampled")
+        outcomes, frequencies = self._tally(self.sampler.counts(shots, seed))
+        return {self._label(int(value)): int(count) for value, count in zip(outcomes, frequencies)}
+
+def split_terminal_measurements(program):
+    """(unitary part, [(qubit, clbit), ...]) if every measurement is terminal, else None.
+
+    A measurement is terminal when no later gate touches its qubit and the circuit has no reset;
+    gates on other qubits commute with it, so they can all run before the measurements.
+    """
+    unitary_part, measurements, measured = [], [], set()
+    for instruction in program:
+        kind = instruction[0]
+        if kind == "reset":
+            return None
+        if kind == "measure":
+            measurements.append(instruction[1:])
+            measured.add(instruction[1])
+            continue
+        if kind == "gate":
+            touched = (instruction[1],) + instruction[2]
+        elif kind == "swap":
+            touched = instruction[1] + instruction[2]
+        elif kind == "unitary":
+            touched = instruction[1]
+        else:  # Global phase
+            touched = ()
+        if measured.intersection(touched):
+            return None
+        unitary_part.append(instruction)
+    return unitary_part, measurements
+
+def _simulate_terminal(circuit, unitary_part, measurements, shots, seed, registers):
+    """Run the unitary part once and draw every shot from the final probabilities."""
+    num_qubits = circuit.num_qubits
+    state = np.zeros((1, 2**num_qubits), dtype=complex)
+    state[0, 0] = 1
+    run_program(unitary_part, state.reshape((1,) + (2,) * num_qubits), num_qubits, None, None)
+    qubits = list(dict.fromkeys(qubit for qubit, _ in measurements))
+    clbit_qubits = {clbit: qubits.index(qubit) for qubit, clbit in measurements}  # A later measurement wins
+    sampler = MeasurementSampler(state[0], qubits)
+    result = SimulationResult(state[0], None, None, circuit.num_clbits, registers, sampler, clbit_qubits)
+    result.outcomes, result.frequencies = result._tally(sampler.counts(shots, seed))
+    return result
+
+def simulate(circuit, shots=None, seed=None):
+    """Simulate a QuantumCircuit; with shots, circuits containing measurements are sampled that many times.
+
+    When every measurement is terminal the unitary part runs once, the statevector is the
+    pre-measurement state and all shots are drawn from its probabilities. Otherwise shots run as
+    trajectories simulated together along the batch axis, so mid-circuit measurements and resets
+    are exact and each gate is still one vectorized update per batch.
+    """
+    program = compile_circuit(circuit)
+    num_qubits, num_clbits = circuit.num_qubits, circuit.num_clbits
+    registers = [[circuit.find_bit(bit).index for bit in register] for register in circuit.cregs]
+    measured = any(instruction[0] in ("measure", "reset") for instruction in program)
+    terminal = split_terminal_measurements(program) if measured else None
+    if terminal is not None:
+        return _simulate_terminal(circuit, *terminal, shots or 1, seed, registers)
+    trajectories = shots if shots and measured else 1
+    batch_size = max(1, MAX_BATCH_AMPLITUDES >> num_qubits)
+    rng = np.random.default_rng(seed)
+    statevector, values = None, []
+    for start in range(0, trajectories, batch_size):
+        batch = min(batch_size, trajectories - start)
+        state = np.zeros((batch, 2**num_qubits), dtype=complex)
+        state[:, 0] = 1
+        tensor = state.reshape((batch,) + (2,) * num_qubits)
+        clbits = np.zeros((batch, num_clbits), dtype=bool)
+        run_program(program, tensor, num_qubits, clbits, rng)
+        if statevector is None:
+            statevector = state[0].copy()
+        if measured and num_clbits:
+            values.append(clbits @ (1 << np.arange(num_clbits, dtype=np.int64)))
+    outcomes, frequencies = np.unique(np.concatenate(values), return_counts=True) if values else ([], [])
+    return SimulationResult(statevector, np.asarray(outcomes, dtype=np.int64), np.asarray(frequencies, dtype=np.int64),
+                            num_clbits, registers)
+
+# Unitaries (Day09): the batch axis holds basis states instead of shot trajectories
+DENSE_UNITARY_MAX_QUBITS = 12  # 4^12 amplitudes = 256 MB; wider circuits get the lazy operator
+
+class CircuitOperator:
+    """The unitary of a measurement-free circuit as a linear operator, never stored as a matrix.
+
+    The circuit is compiled once; applying it runs the compiled gates on a batch of vectors, so
+    to_dense() is a single sweep over the circuit with all 2^n basis columns as the batch.
+    """
+    def __init__(self, circuit):
+        self.program = compile_circuit(circuit)
+        if any(instruction[0] in ("measure", "reset") for instruction in self.program):
+            raise ValueError("Circuits with measurements or resets have no unitary")
+        self.num_qubits = circuit.num_qubits
+
+    @property
+    def shape(self):
+        return 2**self.num_qubits, 2**self.num_qubits
+
+    def apply(self, vectors):
+        """Apply to one vector (shape (dim,)) or a batch of row vectors (shape (batch, dim))."""
+        vectors = np.asarray(vectors)
+        if vectors.shape[-1] != self.shape[0]:
+            raise ValueError(f"Expected vectors of length {self.shape[0]}, got {vectors.shape[-1]}")
+        state = np.array(vectors, dtype=complex, ndmin=2)  # Always a copy: gates update it in place
+        tensor = state.reshape((len(state),) + (2,) * self.num_qubits)
+        run_program(self.program, tensor, self.num_qubits, None, None)
+        return state if vectors.ndim == 2 else state[0]
+
+    def __matmul__(self, other):
+        return self.apply(np.asarray(other).T).T if np.ndim(other) == 2 else self.apply(other)
+
+    def column(self, k):
+        """U|k>; column 0 is the statevector the circuit prepares from |0...0>."""
+        basis = np.zeros(self.shape[0], dtype=complex)
+        basis[k] = 1
+        return self.apply(basis)
+
+    def to_dense(self, max_elements=4**DENSE_UNITARY_MAX_QUBITS):
+        rows, cols = self.shape
+        if rows * cols > max_elements:
+            raise MemoryError(f"Refusing to materialize a {rows}x{cols} operator")
+        return self.apply(np.eye(rows)).T  # Row k of apply(I) is U applied to basis vector k
+
+def unitary(circuit, lazy=None):
+    """(U, statevector) of a measurement-free circuit from one pass over its gates.
+
+    The statevector is U's first column. With lazy=True, or by default for circuits wider than
+    DENSE_UNITARY_MAX_QUBITS, U is returned as a CircuitOperator instead of a dense matrix.
+    """
+    operator = CircuitOperator(circuit)
+    if lazy is None:
+        lazy = circuit.num_qubits > DENSE_UNITARY_MAX_QUBITS
+    if lazy:
+        return operator, operator.column(0)
+    matrix = operator.to_dense()
+    return matrix, matrix[:, 0].copy()
+
+if __name__ == "__main__":
+    import time
+    from qiskit import QuantumCircuit, transpile
+    from qiskit.circuit.library import UnitaryGate
+    try:
+        from qiskit.circuit.library import real_amplitudes
+    except ImportError:  # Qiskit < 2.1 only has the class
+        from qiskit.circuit.library import RealAmplitudes as real_amplitudes
+
+    from qucode_logic import Netlist
+    from qucode_oracles import compile_phase_oracle
+
+    # Days that deliberately stay on qiskit-aer, and why
+    SKIPPED_DAYS = {
+        "Day16 Ex1 Shor": "qiskit Shor algorithm class",
+        "Day18 Ex1 VQE": "VQE on an Aer estimator",
+        "Day20 Ex1 noise": "depolarizing noise model",
+    }
+
+    def inverse_qft(num_qubits, label="QFT†"):
+        qft = QuantumCircuit(num_qubits)
+        for j in range(num_qubits):
+            for k in range(j):
+                qft.cp(-np.pi / 2 ** (j - k), k, j)
+            qft.h(j)
+        for qubit in range(num_qubits // 2):
+            qft.swap(qubit, num_qubits - qubit - 1)
+        return qft.to_gate(label=label)
+
+    def diffusion(num_qubits):
+        circuit = QuantumCircuit(num_qubits)
+        circuit.h(range(num_qubits))
+        circuit.x(range(num_qubits))
+        circuit.h(num_qubits - 1)
+        circuit.mcx(list(range(num_qubits - 1)), num_qubits - 1)
+        circuit.h(num_qubits - 1)
+        circuit.x(range(num_qubits))
+        circuit.h(range(num_qubits))
+        return circuit.to_gate(label="Diffusion")
+
+    def day_circuits():
+        """Every circuit the Day09-21 scripts simulate, rebuilt gate for gate (importing a day script
+        would run the whole script). Parameterized circuits are bound to fixed values."""
+        circuits = {}
+
+        qc = QuantumCircuit(2)
+        qc.x(0)
+        qc.y(1)
+        qc.z(1)
+        qc.h(0)
+        qc.p(np.pi / 4, 1)
+        qc.cx(0, 1)
+        circuits["Day09 Ex1 gates"] = qc
+
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.h(1)
+        qc.p(3.14 / 2, 0)
+        qc.cx(0, 1)
+        qc.h(0)
+        qc.measure_all()
+        circuits["Day10 Ex1 interference"] = qc
+
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.measure_all()
+        circuits["Day11 Ex1 Bell pair"] = qc
+
+        qc = QuantumCircuit(1)
+        qc.h(0)
+        qc.measure_all()
+        circuits["Day12 Ex1 collapse"] = qc
+
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        circuits["Day12 Ex1 cloning"] = qc
+
+        qc = QuantumCircuit(2, 2)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.measure([0, 1], [0, 1])
+        circuits["Day13 Ex1 circuit model"] = qc
+
+        qc = QuantumCircuit(3, 3)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.cx(1, 2)
+        qc.measure([0, 1, 2], [0, 1, 2])
+        circuits["Day13 Ex1 cluster state"] = qc
+
+        qc = QuantumCircuit(1, 1)
+        qc.h(0)
+        qc.measure(0, 0)
+        circuits["Day14 Ex1 first circuit"] = qc
+
+        qc = QuantumCircuit(4, 3)
+        phase = UnitaryGate(np.array([[1, 0], [0, np.exp(1j * 2 * np.pi * np.pi / 3)]]))
+        for qubit in range(3):
+            qc.h(qubit)
+        for qubit in range(3):
+            qc.append(phase.control(1), [qubit, 3])
+        qc.append(inverse_qft(3), range(3))
+        qc.measure(range(3), range(3))
+        circuits["Day15 Ex1 phase estimation"] = qc
+
+        qc = QuantumCircuit(5, 4)
+        for qubit in range(4):
+            qc.h(qubit)
+        for qubit in range(4):
+            residue = 2 ** 2 ** qubit % 15
+            qc.append(UnitaryGate([[1, 0], [0, np.exp(2j * np.pi * residue / 15)]]).control(1), [qubit, 4])
+        for j in range(4):
+            for k in range(j):
+                qc.cp(np.pi / 2 ** (j - k), k, j)
+            qc.h(j)
+        for qubit in range(2):
+            qc.swap(qubit, 3 - qubit)
+        qc.measure(range(4), range(4))
+        circuits["Day16 Ex2 period finding"] = qc
+
+        oracle = QuantumCircuit(3)
+        oracle.x(1)
+        oracle.h(2)
+        oracle.mcx([0, 1], 2)
+        oracle.h(2)
+        oracle.x(1)
+        qc = QuantumCircuit(3, 3)
+        qc.h(range(3))
+        for _ in range(int(np.sqrt(2**3))):
+            qc.append(oracle.to_gate(label="Oracle"), range(3))
+            qc.append(diffusion(3), range(3))
+        qc.measure(range(3), range(3))
+        circuits["Day17 Ex1 Grover"] = qc
+
+        net = Netlist()
+        x = [net.input(f"x{i}") for i in range(4)]
+        net.output("f", net.AND(net.XOR(x[0], x[1]), net.OR(x[2], net.NOT(x[3]))))
+        predicate = compile_phase_oracle(net)
+        qc = QuantumCircuit(predicate.num_qubits, 4)
+        qc.h(range(4))
+        qc.append(predicate.gate, range(predicate.num_qubits))  # One iteration: 6 of 16 inputs are solutions
+        qc.append(diffusion(4), range(4))
+        qc.measure(range(4), range(4))
+        circuits["Day17 Ex1 predicate"] = qc
+
+        qc = QuantumCircuit(1)
+        qc.ry(0.7, 0)
+        circuits["Day18 Ex2/Ex3 ansatz"] = qc
+
+        qc = QuantumCircuit(3)
+        for i, value in enumerate([0.4, 1.7, 2.9]):
+            qc.ry(value, i)
+        circuits["Day19 Ex1 data encoding"] = qc
+
+        qc = QuantumCircuit(3)
+        for i in range(3):
+            qc.ry(0.5, i)
+        for i in range(2):
+            qc.cx(i, i + 1)
+        circuits["Day19 Ex1 QNN"] = qc
+
+        ansatz = real_amplitudes(3)
+        circuits["Day21 Ex1 portfolio"] = ansatz.assign_parameters(np.linspace(0.1, 1.2, ansatz.num_parameters))
+
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        circuits["Day21 Ex1 chemistry"] = qc
+
+        qc = QuantumCircuit(3)
+        for qubit in range(3):
+            qc.ry(0.5, qubit)
+        for qubit in range(2):
+            qc.cx(qubit, qubit + 1)
+        circuits["Day21 Ex1 QNN"] = qc
+
+        qc = QuantumCircuit(3)
+        qc.h(range(3))
+        circuits["Day21 Ex1 optimization"] = qc
+        return circuits
+
+    def latency(function, repeats=20):
+        times = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            function()
+            times.append(time.perf_counter() - start)
+        return 1e3 * float(np.median(times))
+
+    try:
+        from qiskit_aer import AerSimulator
+        aer = AerSimulator()
+    except ImportError:
+        aer = None
+    print("Per-circuit latency, 1024 shots when the circuit measures (median ms)")
+    print(f"{'circuit':<28} {'numpy':>8} {'aer':>8}")
+    for label, qc in day_circuits().items():
+        ours = latency(lambda: simulate(qc, shots=1024))
+        if aer is None:
+            theirs = f"{'n/a':>8}"
+        else:
+            def run_aer():
+                circuit = qc if qc.num_clbits else qc.copy()
+                if not circuit.num_clbits:
+                    circuit.save_statevector()
+                aer.run(transpile(circuit, aer), shots=1024).result()
+            theirs = f"{latency(run_aer):8.2f}"
+        print(f"{label:<28} {ours:8.2f} {theirs}")
+    for label, reason in SKIPPED_DAYS.items():
+        print(f"{label:<28} skipped (stays on qiskit-aer: {reason})")
@@ -0,0 +1,339 @@
+# Streaming statistics helpers shared by the probability scripts (Day02, Day03)
+# Data arrives in chunks, so nothing here needs the full sample in memory.
+
+import math
+from functools import partial
+
+import numpy as np
+
+from qucode_parallel import process_pool
+
+class QuantileSketch:
+    """Mergeable quantile sketch with bounded relative error (logarithmic buckets, DDSketch style)."""
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.positive = {}  # Bucket index -> count, for values > 0
+        self.negative = {}  # Same for |value| of values < 0
+        self.zero_count = 0
+        self.count = 0
+
+    def _add_to(self, store, magnitudes):
+        indices = np.ceil(np.log(magnitudes) / self.log_gamma).astype(np.int64)
+        keys, counts = np.unique(indices, return_counts=True)
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            store[key] = store.get(key, 0) + count
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        self._add_to(self.positive, values[values > 0])
+        self._add_to(self.negative, -values[values < 0])
+        self.zero_count += int(np.count_nonzero(values == 0))
+        self.count += values.size
+        return self
+
+    def merge(self, other):
+        """Combine another sketch into this one (exact: bucket counts simply add up)."""
+        if other.gamma != self.gamma:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for mine, theirs in ((self.positive, other.positive), (self.negative, other.negative)):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        return self
+
+    def quantile(self, q):
+        """Value at quantile q in [0, 1], within `relative_accuracy` of the true sample quantile."""
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile must be in [0, 1], got {q}")
+        if self.count == 0:
+            return float("nan")
+        rank = q * (self.count - 1)
+        seen = 0
+        # Walk the buckets from the most negative value to the most positive one
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -2 * self.gamma**key / (self.gamma + 1)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return 2 * self.gamma**key / (self.gamma + 1)
+        # The rank is past the last bucket (NaNs are counted but never bucketed): return the largest
+        # value held, which may be zero or negative when there are no positive buckets
+        if self.positive:
+            return 2 * self.gamma**max(self.positive) / (self.gamma + 1)
+        if self.zero_count:
+            return 0.0
+        if self.negative:
+            return -2 * self.gamma**min(self.negative) / (self.gamma + 1)
+        return float("nan")  # Only NaNs were added
+
+class RunningStats:
+    """One-pass mean/variance accumulator (Welford updates, Chan merges), optionally with skewness, kurtosis and quantiles."""
+    def __init__(self, higher_moments=False, quantiles=False, relative_accuracy=0.01):
+        self.higher_moments = higher_moments
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared deviations from the mean
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sketch = QuantileSketch(relative_accuracy) if quantiles else None
+
+    def push(self, value):
+        """Add a single value (classic Welford step)."""
+        chunk = RunningStats(self.higher_moments)
+        chunk.count, chunk.mean = 1, float(value)
+        chunk.min = chunk.max = float(value)
+        self._combine(chunk)
+        if self.sketch is not None:
+            self.sketch.update([value])
+        return self
+
+    def update(self, values):
+        """Add a whole chunk: summarize it with NumPy, then merge the summary in."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return self
+        chunk = RunningStats(self.higher_moments)
+        chunk.count = values.size
+        chunk.mean = float(values.mean())
+        deviations = values - chunk.mean
+        squared = deviations * deviations
+        chunk.m2 = float(squared.sum())
+        if self.higher_moments:
+            chunk.m3 = float((squared * deviations).sum())
+            chunk.m4 = float((squared * squared).sum())
+        chunk.min, chunk.max = float(values.min()), float(values.max())
+        self._combine(chunk)
+        if self.sketch is not None:
+            self.sketch.update(values)
+        return self
+
+    def merge(self, other):
+        """Combine the summary of another accumulator (e.g. from a worker process) into this one."""
+        if other.higher_moments != self.higher_moments or (other.sketch is None) != (self.sketch is None):
+            raise ValueError("Cannot merge accumulators tracking different statistics")
+        self._combine(other)
+        if self.sketch is not None:
+            self.sketch.merge(other.sketch)
+        return self
+
+    def _combine(self, other):
+        # Pairwise update formulas of Chan et al. for the central moment sums
+        if other.count == 0:
+            return
+        n_a, n_b = self.count, other.count
+        n = n_a + n_b
+        delta = other.mean - self.mean
+        delta_n = delta / n
+        term = delta * delta_n * n_a * n_b
+        if self.higher_moments:
+            self.m4 += (other.m4 + term * delta_n * delta_n * (n_a * n_a - n_a * n_b + n_b * n_b)
+                        + 6 * delta_n * delta_n * (n_a * n_a * other.m2 + n_b * n_b * self.m2)
+                        + 4 * delta_n * (n_a * other.m3 - n_b * self.m3))
+            self.m3 += (other.m3 + term * delta_n * (n_a - n_b)
+                        + 3 * delta_n * (n_a * other.m2 - n_b * self.m2))
+        self.m2 += other.m2 + term
+        self.mean += delta_n * n_b
+        self.count = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def variance(self, ddof=0):
+        return self.m2 / (self.count - ddof) if self.count > ddof else float("nan")
+
+    def std(self, ddof=0):
+        return math.sqrt(self.variance(ddof))
+
+    def skewness(self):
+        if not self.higher_moments:
+            raise ValueError("Create the accumulator with higher_moments=True")
+        return math.sqrt(self.count) * self.m3 / self.m2**1.5 if self.m2 > 0 else float("nan")
+
+    def kurtosis(self):
+        """Excess kurtosis (0 for a normal distribution)."""
+        if not self.higher_moments:
+            raise ValueError("Create the accumulator with higher_moments=True")
+        return self.count * self.m4 / (self.m2 * self.m2) - 3 if self.m2 > 0 else float("nan")
+
+    def quantile(self, q):
+        if self.sketch is None:
+            raise ValueError("Create the accumulator with quantiles=True")
+        return self.sketch.quantile(q)
+
+    def __str__(self):
+        return f"RunningStats(count={self.count}, mean={self.mean:.6g}, std={self.std():.6g})"
+
+def _summarize_chunk(options, chunk):
+    return RunningStats(**options).update(chunk)
+
+def parallel_stats(chunks, processes=None, **options):
+    """Fill a RunningStats from an iterable of chunks, summarizing the chunks in a process pool."""
+    total = RunningStats(**options)
+    with process_pool(processes) as pool:
+        for partial_stats in pool.imap_unordered(partial(_summarize_chunk, options), chunks):
+            total.merge(partial_stats)
+    return total
+
+class StreamingHistogram:
+    """Fixed-bin histogram filled chunk by chunk; goodness-of-fit tests run on the bin counts only."""
+    def __init__(self, low, high, bins):
+        self.edges = np.linspace(low, high, bins + 1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+
+    @property
+    def total(self):
+        return int(self.counts.sum()) + self.underflow + self.overflow
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        bins = len(self.counts)
+        low, high = self.edges[0], self.edges[-1]
+        indices = np.floor((values - low) * (bins / (high - low))).astype(np.int64)
+        self.underflow += int(np.count_nonzero(indices < 0))
+        self.overflow += int(np.count_nonzero(indices >= bins))
+        inside = indices[(indices >= 0) & (indices < bins)]
+        self.counts += np.bincount(inside, minlength=bins)
+        return self
+
+    def merge(self, other):
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Cannot merge histograms with different bins")
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+    def density(self):
+        """Bin heights normalized like plt.hist(..., density=True) over all samples."""
+        return self.counts / (self.total * np.diff(self.edges))
+
+    def _observed_expected(self, cdf):
+        # Under- and overflow act as two extra bins, so the expected counts sum to the total
+        observed = np.concatenate(([self.underflow], self.counts, [self.overflow]))
+        probabilities = np.diff(np.concatenate(([0.0], cdf(self.edges), [1.0])))
+        return observed, probabilities * self.total
+
+    def chi_square(self, cdf, min_expected=5):
+        """Pearson chi-square statistic, degrees of freedom and p-value against a model CDF."""
+        from scipy.stats import chi2
+        observed, expected = self._observed_expected(cdf)
+        keep = expected >= min_expected  # Sparse tail bins make the chi-square approximation invalid
+        statistic = float(((observed[keep] - expected[keep]) ** 2 / expected[keep]).sum())
+        dof = int(np.count_nonzero(keep)) - 1
+        return statistic, dof, float(chi2.sf(statistic, dof))
+
+    def ks_statistic(self, cdf):
+        """Kolmogorov-Smirnov distance evaluated at the bin edges, with its asymptotic p-value."""
+        from scipy.stats import kstwobign
+        empirical = (self.underflow + np.cumsum(self.counts)) / self.total
+        empirical = np.concatenate(([self.underflow / self.total], empirical))
+        distance = float(np.abs(empirical - cdf(self.edges)).max())
+        return distance, float(kstwobign.sf(distance * math.sqrt(self.total)))
+
+def _histogram_task(low, high, bins, distribution, params, task):
+    seed, size = task
+    rng = np.random.default_rng(seed)
+    return StreamingHistogram(low, high, bins).update(getattr(rng, distribution)(size=size, **params))
+
+def sample_histogram(low, high, bins, total, distribution="normal", params=None,
+                     chunk_size=1_000_000, seed=None, processes=None):
+    """Draw `total` samples in chunks (each with its own spawned seed) straight into a histogram.
+
+    The chunks are generated inside worker processes when `processes` is not 1. Because every chunk
+    has an independent SeedSequence child, the counts are identical for any number of processes.
+    """
+    sizes = [chunk_size] * (total // chunk_size) + ([total % chunk_size] if total % chunk_size else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    task = partial(_histogram_task, low, high, bins, distribution, params or {})
+    histogram = StreamingHistogram(low, high, bins)
+    if processes == 1:
+        for chunk in map(task, zip(seeds, sizes)):
+            histogram.merge(chunk)
+        return histogram
+    with process_pool(processes) as pool:
+        for chunk in pool.imap_unordered(task, zip(seeds, sizes)):
+            histogram.merge(chunk)
+    return histogram
+
+def bayes_posterior(prior, sensitivity, false_positive_rate, out=None):
+    """P(Disease | Positive) for broadcastable arrays of priors and test characteristics.
+
+    Written as 1 / (1 + (fpr / sensitivity) * (1 - prior) / prior) so that the small per-axis
+    factors are combined first and only one full-size array (optionally `out`) is ever allocated.
+    """
+    prior = np.asarray(prior)
+    dtype = np.result_type(prior, sensitivity, false_positive_rate, np.float32)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inverse_prior_odds = ((1 - prior) / prior).astype(dtype, copy=False)
+        inverse_likelihood_ratio = (np.asarray(false_positive_rate, dtype) / np.asarray(sensitivity, dtype))
+        shape = np.broadcast_shapes(inverse_prior_odds.shape, inverse_likelihood_ratio.shape)
+        if out is None:
+            out = np.empty(shape, dtype=dtype)
+        np.multiply(inverse_prior_odds, inverse_likelihood_ratio, out=out)
+        out += 1
+        np.reciprocal(out, out=out)
+    return out
+
+def sequential_bayes(prior, sensitivity, false_positive_rate, results, trajectory=False):
+    """Posterior after a series of independent test results (True = positive), updated in log-odds space.
+
+    Probabilities close to 0 or 1 stay accurate because nothing is multiplied out in linear space.
+    With `trajectory=True` the posterior after every test is returned along a new last axis.
+    """
+    prior = np.asarray(prior, dtype=np.float64)
+    sensitivity = np.asarray(sensitivity, dtype=np.float64)
+    false_positive_rate = np.asarray(false_positive_rate, dtype=np.float64)
+    results = np.asarray(results, dtype=bool)
+    with np.errstate(divide="ignore"):
+        log_odds = np.log(prior) - np.log1p(-prior)
+        positive_step = np.log(sensitivity) - np.log(false_positive_rate)
+        negative_step = np.log1p(-sensitivity) - np.log1p(-false_positive_rate)
+    if trajectory:
+        positives = np.cumsum(results)
+        negatives = np.arange(1, len(results) + 1) - positives
+        log_odds = log_odds[..., None]
+        positive_step, negative_step = positive_step[..., None], negative_step[..., None]
+    else:
+        positives = np.count_nonzero(results)
+        negatives = len(results) - positives
+    # A certain test has an infinite step; only apply it when that kind of result occurred (0 * inf is nan)
+    with np.errstate(invalid="ignore"):
+        log_odds = (log_odds + np.where(positives > 0, positives * positive_step, 0)
+                    + np.where(negatives > 0, negatives * negative_step, 0))
+    return np.exp(-np.logaddexp(0, -log_odds))  # Numerically stable logistic function
+
+def _bernoulli_task(probability, as_counts, task):
+    seed, size = task
+    rng = np.random.default_rng(seed)
+    if as_counts:
+        return int(rng.binomial(size, probability))
+    return (rng.random(size) < probability).astype(np.uint8)
+
+def sample_bernoulli(total, probability, seed=None, chunk_size=1_000_000, processes=1, counts=False):
+    """`total` 0/1 outcomes (1 with `probability`) as a uint8 array, or just the number of ones.
+
+    Work is split into chunks with spawned seeds, so a given seed gives the same result whether the
+    chunks run in this process (`processes=1`) or are sharded across a process pool.
+    """
+    sizes = [chunk_size] * (total // chunk_size) + ([total % chunk_size] if total % chunk_size else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    task = partial(_bernoulli_task, probability, counts)
+    if processes == 1:
+        parts = list(map(task, zip(seeds, sizes)))
+    else:
+        with process_pool(processes) as pool:
+            parts = pool.map(task, zip(seeds, sizes))  # map keeps chunk order, so arrays stay reproducible
+    if counts:
+        return sum(parts)
+    return np.concatenate(parts) if parts else np.zeros(0, dtype=np.uint8)
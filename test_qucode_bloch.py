@@ -0,0 +1,29 @@
+# Tests for qucode_bloch (run with: python -m pytest -q)
+
+import numpy as np
+import pytest
+
+from qucode_bloch import reduced_bloch_vectors
+
+PAULIS = (np.array([[0, 1], [1, 0]]), np.array([[0, -1j], [1j, 0]]), np.array([[1, 0], [0, -1]]))
+
+def partial_trace_bloch(psi, q, num_qubits):
+    """Reference: Bloch vector of qubit q from its explicit reduced density matrix."""
+    tensor = np.moveaxis(psi.reshape((2,) * num_qubits), num_qubits - 1 - q, 0).reshape(2, -1)
+    rho = tensor @ tensor.conj().T
+    return [np.trace(rho @ pauli).real for pauli in PAULIS]
+
+def test_reduced_bloch_vectors_match_partial_traces():
+    rng = np.random.default_rng(21)
+    psi = rng.standard_normal((2, 2**5)) + 1j * rng.standard_normal((2, 2**5))
+    psi /= np.linalg.norm(psi, axis=-1, keepdims=True)
+    vectors = reduced_bloch_vectors(psi)
+    assert vectors.shape == (2, 5, 3)
+    for b in range(2):
+        for q in range(5):
+            assert np.allclose(vectors[b, q], partial_trace_bloch(psi[b], q, 5))
+
+@pytest.mark.parametrize("dim", [0, 3, 6, 12])
+def test_reduced_bloch_vectors_reject_non_power_of_two_lengths(dim):
+    with pytest.raises(ValueError):
+        reduced_bloch_vectors(np.ones(dim))
@@ -0,0 +1,36 @@
+# Tests for qucode_linalg (run with: python -m pytest -q)
+
+import random
+
+import numpy as np
+import pytest
+
+from qucode_linalg import matrix_multiply
+
+random.seed(11)
+
+def random_matrix(rows, cols, make):
+    return [[make() for _ in range(cols)] for _ in range(rows)]
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+@pytest.mark.parametrize("make", [random.random, lambda: complex(random.random(), random.random())])
+def test_matrix_multiply_matches_numpy(use_numpy, make):
+    A, B = random_matrix(7, 70, make), random_matrix(70, 5, make)
+    assert np.allclose(matrix_multiply(A, B, use_numpy), np.asarray(A) @ np.asarray(B))
+
+def test_integer_products_stay_exact_above_the_numpy_threshold():
+    A = random_matrix(32, 32, lambda: random.randrange(-2**40, 2**40))
+    B = random_matrix(32, 32, lambda: random.randrange(-2**40, 2**40))
+    exact = [[sum(a * b for a, b in zip(row, column)) for column in zip(*B)] for row in A]
+    assert matrix_multiply(A, B) == exact
+    assert matrix_multiply(A, B, use_numpy=True) == exact
+
+def test_small_integers_use_numpy_and_stay_ints():
+    A = random_matrix(32, 32, lambda: random.randrange(-100, 100))
+    product = matrix_multiply(A, A, use_numpy=True)
+    assert product == (np.asarray(A) @ np.asarray(A)).tolist()
+    assert all(isinstance(x, int) for row in product for x in row)
+
+def test_incompatible_shapes_raise():
+    with pytest.raises(ValueError):
+        matrix_multiply([[1, 2]], [[1, 2]])
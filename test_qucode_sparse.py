@@ -0,0 +1,38 @@
+# Tests for qucode_sparse (run with: python -m pytest -q)
+
+import numpy as np
+import pytest
+
+from qucode_sparse import CSRMatrix, csr_kron, read_matrix_market, write_matrix_market
+
+def test_matrix_market_round_trip_without_entries(tmp_path):
+    path = tmp_path / "empty.mtx"
+    write_matrix_market(path, CSRMatrix.from_dense(np.zeros((3, 4))))
+    matrix = read_matrix_market(path)
+    assert matrix.shape == (3, 4)
+    assert matrix.nnz == 0
+    assert np.array_equal(matrix.toarray(), np.zeros((3, 4)))
+
+def test_matrix_market_round_trip_keeps_integers(tmp_path):
+    dense = np.array([[0, 7, 0], [-3, 0, 2**40]], dtype=np.int64)
+    path = tmp_path / "integer.mtx"
+    write_matrix_market(path, CSRMatrix.from_dense(dense))
+    assert "coordinate integer general" in path.read_text()
+    matrix = read_matrix_market(path)
+    assert matrix.data.dtype == np.int64
+    assert np.array_equal(matrix.toarray(), dense)
+
+def test_matrix_market_round_trip_complex(tmp_path):
+    dense = np.array([[1 + 2j, 0], [0, -0.5j]])
+    path = tmp_path / "complex.mtx"
+    write_matrix_market(path, CSRMatrix.from_dense(dense))
+    assert np.array_equal(read_matrix_market(path).toarray(), dense)
+
+def test_kron_products_do_not_share_writable_structure():
+    A = CSRMatrix.from_dense(np.array([[1, 0], [2, 3]]))
+    B = CSRMatrix.from_dense(np.array([[0, 1], [1, 0]]))
+    first = csr_kron(A, B)
+    with pytest.raises(ValueError):
+        first.indices[0] = 1
+    first.data[0] = 100  # Values belong to the product alone
+    assert np.array_equal(csr_kron(A, B).toarray(), np.kron(A.toarray(), B.toarray()))
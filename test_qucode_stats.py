@@ -0,0 +1,44 @@
+# Tests for qucode_stats (run with: python -m pytest -q)
+
+import math
+
+import numpy as np
+import pytest
+
+from qucode_stats import QuantileSketch, bayes_posterior, sequential_bayes
+
+nan = float("nan")
+
+# Sketches without positive (or without negative) buckets, including the top-rank fallback
+@pytest.mark.parametrize("values, maximum", [([0, 0, 0], 0.0), ([-3, -2, -1], -1.0), ([-2, 0], 0.0),
+                                             ([1, 2, 3], 3.0), ([-4, nan], -4.0), ([0, nan], 0.0)])
+def test_quantile_sketch_edge_cases(values, maximum):
+    sketch = QuantileSketch().update(values)
+    assert math.isclose(sketch.quantile(1.0), maximum, rel_tol=0.011, abs_tol=1e-12)
+    assert sketch.quantile(0.0) <= sketch.quantile(0.5) <= sketch.quantile(1.0)
+
+def test_quantile_sketch_without_finite_values_is_nan():
+    assert math.isnan(QuantileSketch().update([nan, nan]).quantile(0.5))
+    assert math.isnan(QuantileSketch().quantile(0.5))
+
+def test_quantile_sketch_rejects_out_of_range_q():
+    with pytest.raises(ValueError):
+        QuantileSketch().update([1.0]).quantile(1.5)
+
+def test_sequential_bayes_matches_repeated_posteriors():
+    posterior = 0.01
+    for _ in range(3):
+        posterior = bayes_posterior(posterior, 0.9, 0.05)
+    assert np.isclose(sequential_bayes(0.01, 0.9, 0.05, [True, True, True]), posterior)
+
+def test_sequential_bayes_with_certain_tests():
+    # Perfect sensitivity: positives carry finite evidence, a single negative rules the disease out
+    twice = bayes_posterior(bayes_posterior(0.01, 1.0, 0.05), 1.0, 0.05)
+    assert np.isclose(sequential_bayes(0.01, 1.0, 0.05, [True, True]), twice)
+    assert sequential_bayes(0.01, 1.0, 0.05, [True, False]) == 0.0
+    # No false positives: a single positive confirms it, negatives alone do not
+    assert sequential_bayes(0.01, 0.9, 0.0, [False, True]) == 1.0
+    assert 0 < sequential_bayes(0.01, 0.9, 0.0, [False, False]) < 0.01
+    trajectory = sequential_bayes([0.01, 0.5], 1.0, 0.05, [True, False, True], trajectory=True)
+    assert not np.isnan(trajectory).any()
+    assert np.array_equal(trajectory[:, 1:], np.zeros((2, 2)))